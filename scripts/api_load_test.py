@@ -0,0 +1,97 @@
+"""Concurrent GET load test for `agent-geo api` on localhost.
+
+    agent-geo api --port 8765 &
+    python scripts/api_load_test.py --port 8765 --connections 32 --requests 5000
+
+Each connection keeps its socket open (HTTP/1.1 keep-alive) and cycles through the
+read endpoints. With ``--revalidate`` requests send the last seen ETag, exercising
+the 304 path. Prints throughput and latency percentiles as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+DEFAULT_PATHS = ["/panel", "/panel/scores", "/forecasts", "/ach", "/alerts", "/prompts", "/prompts/flash_brief"]
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, Dict[str, str]]:
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers.get("content-length", "0")))
+    return status, headers
+
+
+async def _worker(
+    host: str, port: int, paths: List[str], count: int, revalidate: bool, latencies: List[float], statuses: Dict[int, int]
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    etags: Dict[str, str] = {}
+    try:
+        for i in range(count):
+            path = paths[i % len(paths)]
+            extra = f"If-None-Match: {etags[path]}\r\n" if revalidate and path in etags else ""
+            started = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n{extra}\r\n".encode("latin-1"))
+            await writer.drain()
+            status, headers = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+            if "etag" in headers:
+                etags[path] = headers["etag"]
+    finally:
+        writer.close()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    per_connection = max(args.requests // args.connections, 1)
+    started = time.perf_counter()
+    await asyncio.gather(
+        *[
+            _worker(args.host, args.port, args.paths, per_connection, args.revalidate, latencies, statuses)
+            for _ in range(args.connections)
+        ]
+    )
+    elapsed = time.perf_counter() - started
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [latencies[0]] * 99
+    return {
+        "requests": len(latencies),
+        "connections": args.connections,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(quantiles[49] * 1000, 2),
+            "p95": round(quantiles[94] * 1000, 2),
+            "p99": round(quantiles[98] * 1000, 2),
+        },
+        "statuses": statuses,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--revalidate", action="store_true", help="Send If-None-Match with the last ETag")
+    parser.add_argument("--paths", nargs="*", default=DEFAULT_PATHS)
+    print(json.dumps(asyncio.run(run(parser.parse_args())), indent=2))
+
+
+if __name__ == "__main__":
+    main()
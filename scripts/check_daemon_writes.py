@@ -0,0 +1,170 @@
+"""Check that ``daemon.is_write`` marks every CLI command that changes a store.
+
+    python scripts/check_daemon_writes.py
+
+The daemon runs writes under its exclusive lock and everything else under the shared
+one, so a command that changes a file under ``data/`` without being listed in
+``_WRITE_COMMANDS`` can race readers and other writers. This script seeds a scratch
+``data/`` directory, runs each CLI command in-process against a fresh copy of it and
+compares the files before and after. Every subcommand the parser knows must appear in
+``CASES`` or ``SKIPPED``, so new commands cannot slip past the check. Exits non-zero
+and lists the commands on any miss.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from rich.console import Console
+
+from agent_geo.agent import GeoRiskAgent
+from agent_geo.bench import generators
+from agent_geo.cli import build_parser, console, dispatch
+from agent_geo.daemon import is_write
+
+Command = Tuple[str, str | None]
+
+CASES: Dict[Command, List[List[str]]] = {
+    ("init", None): [["init"]],
+    ("panel", "list"): [["panel", "list"]],
+    ("panel", "update"): [["panel", "update", "--key", "institution_article9", "--value", "2", "--color", "red"]],
+    ("panel", "export"): [["panel", "export", "export.csv"]],
+    ("panel", "import"): [["panel", "import", "changed.csv"]],
+    ("panel", "diff"): [["panel", "diff"]],
+    ("panel", "score"): [["panel", "score"], ["panel", "score", "--history"]],
+    ("ach", "show"): [["ach", "show"]],
+    ("ach", "questions"): [["ach", "questions"], ["ach", "questions", "--new", "Q2", "--hypothesis", "H1"]],
+    ("ach", "suggest"): [["ach", "suggest"], ["ach", "suggest", "--apply", "--min-score", "0"]],
+    ("ach", "recompute"): [["ach", "recompute", "--workers", "1"]],
+    ("forecast", "add"): [["forecast", "add", "--event", "e3", "--due-date", "2025-06-01", "--probability", "0.4"]],
+    ("forecast", "close"): [["forecast", "close", "--event", "e1", "--outcome", "1"]],
+    ("forecast", "list"): [["forecast", "list"]],
+    ("forecast", "overdue"): [["forecast", "overdue"]],
+    ("forecast", "scores"): [["forecast", "scores"]],
+    ("forecast", "pool-ingest"): [["forecast", "pool-ingest", "pool.json", "--forecaster", "bob", "--publish"]],
+    ("forecast", "leaderboard"): [["forecast", "leaderboard"]],
+    ("alert", "set"): [["alert", "set", "--key", "trilateral_packaging", "--active"]],
+    ("alert", "status"): [["alert", "status"]],
+    ("alert", "timeline"): [["alert", "timeline"]],
+    ("alert", "stream"): [["alert", "stream", "stream.jsonl"]],
+    ("alert", "latency"): [["alert", "latency"]],
+    ("tag", None): [["tag"], ["tag", "--output", "tagged.jsonl"]],
+    ("evidence", "rehash"): [["evidence", "rehash", "--workers", "1"], ["evidence", "rehash", "--dedupe", "--workers", "1"]],
+    ("evidence", "clusters"): [["evidence", "clusters"]],
+    ("ooda", "status"): [["ooda", "status"]],
+    ("prompts", "list"): [["prompts", "list"]],
+    ("prompts", "show"): [["prompts", "show", "--key", "flash_brief"]],
+    ("sources", "list"): [["sources", "list"]],
+    ("sources", "lookup"): [["sources", "lookup", "https://www.mofa.go.jp/fp/nsp/page1we_000081.html"]],
+    ("sources", "audit"): [["sources", "audit"]],
+}
+SKIPPED: Dict[Command, str] = {
+    ("serve", None): "not run through the daemon",
+    ("api", None): "not run through the daemon",
+    ("bench", None): "not run through the daemon; writes only a scratch directory",
+    ("search", None): "needs the network; reads only",
+    ("ach", "add"): "needs the network; listed as a write",
+    ("ooda", "run"): "needs the network; listed as a write",
+}
+
+
+def commands(parser: argparse.ArgumentParser) -> Iterator[Command]:
+    for action in parser._subparsers._group_actions:
+        for name, command in action.choices.items():
+            nested = command._subparsers
+            if nested is None:
+                yield name, None
+                continue
+            for sub_action in nested._group_actions:
+                for sub_name in sub_action.choices:
+                    yield name, sub_name
+
+
+def fingerprint(root: Path) -> Dict[str, str]:
+    # ``.sha256`` checksum sidecars are refreshed by any load that had to validate; a
+    # stale or missing one only costs the next load its trusted path, so reads may write them.
+    return {
+        str(path.relative_to(root)): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and path.suffix != ".sha256"
+    }
+
+
+def run(parser: argparse.ArgumentParser, argv: List[str]) -> argparse.Namespace:
+    args = parser.parse_args(argv)
+    with console.redirect(Console(file=io.StringIO(), width=100)):
+        dispatch(GeoRiskAgent(), args)
+    return args
+
+
+def seed(parser: argparse.ArgumentParser) -> None:
+    evidence = list(generators.evidence_dicts(40, signal_rate=0.3))
+    # A syndicated copy behind a tracking link with a pre-canonical hash, so rehash rewrites the log.
+    evidence.append({**evidence[0], "url": evidence[0]["url"] + "?utm_source=feed", "hash": "0" * 64})
+    generators.write_jsonl(Path("data/evidence_log.jsonl"), evidence)
+    generators.write_jsonl(Path("stream.jsonl"), generators.evidence_dicts(10, seed=1, signal_rate=0.5))
+    Path("pool.json").write_text(
+        json.dumps({"events": [{"event": "e1", "p": 0.7, "deadline": "2025-01-01"}, {"event": "e9", "p": 0.2}]}),
+        encoding="utf-8",
+    )
+    for argv in (
+        ["panel", "update", "--key", "institution_article9", "--value", "1", "--color", "yellow"],
+        ["forecast", "add", "--event", "e1", "--due-date", "2025-01-01", "--probability", "0.7", "--tag", "x"],
+        ["forecast", "add", "--event", "e2", "--due-date", "2025-02-01", "--probability", "0.2"],
+        ["forecast", "close", "--event", "e2", "--outcome", "0"],
+        ["forecast", "pool-ingest", "pool.json", "--forecaster", "alice"],
+        ["alert", "set", "--key", "joint_command_upgrade", "--active"],
+        ["panel", "export", "changed.csv"],
+    ):
+        run(parser, argv)
+    changed = Path("changed.csv")
+    changed.write_text(changed.read_text(encoding="utf-8").replace(",1,", ",3,", 1), encoding="utf-8")
+
+
+def main() -> int:
+    parser = build_parser()
+    known = set(commands(parser))
+    unlisted = sorted(known - set(CASES) - set(SKIPPED), key=str)
+    misses: List[dict] = []
+    checked = 0
+    start = Path.cwd()
+    scratch = Path(tempfile.mkdtemp(prefix="agent-geo-writes-"))
+    try:
+        base = scratch / "seed"
+        base.mkdir()
+        os.chdir(base)
+        seed(parser)
+        for command, variants in CASES.items():
+            for argv in variants:
+                workdir = scratch / f"case-{checked}"
+                shutil.copytree(base, workdir)
+                os.chdir(workdir)
+                GeoRiskAgent()  # any files the agent creates on start-up are not the command's writes
+                before = fingerprint(workdir / "data")
+                args = run(parser, argv)
+                changed = sorted(
+                    name for name, digest in fingerprint(workdir / "data").items() if before.get(name) != digest
+                )
+                checked += 1
+                if changed and not is_write(args):
+                    misses.append({"command": " ".join(argv), "changed": changed})
+    finally:
+        os.chdir(start)
+        shutil.rmtree(scratch, ignore_errors=True)
+    print(json.dumps({"checked": checked, "misses": len(misses), "unlisted": [" ".join(filter(None, c)) for c in unlisted]}))
+    for miss in misses:
+        print(json.dumps(miss), file=sys.stderr)
+    return 1 if misses or unlisted else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+"""Check that re-adding a forecast without tags keeps its tags and score buckets.
+
+    python scripts/check_forecast_upsert.py
+
+``forecast add`` on an existing event upserts it. Fields the caller leaves unset
+(``--tag``, ``--rationale``) must keep their stored values; otherwise the event's Brier
+score moves out of its tag bucket in ``ScoreAggregates``. The script upserts an open and a
+resolved event without tags in a scratch ledger and compares the tags, the rationale and
+the per-tag aggregates (in memory and after a reload) with what they were before. Exits
+non-zero and lists the differences on any failure.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import List
+
+from agent_geo.models.forecast import ForecastEvent
+from agent_geo.pipelines.forecast_tracker import ForecastTracker
+from agent_geo.storage import ForecastStore
+
+
+def main() -> int:
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory(prefix="agent-geo-upsert-") as scratch:
+        store = ForecastStore(Path(scratch) / "forecast_ledger.json")
+        tracker = ForecastTracker(store)
+        for name, tags in (("open", ["taiwan"]), ("closed", ["korea", "alliance"])):
+            tracker.add_event(
+                ForecastEvent(event=name, due_date=date(2025, 1, 1), probability=0.7, rationale="base", tags=tags)
+            )
+        tracker.finalize("closed", 1)
+        before = tracker.scores.to_dict()
+
+        tracker.add_event(ForecastEvent(event="open", due_date=date(2025, 1, 1), probability=0.4))
+        tracker.add_event(tracker.get("closed").model_copy(update={"tags": [], "rationale": None}))
+        for name, tags in (("open", ["taiwan"]), ("closed", ["korea", "alliance"])):
+            event = tracker.get(name)
+            if event.tags != tags or event.rationale != "base":
+                failures.append(f"{name}: tags {event.tags}, rationale {event.rationale!r}")
+        for label, scores in (("memory", tracker.scores), ("reload", ForecastTracker(store).scores)):
+            if scores.to_dict()["by_tag"] != before["by_tag"]:
+                failures.append(f"{label}: by_tag {scores.to_dict()['by_tag']} != {before['by_tag']}")
+
+        tracker.finalize("open", 0)
+        if "taiwan" not in tracker.scores.by_tag:
+            failures.append(f"open: scored outside its tag, by_tag {sorted(tracker.scores.by_tag)}")
+    print(json.dumps({"failures": len(failures)}))
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""Check that the keyword tagger fires every signal the plain substring rules fired.
+
+    python scripts/check_signal_rules.py [data/evidence_log.jsonl ...]
+
+The original streaming rules matched each ``rule_terms`` group as a casefolded
+substring. ``KeywordTagger`` adds a word boundary at the start of ASCII terms, which may
+only ever drop matches, so this script looks for texts where a substring rule fires and
+the tagger does not. The built-in corpus puts every term of every group next to the first
+term of the other groups, bare and inflected ("Russian", "North Korean", "counter-strikes"),
+in lower, title and upper case and after punctuation; evidence logs given on the command line
+are checked line by line as well. Exits non-zero and lists the texts on any miss.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+from agent_geo.config import ENTRAPMENT_SIGNALS, EntrapmentSignalDefinition
+from agent_geo.pipelines.keyword_tagger import KeywordTagger
+
+SUFFIXES = ("", "n", "s", "'s", "ese", "ian")
+EXAMPLES = [
+    "Trilateral statement condemns Russian and North Korean military cooperation",
+    "日米韓の共同声明、ロシアと北朝鮮の軍事協力を非難",
+]
+
+
+def substring_signals(definitions: Iterable[EntrapmentSignalDefinition], text: str) -> List[str]:
+    folded = text.casefold()
+    return [
+        definition.key
+        for definition in definitions
+        if any(definition.rule_terms)
+        and all(any(term.casefold() in folded for term in group) for group in definition.rule_terms if group)
+    ]
+
+
+def term_corpus(definitions: Iterable[EntrapmentSignalDefinition]) -> Iterator[str]:
+    for definition in definitions:
+        groups = [group for group in definition.rule_terms if group]
+        for position, group in enumerate(groups):
+            others = [other[0] for index, other in enumerate(groups) if index != position]
+            for term in group:
+                for suffix in SUFFIXES if term.isascii() else ("",):
+                    word = term + suffix
+                    for variant in {word, word.title(), word.upper()}:
+                        yield " ".join(["(" + variant + ")", *others])
+                        yield f"Report: {variant}, {'; '.join(others)}."
+
+
+def evidence_corpus(paths: Iterable[Path]) -> Iterator[str]:
+    for path in paths:
+        with path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    payload = json.loads(line)
+                    yield f"{payload.get('title', '')}\n{payload.get('quote', '')}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("evidence", nargs="*", type=Path, help="Evidence JSONL files to check as well")
+    args = parser.parse_args()
+
+    definitions = [definition for definition in ENTRAPMENT_SIGNALS if definition.rule_terms]
+    tagger = KeywordTagger(definitions, templates=())
+    checked = 0
+    misses = []
+    for text in [*EXAMPLES, *term_corpus(definitions), *evidence_corpus(args.evidence)]:
+        checked += 1
+        expected = set(substring_signals(definitions, text))
+        missing = expected - set(tagger.tag_text(text).signals)
+        if missing:
+            misses.append({"text": text, "missing": sorted(missing)})
+    print(json.dumps({"checked": checked, "misses": len(misses)}))
+    for miss in misses[:50]:
+        print(json.dumps(miss, ensure_ascii=False), file=sys.stderr)
+    return 1 if misses else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
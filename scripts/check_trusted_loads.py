@@ -0,0 +1,69 @@
+"""Check that checksum sidecars never vouch for data that failed validation.
+
+    python scripts/check_trusted_loads.py
+
+Stores trust the bytes their ``.sha256`` sidecar covers and build them without
+validation, so the sidecar may only grow over lines a load has validated, and only if
+validation left them as stored. The script appends a line the model rejects to a scratch
+evidence log and loads it twice through ``load`` and ``load_table``: every load must
+raise, and the sidecar must not cover the line afterwards. It then writes a legacy line
+without a ``hash`` and checks that repeated loads keep returning the content hash that
+validation fills in. Exits non-zero and lists the failures on any miss.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, List
+
+from pydantic import ValidationError
+
+from agent_geo.models.evidence import EvidenceRecord
+from agent_geo.pipelines.ach_matrix import evidence_key
+from agent_geo.storage import EvidenceStore
+
+
+def _expect_invalid(label: str, load: Callable[[], object], failures: List[str]) -> None:
+    try:
+        load()
+    except ValidationError:
+        return
+    failures.append(f"{label}: corrupt line loaded without a ValidationError")
+
+
+def main() -> int:
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory(prefix="agent-geo-trusted-") as scratch:
+        for method in ("load", "load_table"):
+            store = EvidenceStore(Path(scratch) / f"{method}.jsonl")
+            store.append(EvidenceRecord(title="t", source="s", quote="q", url="https://example.com/a"))
+            store.load()
+            with store.path.open("ab") as fh:
+                fh.write(b'{"title": 123, "quote": "q", "url": "https://example.com/b"}\n')
+            for attempt in ("first", "second"):
+                _expect_invalid(f"{method} {attempt}", getattr(store, method), failures)
+            covered = store.checksum.segments()[-1][0] if store.checksum.segments() else 0
+            if covered >= store.path.stat().st_size:
+                failures.append(f"{method}: sidecar covers the corrupt line ({covered} bytes)")
+
+        record = EvidenceRecord(title="t", source="s", quote="q", url="https://example.com/a")
+        legacy = EvidenceStore(Path(scratch) / "legacy.jsonl")
+        legacy.path.write_text(record.model_dump_json(exclude={"hash"}) + "\n", encoding="utf-8")
+        for attempt in ("first", "second"):
+            keys = [evidence_key(item) for item in legacy.load()]
+            if keys != [record.hash]:
+                failures.append(f"legacy load {attempt}: keys {keys} != {[record.hash]}")
+            table = legacy.load_table()
+            if table.find(record.hash) is None:
+                failures.append(f"legacy load_table {attempt}: record not found by its hash")
+    print(json.dumps({"failures": len(failures)}))
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,6 +2,8 @@
 
 from .agent import GeoRiskAgent
 from .config import (
+    ACH_HYPOTHESES,
+    ACH_QUESTION,
     INDICATOR_TEMPLATES,
     ENTRAPMENT_SIGNALS,
     IndicatorDimension,
@@ -9,7 +11,7 @@ from .config import (
     EntrapmentSignalDefinition,
 )
 from .pipelines import IndicatorPanelBuilder, ACHManager, ForecastTracker, AlertMonitor
-from .datasources import DataSource, list_sources, load_sources, missing_prompt_sources
+from .datasources import DataSource, SourceRegistry, list_sources, load_sources, missing_prompt_sources
 from .prompts import (
     GLOBAL_SYSTEM_PROMPT,
     PROMPT_TEMPLATES,
@@ -26,12 +28,15 @@ __all__ = [
     "ForecastTracker",
     "AlertMonitor",
     "WebSearchTool",
+    "ACH_HYPOTHESES",
+    "ACH_QUESTION",
     "INDICATOR_TEMPLATES",
     "ENTRAPMENT_SIGNALS",
     "IndicatorDimension",
     "IndicatorTemplate",
     "EntrapmentSignalDefinition",
     "DataSource",
+    "SourceRegistry",
     "list_sources",
     "load_sources",
     "missing_prompt_sources",
@@ -1,24 +1,43 @@
 from __future__ import annotations
 
+from datetime import date, datetime
+from pathlib import Path
 from typing import Iterable, Optional
 
 from agent_geo.models.ach import ACHTable
 from agent_geo.models.evidence import EvidenceRecord
 from agent_geo.models.forecast import ForecastEvent
 from agent_geo.models.indicator import IndicatorRecord, IndicatorStatus
-from agent_geo.pipelines import ACHManager, AlertMonitor, ForecastTracker, IndicatorPanelBuilder
+from agent_geo.pipelines import (
+    ACHManager,
+    AlertMonitor,
+    ForecastPool,
+    ForecastTracker,
+    IndicatorPanelBuilder,
+    KeywordTagger,
+    LatencyRecorder,
+    OODAScheduler,
+    PanelChangeSet,
+    StreamingAlertEvaluator,
+)
+from agent_geo.pipelines.ach_classifier import ACHEvidenceClassifier, ACHSuggestion
+from agent_geo.pipelines.alert_rules import StreamResult
+from agent_geo.pipelines.ooda import RunReport, weekly_cycle
 from agent_geo.prompts import (
     GLOBAL_SYSTEM_PROMPT,
     PromptTemplate,
     get_prompt_template,
     list_prompt_templates,
 )
+from agent_geo.profiling import profiled
+from agent_geo.storage import BriefStore
 from agent_geo.tools import WebSearchTool
 
 
 class GeoRiskAgent:
     """High-level façade tying together the indicator panel, ACH, forecast ledger, and alerts."""
 
+    @profiled("agent.init")
     def __init__(
         self,
         *,
@@ -27,14 +46,23 @@ class GeoRiskAgent:
         forecasts: ForecastTracker | None = None,
         alerts: AlertMonitor | None = None,
         websearch: WebSearchTool | None = None,
+        pool: ForecastPool | None = None,
+        briefs: BriefStore | None = None,
+        latency: LatencyRecorder | None = None,
     ) -> None:
         self.panel = panel or IndicatorPanelBuilder()
         self.ach = ach or ACHManager()
         self.forecasts = forecasts or ForecastTracker()
         self.alerts = alerts or AlertMonitor()
         self.websearch = websearch or WebSearchTool()
+        self.pool = pool or ForecastPool()
+        self.briefs = briefs or BriefStore()
+        self.latency = latency or LatencyRecorder()
+        self._alert_rules: StreamingAlertEvaluator | None = None
+        self._tagger: KeywordTagger | None = None
         self.prompt_templates = list_prompt_templates()
 
+    @profiled("agent.collect_indicator_from_web")
     def collect_indicator_from_web(
         self,
         *,
@@ -59,45 +87,183 @@ class GeoRiskAgent:
             evidence=evidence,
         )
 
-    def add_supporting_evidence(self, hypothesis: str, query: str, *, supports: bool) -> EvidenceRecord | None:
+    @profiled("agent.add_supporting_evidence")
+    def add_supporting_evidence(
+        self,
+        hypothesis: str,
+        query: str,
+        *,
+        supports: bool,
+        question: str | None = None,
+    ) -> EvidenceRecord | None:
         evidence_list = self.websearch.search_as_evidence(query)
         if not evidence_list:
             return None
         evidence = evidence_list[0]
         if supports:
-            self.ach.add_support(hypothesis, evidence)
+            self.ach.add_support(hypothesis, evidence, question=question)
         else:
-            self.ach.add_refute(hypothesis, evidence)
+            self.ach.add_refute(hypothesis, evidence, question=question)
         return evidence
 
+    @profiled("agent.suggest_ach")
+    def suggest_ach(
+        self,
+        evidence: list[EvidenceRecord] | None = None,
+        *,
+        question: str | None = None,
+        min_score: float = 0.0,
+    ) -> list[ACHSuggestion]:
+        """Propose hypothesis/direction for evidence not yet in the ACH table (default: the evidence log).
+
+        Items the table already holds under any hypothesis are skipped, so applying the
+        suggestions never retracts or flips an analyst-recorded cell.
+        """
+
+        table = self.get_ach_table(question)
+        evidence = [
+            record
+            for record in (self.panel.evidence_store.load() if evidence is None else evidence)
+            if not any(self.ach.contains(entry.hypothesis, record, question=question) for entry in table.entries)
+        ]
+        classifier = ACHEvidenceClassifier.from_table(table).fit(evidence)
+        return classifier.suggest(evidence, min_score=min_score)
+
+    @profiled("agent.upsert_forecast")
     def upsert_forecast(self, event: ForecastEvent) -> None:
         self.forecasts.add_event(event)
 
+    @profiled("agent.finalize_forecast")
     def finalize_forecast(self, event_name: str, outcome: int) -> None:
         self.forecasts.finalize(event_name, outcome)
+        if event_name in self.pool.questions:
+            self.pool.resolve(event_name, outcome)
+
+    @profiled("agent.publish_pool_consensus")
+    def publish_pool_consensus(self, method: str = "mean") -> list[ForecastEvent]:
+        """Push the pool's consensus for every open question into the forecast ledger."""
+
+        events = [
+            event
+            for event in self.pool.to_events(method)
+            if event.event not in self.forecasts or self.forecasts.get(event.event).outcome is None
+        ]
+        for event in events:
+            self.forecasts.add_event(event)
+        return events
 
+    @profiled("agent.set_alert_state")
     def set_alert_state(self, key: str, active: bool, notes: Optional[str] = None) -> None:
         self.alerts.update(key, active=active, evidence=None, notes=notes)
 
+    @profiled("agent.tag_evidence")
+    def tag_evidence(self, evidence: Iterable[EvidenceRecord]) -> list[EvidenceRecord]:
+        """Set ``tags`` on each record to every matching signal and indicator key."""
+
+        if self._tagger is None:
+            self._tagger = KeywordTagger()
+        records = list(evidence)
+        self._tagger.tag_many(records, apply=True)
+        return records
+
+    @profiled("agent.stream_alert_evidence")
+    def stream_alert_evidence(self, evidence: Iterable[EvidenceRecord]) -> StreamResult:
+        """Run evidence through the signal rules; a fresh red line renders the flash brief."""
+
+        if self._alert_rules is None:
+            self._alert_rules = StreamingAlertEvaluator(self.alerts, on_red=self.flash_brief, latency=self.latency)
+        return self._alert_rules.consume_many(evidence)
+
+    @profiled("agent.flash_brief")
+    def flash_brief(self, evidence: list[EvidenceRecord]) -> dict:
+        """Render the ``flash_brief`` prompt bundle for the triggering evidence and record it."""
+
+        urls = list(dict.fromkeys(str(item.url) for item in evidence))
+        bundle = self.prompt_messages("flash_brief", source_urls=urls or None)
+        bundle["red_since"] = self.alerts.red_since.isoformat() if self.alerts.red_since else None
+        bundle["rendered_at"] = datetime.utcnow().isoformat()
+        self.briefs.append(bundle)
+        return bundle
+
+    def store_paths(self) -> list[Path]:
+        """Files behind the state this agent loads at start-up."""
+
+        return [
+            self.panel.panel_store.path,
+            self.panel.evidence_store.path,
+            self.panel.history_store.path,
+            self.ach.store.path,
+            self.ach.log_store.path,
+            self.forecasts.store.path,
+            self.alerts.store.path,
+            self.alerts.store.snapshot_path,
+            self.pool.store.path,
+            self.latency.store.path,
+            self.briefs.path,
+        ]
+
+    def state_stamp(self) -> tuple:
+        """``(mtime_ns, size)`` per store file (``None`` if missing); changes when any process writes."""
+
+        stamp = []
+        for path in self.store_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                stamp.append(None)
+            else:
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(stamp)
+
     def red_alert(self) -> bool:
         return self.alerts.is_red()
 
+    @profiled("agent.export_panel_csv")
     def export_panel_csv(self, path: str) -> str:
         destination = self.panel.export_csv(path)
         return str(destination)
 
-    def get_ach_table(self) -> ACHTable:
-        return self.ach.table
+    def get_ach_table(self, question: str | None = None) -> ACHTable:
+        if question is None:
+            return self.ach.table
+        return self.ach.tables[question]
 
     def panel_rows(self) -> list[dict]:
         return self.panel.to_rows()
 
-    def forecast_rows(self) -> list[dict]:
+    @profiled("agent.panel_scores")
+    def panel_scores(self) -> dict:
+        return self.panel.scores()
+
+    @profiled("agent.panel_diff")
+    def panel_diff(self, since: datetime | None = None, until: datetime | None = None) -> PanelChangeSet:
+        if since is None:
+            return self.panel.weekly_diff(until)
+        return self.panel.diff(since, until)
+
+    @profiled("agent.forecast_rows")
+    def forecast_rows(self, as_of: datetime | date | None = None) -> list[dict]:
+        if as_of is not None:
+            return self.forecasts.as_of(as_of)
         return self.forecasts.to_rows()
 
+    @profiled("agent.run_ooda")
+    def run_ooda(
+        self,
+        run_id: str | None = None,
+        *,
+        queries: dict[str, str] | None = None,
+        workers: int = 4,
+    ) -> RunReport:
+        """Run (or resume) one weekly OODA cycle as a checkpointed stage graph."""
+
+        scheduler = OODAScheduler(weekly_cycle(self, queries=queries), workers=workers)
+        return scheduler.run(run_id)
+
     def prompts(self) -> list[PromptTemplate]:
         return self.prompt_templates
 
+    @profiled("agent.prompt_messages")
     def prompt_messages(self, key: str, source_urls: list[str] | None = None) -> dict:
         template = get_prompt_template(key)
         user_prompt = template.render_user_prompt(source_urls)
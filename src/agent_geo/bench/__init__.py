@@ -0,0 +1,5 @@
+"""Synthetic-data benchmarks for the stores and pipelines (``agent-geo bench``)."""
+
+from agent_geo.bench.suite import DEFAULT_SCALES, SUBSYSTEMS, BenchResult, BenchSuite, compare, environment, measure
+
+__all__ = ["BenchSuite", "BenchResult", "SUBSYSTEMS", "DEFAULT_SCALES", "measure", "environment", "compare"]
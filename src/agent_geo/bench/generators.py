@@ -0,0 +1,191 @@
+"""Deterministic synthetic data at benchmark scale.
+
+Generators yield plain JSON-ready dicts in the exact layout the stores write, so files
+with millions of records can be produced without building a model per record.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta
+from hashlib import sha256
+from pathlib import Path
+from typing import Iterator, List
+
+from agent_geo.config import ACH_HYPOTHESES, ACH_QUESTION, INDICATOR_TEMPLATES, IndicatorDimension
+
+_EPOCH = datetime(2024, 1, 1)
+_SOURCES = ["MOFA", "MOD", "Cabinet Secretariat", "Reuters", "Nikkei", "JPX", "GPIF", "Kyodo"]
+_PHRASES = [
+    "存立危機事態の認定要件を説明",
+    "统合作战司令部 与 驻日美军 协调",
+    "trilateral statement on Russia Far East and DPRK",
+    "反撃能力の運用方針",
+    "TSE cost-of-capital disclosure progress",
+    "GPIF stewardship report",
+    "counter-strike framed as deterrence",
+]
+# Titles that satisfy each entrapment signal's ``rule_terms`` in config.py.
+_SIGNAL_PHRASES = [
+    "日米韓 statement names Russia and North Korea",
+    "USFJ and JSDF move to joint command and control",
+    "counter-strike reframed as pre-emptive deterrence",
+]
+_QUALITIES = ["H", "M", "M", "L", "L", "L"]
+_COLORS = ["green", "yellow", "yellow", "red"]
+
+
+def evidence_dicts(n: int, seed: int = 0, *, signal_rate: float = 0.0) -> Iterator[dict]:
+    """``n`` evidence records; about ``signal_rate`` of the titles match an entrapment signal."""
+
+    rng = random.Random(seed)
+    signals = random.Random(seed + 1)
+    for i in range(n):
+        title = f"{rng.choice(_PHRASES)} #{i}"
+        if signal_rate and signals.random() < signal_rate:
+            title = f"{signals.choice(_SIGNAL_PHRASES)} / {title}"
+        source = rng.choice(_SOURCES)
+        quote = f"{rng.choice(_PHRASES)} / {rng.choice(_PHRASES)}"
+        url = f"https://example.org/{source.lower().replace(' ', '-')}/{i}"
+        yield {
+            "title": title,
+            "date": (_EPOCH + timedelta(minutes=i)).isoformat(),
+            "source": source,
+            "quote": quote,
+            "url": url,
+            "quality": rng.choice(_QUALITIES),
+            "created_at": (_EPOCH + timedelta(minutes=i, seconds=rng.randint(60, 86_400))).isoformat(),
+            "hash": sha256(f"{title}|{source}|{quote}|{url}".encode("utf-8")).hexdigest(),
+            "tags": [],
+        }
+
+
+def indicator_dicts(n: int, seed: int = 0) -> Iterator[dict]:
+    """``n`` panel records; beyond the real templates, synthetic keys cycle the dimensions."""
+
+    rng = random.Random(seed)
+    dimensions = list(IndicatorDimension)
+    for i in range(n):
+        template = INDICATOR_TEMPLATES[i] if i < len(INDICATOR_TEMPLATES) else None
+        yield {
+            "template_key": template.key if template else f"synthetic_{i}",
+            "dimension": (template.dimension if template else dimensions[i % len(dimensions)]).value,
+            "indicator": template.indicator if template else f"Synthetic indicator {i}",
+            "latest_value": f"value {rng.randint(0, 1000)}",
+            "direction": rng.choice(["up", "down", "stable", None]),
+            "date": (_EPOCH + timedelta(hours=i)).isoformat(),
+            "source_url": f"https://example.org/panel/{i}",
+            "confidence": rng.choice(["L", "M", "H"]),
+            "weight": rng.randint(1, 5),
+            "color": rng.choice(_COLORS),
+            "analyst_note": None,
+        }
+
+
+def history_dicts(n: int, seed: int = 0) -> Iterator[dict]:
+    """``n`` panel updates spread over the real indicator templates, one per hour."""
+
+    rng = random.Random(seed)
+    templates = INDICATOR_TEMPLATES
+    for i in range(n):
+        template = templates[rng.randrange(len(templates))]
+        record = {
+            "template_key": template.key,
+            "dimension": template.dimension.value,
+            "indicator": template.indicator,
+            "latest_value": f"value {i}",
+            "direction": rng.choice(["up", "down", "stable"]),
+            "date": (_EPOCH + timedelta(hours=i)).isoformat(),
+            "source_url": None,
+            "confidence": "M",
+            "weight": rng.randint(1, 5),
+            "color": rng.choice(_COLORS),
+            "analyst_note": None,
+        }
+        yield {"recorded_at": record["date"], "record": record, "evidence": None}
+
+
+def forecast_dicts(n: int, seed: int = 0, *, revisions: int = 3, resolved_share: float = 0.5) -> Iterator[dict]:
+    rng = random.Random(seed)
+    for i in range(n):
+        issued = _EPOCH + timedelta(hours=i)
+        history = sorted(
+            ((issued + timedelta(days=k * 7)).isoformat(), round(rng.random(), 3)) for k in range(revisions)
+        )
+        resolved = rng.random() < resolved_share
+        due = (issued + timedelta(days=rng.randint(30, 365))).date()
+        probability = history[-1][1] if history else round(rng.random(), 3)
+        outcome = rng.randint(0, 1) if resolved else None
+        yield {
+            "event": f"event-{i}",
+            "due_date": due.isoformat(),
+            "probability": probability,
+            "outcome": outcome,
+            "brier": (probability - outcome) ** 2 if resolved else None,
+            "rationale": "synthetic",
+            "postmortem_link": None,
+            "tags": [f"tag-{i % 7}"],
+            "revisions": [list(item) for item in history],
+            "resolved_at": datetime.combine(due, datetime.min.time()).isoformat() if resolved else None,
+        }
+
+
+def ach_table_dict(n: int, seed: int = 0, hypotheses: List[str] | None = None) -> dict:
+    """One ACH table with ``n`` evidence items split across hypotheses and directions."""
+
+    rng = random.Random(seed)
+    hypotheses = hypotheses or list(ACH_HYPOTHESES)
+    entries = {h: {"hypothesis": h, "supports": [], "refutes": []} for h in hypotheses}
+    for evidence in evidence_dicts(n, seed):
+        entry = entries[rng.choice(hypotheses)]
+        entry["supports" if rng.random() < 0.6 else "refutes"].append(evidence)
+    for entry in entries.values():
+        entry["net_assessment"] = len(entry["supports"]) - len(entry["refutes"])
+    return {"question": ACH_QUESTION, "entries": list(entries.values())}
+
+
+def ach_log_dicts(n: int, seed: int = 0, hypotheses: List[str] | None = None) -> Iterator[dict]:
+    """The observations behind ``ach_table_dict(n, seed)``, about four copies per story."""
+
+    rng = random.Random(seed)
+    story_rng = random.Random(seed + 1)  # separate stream keeps the draws in step with the table
+    hypotheses = hypotheses or list(ACH_HYPOTHESES)
+    for i, evidence in enumerate(evidence_dicts(n, seed)):
+        yield {
+            "question": ACH_QUESTION,
+            "hypothesis": rng.choice(hypotheses),
+            "kind": "support" if rng.random() < 0.6 else "refute",
+            "evidence": evidence,
+            "recorded_at": (_EPOCH + timedelta(minutes=i)).isoformat(),
+            "retracted": False,
+            "story": f"story-{story_rng.randrange(max(n // 4, 1))}",
+        }
+
+
+def write_jsonl(path: Path, rows: Iterator[dict]) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with path.open("w", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(row, ensure_ascii=False))
+            fh.write("\n")
+            count += 1
+    return count
+
+
+def write_json(path: Path, payload: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+
+__all__ = [
+    "evidence_dicts",
+    "indicator_dicts",
+    "history_dicts",
+    "forecast_dicts",
+    "ach_table_dict",
+    "ach_log_dicts",
+    "write_jsonl",
+    "write_json",
+]
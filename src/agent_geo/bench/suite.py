@@ -0,0 +1,304 @@
+"""Timed load/save/query/score runs over synthetic stores.
+
+Each benchmark writes its fixture into a scratch directory, then times one operation
+``repeat`` times and keeps the best wall-clock run (optionally with the tracemalloc
+peak of the first run). Results serialise to JSON with enough metadata (commit, Python
+and numpy versions) to compare two checkouts side by side.
+"""
+
+from __future__ import annotations
+
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from agent_geo.bench import generators
+from agent_geo.config import INDICATOR_TEMPLATES
+from agent_geo.models.evidence import EvidenceRecord
+from agent_geo.pipelines.ach_runner import ACHManager
+from agent_geo.pipelines.alert_monitor import AlertMonitor
+from agent_geo.pipelines.alert_rules import StreamingAlertEvaluator
+from agent_geo.pipelines.forecast_tracker import ForecastTracker
+from agent_geo.pipelines.panel_scoring import PanelScorer, score_history
+from agent_geo.storage import (
+    ACHLogStore,
+    ACHStore,
+    AlertStore,
+    EvidenceStore,
+    ForecastStore,
+    PanelHistoryStore,
+    PanelStore,
+)
+
+SUBSYSTEMS = ("evidence", "panel", "forecast", "ach", "alerts")
+_SIGNAL_RATE = 0.05
+DEFAULT_SCALES = (1_000, 10_000)
+_QUERY_SAMPLE = 1_000
+
+
+@dataclass(slots=True)
+class BenchResult:
+    subsystem: str
+    operation: str
+    n: int
+    seconds: float
+    peak_mb: float | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "subsystem": self.subsystem,
+            "operation": self.operation,
+            "n": self.n,
+            "seconds": round(self.seconds, 6),
+            "per_record_us": round(self.seconds / max(self.n, 1) * 1e6, 3),
+            "peak_mb": None if self.peak_mb is None else round(self.peak_mb, 2),
+        }
+
+
+def measure(
+    fn: Callable[[Any], Any],
+    setup: Callable[[], Any] | None = None,
+    *,
+    repeat: int = 3,
+    memory: bool = False,
+) -> tuple[float, float | None]:
+    """Best-of-``repeat`` seconds for ``fn(setup())``; ``setup`` runs untimed before each call."""
+
+    best = float("inf")
+    peak_mb: float | None = None
+    for attempt in range(max(repeat, 1)):
+        state = setup() if setup else None
+        trace = memory and attempt == 0
+        if trace:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            fn(state)
+        finally:
+            elapsed = time.perf_counter() - started
+            if trace:
+                peak_mb = tracemalloc.get_traced_memory()[1] / (1 << 20)
+                tracemalloc.stop()
+        # Timings taken under tracemalloc are inflated, so they only count if nothing else ran.
+        if not trace or repeat <= 1:
+            best = min(best, elapsed)
+    return best, peak_mb
+
+
+class BenchSuite:
+    def __init__(
+        self,
+        scales: Sequence[int] = DEFAULT_SCALES,
+        *,
+        repeat: int = 3,
+        memory: bool = False,
+        seed: int = 0,
+        root: Path | str | None = None,
+    ) -> None:
+        self.scales = list(scales)
+        self.repeat = repeat
+        self.memory = memory
+        self.seed = seed
+        self.root = Path(root) if root else None
+
+    def _time(
+        self, subsystem: str, operation: str, n: int, fn: Callable[[Any], Any], setup: Callable[[], Any] | None = None
+    ) -> BenchResult:
+        seconds, peak = measure(fn, setup, repeat=self.repeat, memory=self.memory)
+        return BenchResult(subsystem, operation, n, seconds, peak)
+
+    def run(
+        self, only: Sequence[str] | None = None, progress: Callable[[BenchResult], None] | None = None
+    ) -> dict:
+        selected = [name for name in SUBSYSTEMS if not only or name in only]
+        unknown = sorted(set(only or ()) - set(SUBSYSTEMS))
+        if unknown:
+            raise ValueError(f"Unknown subsystem(s): {', '.join(unknown)}; choose from {', '.join(SUBSYSTEMS)}")
+        results: List[BenchResult] = []
+        scratch = Path(tempfile.mkdtemp(prefix="agent-geo-bench-", dir=self.root))
+        try:
+            for n in self.scales:
+                for name in selected:
+                    directory = scratch / f"{name}-{n}"
+                    directory.mkdir()
+                    for result in getattr(self, f"_bench_{name}")(directory, n):
+                        results.append(result)
+                        if progress:
+                            progress(result)
+                    shutil.rmtree(directory, ignore_errors=True)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+        return {"meta": environment(self), "results": [result.to_dict() for result in results]}
+
+    # -- subsystems ------------------------------------------------------------------
+
+    def _bench_evidence(self, root: Path, n: int) -> Iterator[BenchResult]:
+        path = root / "evidence_log.jsonl"
+        generators.write_jsonl(path, generators.evidence_dicts(n, self.seed))
+        store = EvidenceStore(path)
+        records = store.load()
+        yield self._time("evidence", "load", n, lambda _: store.load())
+        yield self._time("evidence", "load.validated", n, lambda _: EvidenceStore(path, trusted=False).load())
+        yield self._time("evidence", "load_table", n, lambda _: store.load_table())
+
+        def fresh_store() -> EvidenceStore:
+            target = root / "append.jsonl"
+            target.unlink(missing_ok=True)
+            return EvidenceStore(target)
+
+        yield self._time("evidence", "append_many", n, lambda target: target.append_many(records), fresh_store)
+        by_hash = {record.hash: record for record in records}
+        wanted = [records[i].hash for i in np.linspace(0, n - 1, min(n, _QUERY_SAMPLE), dtype=int)]
+        yield self._time("evidence", "index.by_hash", n, lambda _: {r.hash: r for r in records})
+        yield self._time("evidence", "query.by_hash", len(wanted), lambda _: [by_hash[key] for key in wanted])
+        yield self._time("evidence", "query.by_source", n, lambda _: [r for r in records if r.source == "MOFA"])
+        table = store.load_table()
+        yield self._time("evidence", "table.query.by_hash", len(wanted), lambda _: [table.find(key) for key in wanted])
+        yield self._time("evidence", "table.query.by_source", n, lambda _: table.where(source="MOFA"))
+
+    def _bench_panel(self, root: Path, n: int) -> Iterator[BenchResult]:
+        store = PanelStore(root / "indicator_panel.json")
+        generators.write_json(store.path, list(generators.indicator_dicts(n, self.seed)))
+        records = store.load()
+        yield self._time("panel", "load", n, lambda _: store.load())
+        yield self._time("panel", "load.validated", n, lambda _: PanelStore(store.path, trusted=False).load())
+        yield self._time("panel", "save", n, lambda _: store.save(records))
+        yield self._time("panel", "score", n, lambda _: PanelScorer(records).dimension_scores())
+
+        history = PanelHistoryStore(root / "indicator_history.jsonl")
+        generators.write_jsonl(history.path, generators.history_dicts(n, self.seed))
+        entries = history.load()
+        yield self._time("panel", "history.load", n, lambda _: history.load())
+        yield self._time(
+            "panel", "history.load.validated", n, lambda _: PanelHistoryStore(history.path, trusted=False).load()
+        )
+        yield self._time("panel", "history.score", n, lambda _: score_history(entries, INDICATOR_TEMPLATES))
+
+    def _bench_forecast(self, root: Path, n: int) -> Iterator[BenchResult]:
+        store = ForecastStore(root / "forecast_ledger.json")
+        generators.write_json(store.path, list(generators.forecast_dicts(n, self.seed)))
+        events = store.load()
+        yield self._time("forecast", "load", n, lambda _: store.load())
+        yield self._time("forecast", "load.validated", n, lambda _: ForecastStore(store.path, trusted=False).load())
+        yield self._time("forecast", "save", n, lambda _: store.save(events))
+        store.scores_path.unlink(missing_ok=True)
+        tracker = ForecastTracker(store)  # writes the score sidecar once
+        yield self._time("forecast", "tracker.init", n, lambda _: ForecastTracker(store))
+        today = date(2025, 1, 1)
+        yield self._time("forecast", "overdue", n, lambda _: tracker.overdue(today))
+        yield self._time("forecast", "aggregate_brier", n, lambda _: tracker.aggregate_brier())
+        yield self._time("forecast", "time_weighted_brier", n, lambda _: (tracker.series(), tracker.time_weighted_brier()))
+        yield self._time("forecast", "as_of", n, lambda _: tracker.as_of(datetime(2024, 6, 1)))
+
+    def _bench_ach(self, root: Path, n: int) -> Iterator[BenchResult]:
+        table_path = root / "ach_table.json"
+        generators.write_json(table_path, generators.ach_table_dict(n, self.seed))
+        log = ACHLogStore(root / "ach_evidence_log.jsonl")
+        generators.write_jsonl(log.path, generators.ach_log_dicts(n, self.seed))
+        store = ACHStore(table_path)
+        tables = list(store.load_all().values())
+        yield self._time("ach", "load", n, lambda _: store.load_all())
+        yield self._time("ach", "load.validated", n, lambda _: ACHStore(table_path, trusted=False).load_all())
+        yield self._time("ach", "save", n, lambda _: store.save_all(tables))
+        yield self._time("ach", "manager.init", n, lambda _: ACHManager(store, log))
+
+        files = (table_path, store.checksum.sidecar, log.path, log.checksum.sidecar)  # sidecars too, so loads stay trusted
+        pristine = {path: path.read_bytes() for path in files if path.exists()}
+        incoming = [
+            (item["hypothesis"], item["kind"], EvidenceRecord.model_validate(item["evidence"]))
+            for item in generators.ach_log_dicts(min(n, _QUERY_SAMPLE), self.seed + 1)
+        ]
+
+        def fresh_manager() -> ACHManager:
+            for path in files:
+                if path in pristine:
+                    path.write_bytes(pristine[path])
+                else:
+                    path.unlink(missing_ok=True)
+            return ACHManager(store, log)
+
+        yield self._time("ach", "add_many", len(incoming), lambda manager: manager.add_many(incoming), fresh_manager)
+        manager = fresh_manager()
+        yield self._time("ach", "recompute_posteriors", n, lambda _: manager.recompute_posteriors(workers=1))
+        yield self._time("ach", "assessment", n, lambda _: manager.assessment())
+
+    def _bench_alerts(self, root: Path, n: int) -> Iterator[BenchResult]:
+        records = [
+            EvidenceRecord.model_validate(item)
+            for item in generators.evidence_dicts(n, self.seed, signal_rate=_SIGNAL_RATE)
+        ]
+        store = AlertStore(root / "alert_events.jsonl")
+
+        def fresh_evaluator() -> StreamingAlertEvaluator:
+            store.path.unlink(missing_ok=True)
+            store.snapshot_path.unlink(missing_ok=True)
+            return StreamingAlertEvaluator(AlertMonitor(store=store))
+
+        evaluator = fresh_evaluator()
+        yield self._time("alerts", "evaluate", n, lambda _: [evaluator.evaluate(record) for record in records])
+        yield self._time("alerts", "consume_many", n, lambda fresh: fresh.consume_many(records), fresh_evaluator)
+        sample = records[: min(n, _QUERY_SAMPLE)]
+
+        def consume_each(fresh: StreamingAlertEvaluator) -> None:
+            for record in sample:
+                fresh.consume(record)
+
+        yield self._time("alerts", "consume", len(sample), consume_each, fresh_evaluator)
+
+
+def environment(suite: BenchSuite | None = None) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    meta: Dict[str, Any] = {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+    }
+    if suite is not None:
+        meta.update(scales=suite.scales, repeat=suite.repeat, memory=suite.memory, seed=suite.seed)
+    return meta
+
+
+def compare(baseline: dict, current: dict) -> List[dict]:
+    """Pair results by ``(subsystem, operation, n)``; ``ratio`` < 1 means ``current`` is faster."""
+
+    before = {(r["subsystem"], r["operation"], r["n"]): r for r in baseline.get("results", [])}
+    rows = []
+    for result in current.get("results", []):
+        previous = before.get((result["subsystem"], result["operation"], result["n"]))
+        if previous is None:
+            continue
+        rows.append(
+            {
+                "subsystem": result["subsystem"],
+                "operation": result["operation"],
+                "n": result["n"],
+                "before": previous["seconds"],
+                "after": result["seconds"],
+                "ratio": result["seconds"] / previous["seconds"] if previous["seconds"] else None,
+            }
+        )
+    return rows
+
+
+__all__ = ["BenchSuite", "BenchResult", "SUBSYSTEMS", "DEFAULT_SCALES", "measure", "environment", "compare"]
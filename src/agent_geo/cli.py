@@ -1,23 +1,65 @@
 from __future__ import annotations
 
 import argparse
+import cProfile
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
+from typing import Iterator
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 
 from agent_geo import (
+    ACH_HYPOTHESES,
     ENTRAPMENT_SIGNALS,
     INDICATOR_TEMPLATES,
     GeoRiskAgent,
     GLOBAL_SYSTEM_PROMPT,
     list_prompt_templates,
 )
-from agent_geo.datasources import list_sources, missing_prompt_sources
-from agent_geo.models import IndicatorStatus
+from agent_geo import profiling
+from agent_geo.config import NEAR_DUPLICATE_THRESHOLD
+from agent_geo.datasources import REGISTRY, list_sources, missing_prompt_sources
+from agent_geo.models import EvidenceRecord, IndicatorStatus
 from agent_geo.models.forecast import ForecastEvent
+from agent_geo.pipelines.ach_classifier import UNKNOWN
+from agent_geo.pipelines.ach_matrix import evidence_key
+from agent_geo.pipelines.evidence_rehash import rehash_evidence_log
+from agent_geo.pipelines.forecast_pool import AGGREGATION_METHODS
+from agent_geo.pipelines.forecast_tracker import parse_as_of
+from agent_geo.pipelines.near_duplicates import NearDuplicateIndex
+from agent_geo.pipelines.panel_scoring import DIMENSIONS
+from agent_geo.storage import RunStore
 
-console = Console()
+DEFAULT_SOCKET = Path("data/agent.sock")
+
+
+class _ConsoleRouter:
+    """Module ``console`` that the daemon can point at a per-request console for one thread."""
+
+    def __init__(self) -> None:
+        self._default = Console()
+        self._local = threading.local()
+
+    def __getattr__(self, name: str):
+        return getattr(getattr(self._local, "console", None) or self._default, name)
+
+    @contextmanager
+    def redirect(self, target: Console) -> Iterator[Console]:
+        self._local.console = target
+        try:
+            yield target
+        finally:
+            self._local.console = None
+
+
+console = _ConsoleRouter()
 
 
 def _color(value: str) -> IndicatorStatus:
@@ -89,25 +131,147 @@ def cmd_panel_update(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
     console.print(f"Updated {record.indicator} with status {record.color.value}")
 
 
+def cmd_panel_import(agent: GeoRiskAgent, path: str) -> None:
+    try:
+        records = agent.panel.import_file(path)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        return
+    console.print(f"Imported {len(records)} indicator update(s) from {path}")
+
+
+def cmd_panel_diff(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    since = datetime.fromisoformat(args.since) if args.since else None
+    until = datetime.fromisoformat(args.until) if args.until else None
+    changes = agent.panel_diff(since, until)
+    if args.json:
+        console.print_json(json.dumps(changes.to_dict(), ensure_ascii=False))
+        return
+    table = Table("Indicator", "Weight", "Color", "Value", "Direction", "New evidence")
+    for change in changes.changes:
+        table.add_row(
+            change.indicator,
+            str(change.weight),
+            f"{change.color_before} → {change.color_after}" if change.color_changed else change.color_after,
+            change.value_after or "-",
+            change.direction_after or "-",
+            str(len(change.new_evidence)),
+        )
+    console.print(table)
+    console.print(changes.render_note())
+
+
+def _score(value: float | None) -> str:
+    return "-" if value is None or value != value else f"{value:.2f}"
+
+
+def cmd_panel_score(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    scores = agent.panel_scores()
+    table = Table("Dimension", "Score")
+    for dimension, value in scores["dimensions"].items():
+        table.add_row(dimension, _score(value))
+    table.add_row("[bold]overall[/bold]", _score(scores["overall"]))
+    console.print(table)
+    if not args.history:
+        return
+    series = agent.panel.score_series()
+    if len(series.times) == 0:
+        console.print("No panel history recorded yet.")
+        return
+    last = series.times[-1]
+    weeks = np.arange(series.times[0], last, np.timedelta64(7, "D"))
+    if len(weeks) and weeks[-1].astype("datetime64[D]") >= last.astype("datetime64[D]"):
+        weeks[-1] = last  # same day as the last weekly row: show the latest state once
+    else:
+        weeks = np.append(weeks, last)
+    dims, overall = series.at(weeks.tolist())
+    history = Table("Week", *[dimension.value for dimension in DIMENSIONS], "Overall")
+    for i, week in enumerate(weeks):
+        history.add_row(str(week.astype("datetime64[D]")), *[_score(value) for value in dims[i]], _score(overall[i]))
+    console.print(history)
+
+
 def cmd_panel_export(agent: GeoRiskAgent, path: str) -> None:
     exported = agent.export_panel_csv(path)
     console.print(f"Panel exported to {exported}")
 
 
 def cmd_ach_add(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
-    evidence = agent.add_supporting_evidence(args.hypothesis, args.query, supports=args.kind == "support")
+    evidence = agent.add_supporting_evidence(
+        args.hypothesis, args.query, supports=args.kind == "support", question=args.question
+    )
     if evidence:
         console.print(f"Logged evidence {evidence.title}")
     else:
         console.print("No evidence returned from web search")
 
 
+def cmd_ach_show(agent: GeoRiskAgent, question: str | None = None) -> None:
+    ach_table = agent.get_ach_table(question)
+    console.print(f"[bold]{ach_table.question}[/bold]")
+    table = Table("Hypothesis", "Support", "Refute", "Net", "Weighted", "Inconsistency", "p", "Posterior")
+    assessment = agent.ach.assessment(ach_table.question)
+    for entry in ach_table.entries:
+        scores = assessment[entry.hypothesis]
+        table.add_row(
+            entry.hypothesis,
+            str(len(entry.supports)),
+            str(len(entry.refutes)),
+            str(entry.net_assessment),
+            f"{scores['score']:+.2f}",
+            f"{scores['inconsistency']:.2f}",
+            f"{scores['probability']:.2f}",
+            "-" if entry.posterior is None else f"{entry.posterior:.2f}",
+        )
+    console.print(table)
+
+
+def cmd_ach_recompute(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    used = agent.ach.recompute_posteriors(
+        workers=args.workers, chunk_bytes=args.chunk_mb << 20, question=args.question
+    )
+    console.print(f"Rebuilt posteriors from {used} observations")
+    cmd_ach_show(agent, args.question)
+
+
+def cmd_ach_suggest(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    suggestions = agent.suggest_ach(question=args.question, min_score=args.min_score)
+    suggestions.sort(key=lambda item: item.score, reverse=True)
+    shown = suggestions[: args.limit]
+    table = Table("Evidence", "Hypothesis", "Kind", "Score", "Margin")
+    for suggestion in shown:
+        table.add_row(
+            suggestion.evidence.title,
+            suggestion.hypothesis,
+            suggestion.kind,
+            f"{suggestion.score:.2f}",
+            f"{suggestion.margin:.2f}",
+        )
+    console.print(table)
+    if args.apply:
+        applied = agent.ach.add_many(
+            ((item.hypothesis, item.kind, item.evidence) for item in shown if item.kind != UNKNOWN),
+            question=args.question,
+        )
+        console.print(f"Applied {applied} suggestions to the ACH table")
+
+
+def cmd_ach_questions(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    if args.new:
+        agent.ach.add_question(args.new, args.hypothesis or ACH_HYPOTHESES)
+        console.print(f"Added ACH question {args.new}")
+    for question in agent.ach.questions():
+        marker = "*" if question == agent.ach.question else " "
+        console.print(f"{marker} {question}")
+
+
 def cmd_forecast_add(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
     event = ForecastEvent(
         event=args.event,
         due_date=datetime.fromisoformat(args.due_date).date(),
         probability=args.probability,
         rationale=args.rationale,
+        tags=args.tags or [],
     )
     agent.upsert_forecast(event)
     console.print(f"Logged forecast '{event.event}' at p={event.probability}")
@@ -118,16 +282,65 @@ def cmd_forecast_close(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
     console.print(f"Finalized {args.event} with outcome {args.outcome}")
 
 
-def cmd_forecast_list(agent: GeoRiskAgent) -> None:
-    rows = agent.forecast_rows()
-    table = Table("Event", "Due", "p", "Outcome", "Brier")
+def cmd_forecast_list(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    as_of = parse_as_of(args.as_of) if args.as_of else None
+    rows = agent.forecast_rows(as_of)
+    table = Table("Event", "Due", "p", "Outcome", "Brier", "TW-Brier")
     for row in rows:
+        weighted = row.get("time_weighted_brier")
         table.add_row(
             row["event"],
             row["due_date"],
             f"{row['probability']:.2f}",
             "-" if row["outcome"] is None else str(row["outcome"]),
             "-" if row["brier"] is None else f"{row['brier']:.3f}",
+            "-" if weighted is None else f"{weighted:.3f}",
+        )
+    console.print(table)
+    overall = agent.forecasts.scores.overall
+    if overall.count and not as_of:
+        console.print(f"Aggregate Brier {overall.mean:.3f} over {overall.count} resolved forecasts")
+
+
+def cmd_forecast_scores(agent: GeoRiskAgent) -> None:
+    scores = agent.forecasts.scores
+    table = Table("Bucket", "Key", "Resolved", "Brier")
+    buckets = [("overall", {"all": scores.overall}), ("month", scores.by_month), ("tag", scores.by_tag)]
+    for bucket, tallies in buckets:
+        for key, tally in sorted(tallies.items()):
+            table.add_row(bucket, key, str(tally.count), "-" if tally.mean is None else f"{tally.mean:.3f}")
+    console.print(table)
+
+
+def cmd_forecast_overdue(agent: GeoRiskAgent) -> None:
+    events = agent.forecasts.overdue()
+    if not events:
+        console.print("No overdue forecasts awaiting resolution.")
+        return
+    table = Table("Event", "Due", "p")
+    for event in events:
+        table.add_row(event.event, event.due_date.isoformat(), f"{event.probability:.2f}")
+    console.print(table)
+
+
+def cmd_forecast_pool_ingest(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    payload = json.loads(Path(args.path).read_text(encoding="utf-8"))
+    count = agent.pool.ingest_brier_pool(args.forecaster, payload)
+    console.print(f"Ingested {count} forecasts from {args.forecaster}")
+    if args.publish:
+        published = agent.publish_pool_consensus(args.method)
+        console.print(f"Published {len(published)} consensus forecasts ({args.method}) to the ledger")
+
+
+def cmd_forecast_leaderboard(agent: GeoRiskAgent) -> None:
+    table = Table("#", "Forecaster", "Answered", "Resolved", "Brier")
+    for row in agent.pool.leaderboard():
+        table.add_row(
+            str(row["rank"]),
+            row["forecaster"],
+            str(row["answered"]),
+            str(row["resolved"]),
+            "-" if row["brier"] is None else f"{row['brier']:.3f}",
         )
     console.print(table)
 
@@ -154,6 +367,163 @@ def cmd_alert_status(agent: GeoRiskAgent) -> None:
             row["last_checked"],
         )
     console.print(table)
+    if agent.alerts.red_since:
+        console.print(f"[bold red]Red-line active since {agent.alerts.red_since.isoformat()}[/bold red]")
+
+
+def cmd_alert_timeline(agent: GeoRiskAgent) -> None:
+    table = Table("At", "Key", "State", "Evidence", "Notes")
+    for event in agent.alerts.timeline():
+        table.add_row(
+            event.at.isoformat(),
+            event.key,
+            "ACTIVE" if event.active else "inactive",
+            str(len(event.evidence)),
+            event.notes or "-",
+        )
+    console.print(table)
+    for start, end in agent.alerts.red_intervals():
+        console.print(f"Red-line {start.isoformat()} → {end.isoformat() if end else 'ongoing'}")
+
+
+def cmd_alert_stream(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    with Path(args.path).open("r", encoding="utf-8") as fh:
+        evidence = [EvidenceRecord.model_validate_json(line) for line in fh if line.strip()]
+    result = agent.stream_alert_evidence(evidence)
+    table = Table("Key", "New evidence")
+    for key, matched in result.matches.items():
+        table.add_row(key, str(len(matched)))
+    console.print(table)
+    console.print(f"{result.items} item(s) in {result.elapsed * 1000:.1f} ms ({result.throughput:,.0f}/s)")
+    if result.fired:
+        console.print(f"[bold red]Entrapment red-line triggered — flash brief written to {agent.briefs.path}[/bold red]")
+
+
+def _duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    if seconds < 120:
+        return f"{seconds:.1f} s"
+    if seconds < 7200:
+        return f"{seconds / 60:.1f} min"
+    return f"{seconds / 3600:.1f} h"
+
+
+def cmd_alert_latency(agent: GeoRiskAgent) -> None:
+    table = Table("Stage", "Count", "p50", "p95", "p99", "Max")
+    for row in agent.latency.report():
+        table.add_row(
+            row["stage"],
+            str(row["count"]),
+            _duration(row["p50"]),
+            _duration(row["p95"]),
+            _duration(row["p99"]),
+            _duration(row["max"]),
+        )
+    console.print(table)
+    attainment = agent.latency.sla_attainment()
+    if attainment is not None:
+        console.print(f"Flash brief within 6 h of publication: {attainment:.0%}")
+
+
+def cmd_tag(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    source = Path(args.path) if args.path else agent.panel.evidence_store.path
+    if not source.exists():
+        console.print(f"No evidence file at {source}")
+        return
+    with source.open("r", encoding="utf-8") as fh:
+        evidence = [EvidenceRecord.model_validate_json(line) for line in fh if line.strip()]
+    records = agent.tag_evidence(evidence)
+    counts: dict[str, int] = {}
+    for record in records:
+        for key in record.tags:
+            counts[key] = counts.get(key, 0) + 1
+    table = Table("Key", "Items")
+    for key, count in sorted(counts.items(), key=lambda item: -item[1]):
+        table.add_row(key, str(count))
+    console.print(table)
+    if args.output:
+        with Path(args.output).open("w", encoding="utf-8") as fh:
+            for record in records:
+                fh.write(record.model_dump_json())
+                fh.write("\n")
+        console.print(f"Tagged evidence written to {args.output}")
+
+
+def cmd_evidence_rehash(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    report = rehash_evidence_log(
+        agent.panel.evidence_store,
+        dedupe=args.dedupe,
+        workers=args.workers,
+        chunk_bytes=args.chunk_mb << 20,
+        ach_store=agent.ach.store,
+        ach_log=agent.ach.log_store,
+        alert_store=agent.alerts.store,
+    )
+    console.print(
+        f"Rehashed {report.records} evidence records: {report.changed} hashes changed"
+        + (f", {report.duplicates} duplicates dropped" if args.dedupe else "")
+        + f"; {report.dependents} ACH/alert copies migrated"
+    )
+
+
+def cmd_evidence_clusters(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    evidence = agent.panel.evidence_store.load()
+    index = NearDuplicateIndex(threshold=args.threshold)
+    by_key = {}
+    for item in evidence:
+        index.add_evidence(item)
+        by_key.setdefault(evidence_key(item), item)
+    clusters = index.clusters(min_size=args.min_size)
+    table = Table("Story", "Copies", "Sources")
+    for cluster, keys in list(clusters.items())[: args.limit]:
+        sources = sorted({by_key[key].source for key in keys})
+        table.add_row(by_key[cluster].title, str(len(keys)), ", ".join(sources))
+    console.print(table)
+    console.print(f"{len(evidence)} evidence items, {len(index.clusters())} stories")
+
+
+def _print_run(run_id: str, stages: dict) -> None:
+    table = Table("Stage", "Status", "Seconds", "Detail")
+    for name, record in stages.items():
+        detail = record.get("error") or ""
+        if record.get("result") and not detail:
+            result = record["result"]
+            detail = ", ".join(f"{key}={value}" for key, value in result.items() if not isinstance(value, (list, dict)))
+        table.add_row(
+            name,
+            record["status"],
+            "-" if record.get("seconds") is None else f"{record['seconds']:.2f}",
+            detail.strip().splitlines()[-1] if detail else "-",
+        )
+    console.print(f"[bold]OODA run {run_id}[/bold]")
+    console.print(table)
+
+
+def cmd_ooda_run(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
+    queries = None
+    if args.query:
+        queries = dict(item.split("=", 1) for item in args.query)
+    report = agent.run_ooda(args.run_id, queries=queries, workers=args.workers)
+    _print_run(report.run_id, {name: record.to_dict() for name, record in report.stages.items()})
+    if report.resumed:
+        console.print(f"Resumed from checkpoint: {', '.join(report.resumed)}")
+    if report.ok:
+        console.print(report.stages["act.brief"].result["change_note"])
+    else:
+        console.print(f"[red]Run incomplete; re-run with --run-id {report.run_id} to resume.[/red]")
+
+
+def cmd_ooda_status(args: argparse.Namespace) -> None:
+    store = RunStore()
+    run_id = args.run_id or next(reversed(store.run_ids()), None)
+    payload = store.load(run_id) if run_id else None
+    if payload is None:
+        console.print("No OODA runs recorded.")
+        return
+    _print_run(run_id, payload["stages"])
 
 
 def cmd_prompts_list() -> None:
@@ -185,14 +555,30 @@ def cmd_prompts_show(agent: GeoRiskAgent, key: str, sources: list[str] | None) -
         console.print(f"- {url}")
 
 
-def cmd_sources_list() -> None:
+def cmd_sources_list(args: argparse.Namespace) -> None:
+    sources = list_sources()
+    if args.tag:
+        sources = [source for source in REGISTRY.by_tag(args.tag) if source in sources]
+    if args.category:
+        sources = [source for source in REGISTRY.by_category(args.category) if source in sources]
+    if args.prompt:
+        sources = [source for source in REGISTRY.by_prompt(args.prompt) if source in sources]
     table = Table("Name", "Category", "URL", "Tags")
-    for source in list_sources():
+    for source in sources:
         tag_text = ", ".join(source.tags) if source.tags else "-"
         table.add_row(source.name, source.category, source.url, tag_text)
     console.print(table)
 
 
+def cmd_sources_lookup(url: str) -> None:
+    matches = REGISTRY.lookup(url)
+    if not matches:
+        console.print(f"No whitelisted source for {url}")
+        return
+    for source in matches:
+        console.print(f"{source.name} [{source.category}] {', '.join(source.tags) or '-'}")
+
+
 def cmd_sources_audit() -> None:
     missing = missing_prompt_sources()
     if not missing:
@@ -203,10 +589,123 @@ def cmd_sources_audit() -> None:
         console.print(f"- {url}")
 
 
+def cmd_bench(args: argparse.Namespace) -> None:
+    from agent_geo.bench import DEFAULT_SCALES, BenchSuite, compare
+
+    suite = BenchSuite(args.scale or DEFAULT_SCALES, repeat=args.repeat, memory=args.memory, seed=args.seed)
+    table = Table("Subsystem", "Operation", "N", "Seconds", "µs/record", "Peak MB")
+
+    def progress(result) -> None:
+        row = result.to_dict()
+        table.add_row(
+            row["subsystem"],
+            row["operation"],
+            f"{row['n']:,}",
+            f"{row['seconds']:.4f}",
+            f"{row['per_record_us']:.2f}",
+            "-" if row["peak_mb"] is None else f"{row['peak_mb']:.1f}",
+        )
+
+    with console.status("Running benchmarks..."):
+        report = suite.run(args.only, progress=progress)
+    console.print(table)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        console.print(f"Results written to {args.output}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        diff = Table("Subsystem", "Operation", "N", "Before", "After", "Ratio")
+        for row in compare(baseline, report):
+            ratio = row["ratio"]
+            style = "green" if ratio is not None and ratio < 0.9 else "red" if ratio is not None and ratio > 1.1 else ""
+            diff.add_row(
+                row["subsystem"],
+                row["operation"],
+                f"{row['n']:,}",
+                f"{row['before']:.4f}",
+                f"{row['after']:.4f}",
+                "-" if ratio is None else f"[{style}]{ratio:.2f}x[/{style}]" if style else f"{ratio:.2f}x",
+            )
+        console.print(f"[bold]vs {baseline.get('meta', {}).get('commit') or args.compare}[/bold]")
+        console.print(diff)
+
+
+def _ms(seconds: float | None) -> str:
+    if seconds is None or seconds != seconds:
+        return "-"
+    return f"{seconds * 1000:,.2f}"
+
+
+def print_profile() -> None:
+    table = Table(title="Profile (ms)")
+    table.add_column("Span", no_wrap=True)
+    for header in ("Calls", "Err", "Total", "Self", "p95≤", "Max"):
+        table.add_column(header, justify="right")
+    for row in profiling.report():
+        table.add_row(
+            row["span"],
+            str(row["calls"]),
+            str(row["errors"]) if row["errors"] else "-",
+            _ms(row["total"]),
+            _ms(row["self"]),
+            _ms(row["p95"]),
+            _ms(row["max"]),
+        )
+    console.print(table)
+    counters = profiling.counters()
+    if counters:
+        console.print(", ".join(f"{name}={value:g}" for name, value in sorted(counters.items())))
+
+
+def _profiling_requested(args: argparse.Namespace) -> bool:
+    return bool(args.profile or args.pstats or args.prometheus)
+
+
+@contextmanager
+def _profiled_run(args: argparse.Namespace) -> Iterator[None]:
+    """Enable spans (and cProfile with ``--pstats``) around one command, then report."""
+
+    if not _profiling_requested(args):
+        yield
+        return
+    profiling.reset()
+    profiling.enable()
+    profiler = cProfile.Profile() if args.pstats else None
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.pstats)
+        profiling.disable()
+        if args.profile:
+            print_profile()
+        if args.prometheus:
+            Path(args.prometheus).write_text(profiling.prometheus(), encoding="utf-8")
+        if profiler:
+            console.print(f"cProfile stats written to {args.pstats} (python -m pstats {args.pstats})")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Geo-risk agent control surface")
+    parser.add_argument("--socket", help=f"Daemon socket (default: $AGENT_GEO_SOCKET or {DEFAULT_SOCKET})")
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Run in-process even if a daemon is listening (the daemon reloads its stores before its next command)",
+    )
+    parser.add_argument("--profile", action="store_true", help="Print per-span timings after the command (runs in-process)")
+    parser.add_argument("--pstats", metavar="FILE", help="Also run under cProfile and dump pstats to FILE")
+    parser.add_argument("--prometheus", metavar="FILE", help="Write span metrics in Prometheus text format to FILE")
     sub = parser.add_subparsers(dest="command")
 
+    sub.add_parser("serve", help="Keep the agent warm and answer CLI calls over a Unix socket")
+    api = sub.add_parser("api", help="Serve the read-only JSON HTTP API")
+    api.add_argument("--host", default="127.0.0.1")
+    api.add_argument("--port", type=int, default=8765)
+
     sub.add_parser("init", help="Show templates and signals")
 
     search = sub.add_parser("search", help="Run a web search via the tool")
@@ -226,6 +725,13 @@ def build_parser() -> argparse.ArgumentParser:
     panel_update.add_argument("--query", help="If provided, evidence will be auto-fetched")
     panel_update.add_argument("--source-url", dest="source_url")
     panel_sub.add_parser("export", help="Export panel to CSV").add_argument("path")
+    panel_sub.add_parser("import", help="Bulk update from a CSV or JSONL file").add_argument("path")
+    panel_diff = panel_sub.add_parser("diff", help="What changed on the board (default: last 7 days)")
+    panel_diff.add_argument("--since", help="ISO datetime")
+    panel_diff.add_argument("--until", help="ISO datetime")
+    panel_diff.add_argument("--json", action="store_true", help="Print the structured change set")
+    panel_score = panel_sub.add_parser("score", help="Weighted composite risk per dimension")
+    panel_score.add_argument("--history", action="store_true", help="Weekly score series from the panel history")
 
     ach = sub.add_parser("ach", help="ACH operations")
     ach_sub = ach.add_subparsers(dest="ach_command")
@@ -233,6 +739,22 @@ def build_parser() -> argparse.ArgumentParser:
     ach_add.add_argument("--hypothesis", required=True)
     ach_add.add_argument("--query", required=True)
     ach_add.add_argument("--kind", choices=["support", "refute"], required=True)
+    ach_add.add_argument("--question", help="ACH question (default: primary question)")
+    ach_sub.add_parser("show", help="Weighted ACH table with hypothesis probabilities").add_argument("--question")
+    ach_questions = ach_sub.add_parser("questions", help="List ACH questions or add one")
+    ach_questions.add_argument("--new", help="Question text to add")
+    ach_questions.add_argument("--hypothesis", action="append", help="Hypothesis for --new; repeatable")
+    ach_suggest = ach_sub.add_parser("suggest", help="Classify unassigned evidence log items in bulk")
+    ach_suggest.add_argument("--question")
+    ach_suggest.add_argument("--min-score", dest="min_score", type=float, default=0.05)
+    ach_suggest.add_argument("--limit", type=int, default=50, help="Rows to display")
+    ach_suggest.add_argument(
+        "--apply", action="store_true", help="Write the displayed rows (those with kind 'unknown' are skipped)"
+    )
+    ach_recompute = ach_sub.add_parser("recompute", help="Weekly posterior rebuild from the evidence log")
+    ach_recompute.add_argument("--question")
+    ach_recompute.add_argument("--workers", type=int, help="Process pool size (default: CPU count)")
+    ach_recompute.add_argument("--chunk-mb", dest="chunk_mb", type=int, default=8, help="Log bytes per worker task")
 
     forecast = sub.add_parser("forecast", help="Forecast ledger")
     forecast_sub = forecast.add_subparsers(dest="forecast_command")
@@ -240,11 +762,23 @@ def build_parser() -> argparse.ArgumentParser:
     forecast_add.add_argument("--event", required=True)
     forecast_add.add_argument("--due-date", required=True)
     forecast_add.add_argument("--probability", type=float, required=True)
-    forecast_add.add_argument("--rationale")
+    forecast_add.add_argument("--rationale", help="Kept from the stored event if omitted")
+    forecast_add.add_argument(
+        "--tag", dest="tags", action="append", help="Scoring bucket; repeatable (kept from the stored event if omitted)"
+    )
     forecast_close = forecast_sub.add_parser("close")
     forecast_close.add_argument("--event", required=True)
     forecast_close.add_argument("--outcome", type=int, choices=[0, 1], required=True)
-    forecast_sub.add_parser("list")
+    forecast_list = forecast_sub.add_parser("list")
+    forecast_list.add_argument("--as-of", dest="as_of", help="Show the ledger as it stood on this ISO date")
+    forecast_sub.add_parser("overdue", help="Unresolved forecasts past their due date")
+    forecast_sub.add_parser("scores", help="Running Brier aggregates overall, per month and per tag")
+    pool_ingest = forecast_sub.add_parser("pool-ingest", help="Load one forecaster's brier_pool JSON")
+    pool_ingest.add_argument("path")
+    pool_ingest.add_argument("--forecaster", required=True)
+    pool_ingest.add_argument("--publish", action="store_true", help="Write consensus forecasts to the ledger")
+    pool_ingest.add_argument("--method", choices=AGGREGATION_METHODS, default="mean")
+    forecast_sub.add_parser("leaderboard", help="Per-forecaster Brier ranking for the pool")
 
     alert = sub.add_parser("alert", help="Entrapment signal monitoring")
     alert_sub = alert.add_subparsers(dest="alert_command")
@@ -255,6 +789,34 @@ def build_parser() -> argparse.ArgumentParser:
     alert_toggle.add_argument("--inactive", action="store_true")
     alert_set.add_argument("--notes")
     alert_sub.add_parser("status")
+    alert_sub.add_parser("timeline", help="Replay the signal log and red-line spells")
+    alert_stream = alert_sub.add_parser("stream", help="Evaluate a JSONL evidence file against the signal rules")
+    alert_stream.add_argument("path")
+    alert_sub.add_parser("latency", help="Per-stage evidence-to-alert latency percentiles")
+
+    tag = sub.add_parser("tag", help="Tag evidence with matching signal and indicator keys")
+    tag.add_argument("path", nargs="?", help="JSONL evidence file (default: the evidence log)")
+    tag.add_argument("--output", help="Write tagged JSONL here")
+
+    evidence = sub.add_parser("evidence", help="Evidence log maintenance")
+    evidence_sub = evidence.add_subparsers(dest="evidence_command")
+    rehash = evidence_sub.add_parser("rehash", help="Recompute content hashes over canonical URLs")
+    rehash.add_argument("--dedupe", action="store_true", help="Drop later records with an already-seen hash")
+    rehash.add_argument("--workers", type=int, help="Process pool size (default: CPU count)")
+    rehash.add_argument("--chunk-mb", dest="chunk_mb", type=int, default=8, help="Log bytes per worker task")
+    clusters = evidence_sub.add_parser("clusters", help="Group syndicated copies of the same story")
+    clusters.add_argument("--threshold", type=float, default=NEAR_DUPLICATE_THRESHOLD, help="Estimated Jaccard cut-off")
+    clusters.add_argument("--min-size", dest="min_size", type=int, default=2, help="Smallest cluster to list")
+    clusters.add_argument("--limit", type=int, default=20, help="Rows to display")
+
+    ooda = sub.add_parser("ooda", help="Weekly OODA cycle as a checkpointed stage graph")
+    ooda_sub = ooda.add_subparsers(dest="ooda_command")
+    ooda_run = ooda_sub.add_parser("run", help="Run a cycle, or resume one with --run-id")
+    ooda_run.add_argument("--run-id", dest="run_id")
+    ooda_run.add_argument("--workers", type=int, default=4)
+    ooda_run.add_argument("--query", action="append", help="KEY=TEXT search override; repeatable")
+    ooda_status = ooda_sub.add_parser("status", help="Stage status and timings of a run (default: latest)")
+    ooda_status.add_argument("run_id", nargs="?")
 
     prompts = sub.add_parser("prompts", help="LLM prompt templates")
     prompts_sub = prompts.add_subparsers(dest="prompts_command")
@@ -265,9 +827,22 @@ def build_parser() -> argparse.ArgumentParser:
 
     sources = sub.add_parser("sources", help="Primary data sources")
     sources_sub = sources.add_subparsers(dest="sources_command")
-    sources_sub.add_parser("list")
+    sources_list = sources_sub.add_parser("list")
+    sources_list.add_argument("--tag")
+    sources_list.add_argument("--category")
+    sources_list.add_argument("--prompt", help="Sources behind one prompt template's default hints")
+    sources_sub.add_parser("lookup", help="Whitelisted source(s) for an evidence URL").add_argument("url")
     sources_sub.add_parser("audit")
 
+    bench = sub.add_parser("bench", help="Time store/pipeline operations on synthetic data")
+    bench.add_argument("--scale", type=int, action="append", help="Records per dataset; repeatable (default: 10^3, 10^4)")
+    bench.add_argument("--only", action="append", choices=["evidence", "panel", "forecast", "ach", "alerts"])
+    bench.add_argument("--repeat", type=int, default=3, help="Runs per operation; the best is kept")
+    bench.add_argument("--memory", action="store_true", help="Record tracemalloc peak of the first run")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--output", help="Write results as JSON")
+    bench.add_argument("--compare", help="Earlier --output JSON to compare against")
+
     return parser
 
 
@@ -278,8 +853,34 @@ def main() -> None:
         parser.print_help()
         return
 
-    agent = GeoRiskAgent()
+    with _profiled_run(args):
+        if args.command == "serve":
+            from agent_geo.daemon import serve
+
+            serve(args.socket or DEFAULT_SOCKET)
+            return
+        if args.command == "api":
+            from agent_geo.http_api import run
 
+            run(args.host, args.port)
+            return
+        if args.command == "bench":
+            cmd_bench(args)
+            return
+        if not args.local and not _profiling_requested(args):
+            from agent_geo.daemon import DaemonUnavailable, request
+
+            socket_path = Path(args.socket or os.environ.get("AGENT_GEO_SOCKET") or DEFAULT_SOCKET)
+            if socket_path.exists():
+                try:
+                    raise SystemExit(request(socket_path, args))
+                except DaemonUnavailable as exc:
+                    print(f"warning: {exc}; running in-process", file=sys.stderr)
+
+        dispatch(GeoRiskAgent(), args)
+
+
+def dispatch(agent: GeoRiskAgent, args: argparse.Namespace) -> None:
     if args.command == "init":
         cmd_init(agent)
     elif args.command == "search":
@@ -291,11 +892,25 @@ def main() -> None:
             cmd_panel_update(agent, args)
         elif args.panel_command == "export":
             cmd_panel_export(agent, args.path)
+        elif args.panel_command == "import":
+            cmd_panel_import(agent, args.path)
+        elif args.panel_command == "diff":
+            cmd_panel_diff(agent, args)
+        elif args.panel_command == "score":
+            cmd_panel_score(agent, args)
         else:
             console.print("panel command requires subcommand")
     elif args.command == "ach":
         if args.ach_command == "add":
             cmd_ach_add(agent, args)
+        elif args.ach_command == "show":
+            cmd_ach_show(agent, args.question)
+        elif args.ach_command == "suggest":
+            cmd_ach_suggest(agent, args)
+        elif args.ach_command == "questions":
+            cmd_ach_questions(agent, args)
+        elif args.ach_command == "recompute":
+            cmd_ach_recompute(agent, args)
         else:
             console.print("ach command requires subcommand")
     elif args.command == "forecast":
@@ -304,7 +919,15 @@ def main() -> None:
         elif args.forecast_command == "close":
             cmd_forecast_close(agent, args)
         elif args.forecast_command == "list":
-            cmd_forecast_list(agent)
+            cmd_forecast_list(agent, args)
+        elif args.forecast_command == "overdue":
+            cmd_forecast_overdue(agent)
+        elif args.forecast_command == "scores":
+            cmd_forecast_scores(agent)
+        elif args.forecast_command == "pool-ingest":
+            cmd_forecast_pool_ingest(agent, args)
+        elif args.forecast_command == "leaderboard":
+            cmd_forecast_leaderboard(agent)
         else:
             console.print("forecast command requires subcommand")
     elif args.command == "alert":
@@ -312,8 +935,30 @@ def main() -> None:
             cmd_alert_set(agent, args)
         elif args.alert_command == "status":
             cmd_alert_status(agent)
+        elif args.alert_command == "timeline":
+            cmd_alert_timeline(agent)
+        elif args.alert_command == "stream":
+            cmd_alert_stream(agent, args)
+        elif args.alert_command == "latency":
+            cmd_alert_latency(agent)
         else:
             console.print("alert command requires subcommand")
+    elif args.command == "tag":
+        cmd_tag(agent, args)
+    elif args.command == "evidence":
+        if args.evidence_command == "rehash":
+            cmd_evidence_rehash(agent, args)
+        elif args.evidence_command == "clusters":
+            cmd_evidence_clusters(agent, args)
+        else:
+            console.print("evidence command requires subcommand")
+    elif args.command == "ooda":
+        if args.ooda_command == "run":
+            cmd_ooda_run(agent, args)
+        elif args.ooda_command == "status":
+            cmd_ooda_status(args)
+        else:
+            console.print("ooda command requires subcommand")
     elif args.command == "prompts":
         if args.prompts_command == "list":
             cmd_prompts_list()
@@ -323,13 +968,15 @@ def main() -> None:
             console.print("prompts command requires subcommand")
     elif args.command == "sources":
         if args.sources_command == "list":
-            cmd_sources_list()
+            cmd_sources_list(args)
+        elif args.sources_command == "lookup":
+            cmd_sources_lookup(args.url)
         elif args.sources_command == "audit":
             cmd_sources_audit()
         else:
             console.print("sources command requires subcommand")
     else:
-        parser.print_help()
+        console.print(build_parser().format_help())
 
 
 if __name__ == "__main__":
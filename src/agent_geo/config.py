@@ -119,6 +119,8 @@ class EntrapmentSignalDefinition:
     description: str
     trigger_condition: str
     primary_sources: List[str]
+    # Streaming rule: every group must match, any term within a group may match (JP/EN/ZH).
+    rule_terms: List[List[str]] = field(default_factory=list)
 
 
 ENTRAPMENT_SIGNALS: List[EntrapmentSignalDefinition] = [
@@ -127,25 +129,106 @@ ENTRAPMENT_SIGNALS: List[EntrapmentSignalDefinition] = [
         description="三边联合文本将俄远东/朝鲜支援俄乌打包为共同行动",
         trigger_condition="When joint statements explicitly list Russia Far East + DPRK along EU support",
         primary_sources=["https://www.mofa.go.jp/fp/nsp/page1we_000081.html"],
+        rule_terms=[
+            ["trilateral", "日米韓", "日美韩", "美日韩", "三边", "三か国"],
+            ["russia", "ロシア", "俄", "far east", "極東", "远东"],
+            ["dprk", "north korea", "北朝鮮", "朝鲜"],
+        ],
     ),
     EntrapmentSignalDefinition(
         key="joint_command_upgrade",
         description="联指措辞从'协调/联络'升级为'(准)共同指挥'",
         trigger_condition="Language upgrade in SDF Joint HQ or USFJ releases",
         primary_sources=["https://www.mod.go.jp/en/d_policy/index.html"],
+        rule_terms=[
+            ["joint operations command", "統合作戦司令部", "统合作战司令部", "常设统合司令部", "usfj", "在日米軍", "驻日美军"],
+            ["joint command", "combined command", "共同指揮", "共同指挥", "command and control", "指揮統制", "指挥控制"],
+        ],
     ),
     EntrapmentSignalDefinition(
         key="counterstrike_narrative_shift",
         description="反击能力叙事从报复性自卫滑向先发抑制",
         trigger_condition="Cabinet/NSC docs frame counter-strike as pre-emption",
         primary_sources=["https://www.cas.go.jp/jp/siryou/221216anzenhoshou/nss-e.pdf"],
+        rule_terms=[
+            ["counter-strike", "counterstrike", "反撃能力", "反击能力", "敵基地攻撃"],
+            ["pre-emptive", "preemptive", "pre-emption", "preemption", "先制", "先发", "预防性打击", "予防"],
+        ],
     ),
 ]
 
 
+# Extra JP/EN/ZH vocabulary per indicator key for the keyword tagger, on top of the
+# quoted phrases and acronyms in each ``IndicatorTemplate.description``.
+INDICATOR_TAG_TERMS = {
+    "institution_article9": [
+        "存立危機事態", "存立危机事态", "existential crisis situation",
+        "集団的自衛権", "集体自卫权", "collective self-defense", "憲法9条", "第9条", "article 9",
+    ],
+    "institution_nsc_process": ["国家安全保障会議", "国家安全保障局", "国家安全委员会", "national security council", "官邸"],
+    "capability_counterstrike_delivery": [
+        "反撃能力", "反击能力", "counter-strike", "counterstrike", "スタンド・オフ", "stand-off missile",
+        "トマホーク", "tomahawk", "イージス", "aegis",
+    ],
+    "capability_joint_hq": ["統合作戦司令部", "统合作战司令部", "常设统合司令部", "joint operations command"],
+    "alliance_tri_lateral_text": ["日米韓", "日美韩", "美日韩", "trilateral", "三边", "北朝鮮", "朝鲜", "dprk"],
+    "alliance_joint_command_language": ["共同指揮", "共同指挥", "joint command", "指揮統制", "command and control"],
+    "capital_tse_reform": ["東証", "东证", "市場区分", "資本コスト", "cost of capital", "政策保有株", "cross-shareholding"],
+    "capital_fsa_guidance": ["金融庁", "金融厅", "stewardship code", "スチュワードシップ", "コーポレートガバナンス"],
+    "funds_gpif_principles": ["年金積立金管理運用", "stewardship", "基本ポートフォリオ", "养老金"],
+}
+
+
+# Board colour -> risk level used by the composite panel score (weighted mean per dimension).
+INDICATOR_COLOR_SCORES = {
+    "green": 0.0,
+    "yellow": 0.5,
+    "red": 1.0,
+}
+
+
 ACH_QUESTION = "日本 12 个月内是否会进入区域有限军事行动的事实参与？"
 ACH_HYPOTHESES = [
     "H1 同盟内正常化",
     "H2 同盟拖拽",
     "H3 内向化收缩",
 ]
+
+# Seed text for the offline evidence classifier (README §6), mixing ZH/JP/EN phrasing.
+ACH_HYPOTHESIS_DESCRIPTIONS = {
+    "H1 同盟内正常化": (
+        "能力提升但维持防御叙事；三边文本不打包俄远东；联指仍为协调。"
+        "専守防衛 防衛力強化 日米同盟 調整 連絡 "
+        "capability build-up within defensive posture, coordination not command, no trilateral bundling"
+    ),
+    "H2 同盟拖拽": (
+        "三信号触发，自卫队进入有限行动（护航/制空/后勤/远程火力）；集体自卫权 存立危机事态 先发抑制 共同指挥。"
+        "存立危機事態 集団的自衛権 統合作戦司令部 反撃能力 敵基地攻撃 共同指揮 "
+        "entrapment collective self-defense existential crisis pre-emption counter-strike joint command "
+        "trilateral Russia Far East DPRK escort air superiority logistics long-range fires"
+    ),
+    "H3 内向化收缩": (
+        "民生/财政/资本市场压力压制防务外延；TSE/外资治理要求增强，政策放缓。"
+        "財政 物価 民生 東証 資本コスト 防衛費 削減 先送り "
+        "fiscal pressure cost of living budget constraint defense spending delay TSE governance investor pressure"
+    ),
+}
+
+# ICD-203 source-quality grades (L/M/H) mapped to evidence weights for ACH scoring.
+EVIDENCE_QUALITY_WEIGHTS = {
+    "H": 1.0,
+    "M": 0.6,
+    "L": 0.3,
+}
+
+# Estimated Jaccard similarity (MinHash over title + quote shingles) at which two evidence
+# items are treated as copies of one syndicated story and weighted once in ACH scoring.
+NEAR_DUPLICATE_THRESHOLD = 0.5
+
+# Likelihood ratio P(evidence | H) / P(evidence | not H) for a supporting item of each
+# quality grade; refuting items use the reciprocal.
+ACH_LIKELIHOOD_RATIOS = {
+    "H": 4.0,
+    "M": 2.0,
+    "L": 1.25,
+}
@@ -0,0 +1,223 @@
+"""Warm ``GeoRiskAgent`` behind a Unix socket so CLI calls skip the cold start.
+
+The client parses arguments locally and sends the resulting namespace as one JSON line;
+the daemon runs the same ``cli.dispatch`` against its in-memory agent, captures what the
+command printed and sends it back. Commands that change state take an exclusive lock,
+so writes are applied one at a time while reads run concurrently from memory. Before each
+command the daemon stats the agent's store files and reloads the agent if another process
+(a ``--local`` run, a cron job) has written one since its last look.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from rich.console import Console
+
+from agent_geo.agent import GeoRiskAgent
+
+# File arguments are resolved against the client's working directory before sending.
+_PATH_ARGUMENTS = ("path", "output")
+
+_WRITE_COMMANDS = {
+    ("panel", "update"),
+    ("panel", "import"),
+    ("ach", "add"),
+    ("ach", "recompute"),
+    ("forecast", "add"),
+    ("forecast", "close"),
+    ("forecast", "pool-ingest"),
+    ("alert", "set"),
+    ("alert", "stream"),
+    ("evidence", "rehash"),
+    ("ooda", "run"),
+}
+# Writes that rewrite a store behind the agent's back: reload before the next command.
+_RELOAD_COMMANDS = {("evidence", "rehash")}
+
+
+def is_write(args: argparse.Namespace) -> bool:
+    sub = getattr(args, f"{args.command}_command", None)
+    if (args.command, sub) in _WRITE_COMMANDS:
+        return True
+    if args.command == "ach" and sub == "suggest":
+        return bool(getattr(args, "apply", False))
+    if args.command == "ach" and sub == "questions":
+        return bool(getattr(args, "new", None))
+    return False
+
+
+class ReadWriteLock:
+    """Many readers or one writer; a waiting writer blocks new readers."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class DaemonUnavailable(OSError):
+    """The socket exists but nothing accepts connections on it (e.g. after a crash)."""
+
+
+class AgentDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, agent: GeoRiskAgent | None = None) -> None:
+        self.socket_path = socket_path
+        self.agent = agent or GeoRiskAgent()
+        self.lock = ReadWriteLock()
+        self._stamp = self.agent.state_stamp()
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def refresh(self) -> None:
+        """Reload the agent if a store file changed since the daemon last loaded or wrote it."""
+
+        if self.agent.state_stamp() == self._stamp:
+            return
+        with self.lock.write():
+            stamp = self.agent.state_stamp()
+            if stamp != self._stamp:
+                self.agent = GeoRiskAgent()
+                self._stamp = stamp
+
+    def execute(self, payload: dict) -> dict:
+        from agent_geo.cli import console, dispatch
+
+        args = argparse.Namespace(**payload["args"])
+        if args.command in (None, "serve", "api"):
+            return {"ok": False, "output": "", "error": f"Command not available via daemon: {args.command}"}
+        buffer = io.StringIO()
+        target = Console(
+            file=buffer,
+            width=payload.get("width") or 100,
+            force_terminal=bool(payload.get("color")),
+            color_system="truecolor" if payload.get("color") else None,
+        )
+        write = is_write(args)
+        try:
+            self.refresh()
+            with self.lock.write() if write else self.lock.read(), console.redirect(target):
+                try:
+                    dispatch(self.agent, args)
+                finally:
+                    if write:
+                        reload = (args.command, getattr(args, f"{args.command}_command", None)) in _RELOAD_COMMANDS
+                        self._stamp = None if reload else self.agent.state_stamp()
+        except Exception as exc:  # report to the client instead of killing the worker thread
+            return {"ok": False, "output": buffer.getvalue(), "error": f"{type(exc).__name__}: {exc}"}
+        return {"ok": True, "output": buffer.getvalue()}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: AgentDaemon
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            response = self.server.execute(json.loads(line))
+        except (ValueError, TypeError, KeyError) as exc:
+            response = {"ok": False, "output": "", "error": f"Bad request: {exc}"}
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def serve(socket_path: Path | str) -> None:
+    path = Path(socket_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()  # stale socket from a daemon that did not shut down cleanly
+        else:
+            probe.close()
+            raise SystemExit(f"A daemon is already listening on {path}")
+    server = AgentDaemon(path)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    print(f"agent-geo daemon listening on {path} (pid {os.getpid()})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+def request(socket_path: Path | str, args: argparse.Namespace) -> int:
+    """Send one parsed command to the daemon, print its output and return an exit code.
+
+    Raises ``DaemonUnavailable`` if the connection is refused, before anything was sent,
+    so the caller can safely run the command in-process instead.
+    """
+
+    payload = dict(vars(args))
+    for name in _PATH_ARGUMENTS:
+        if payload.get(name):
+            payload[name] = str(Path(payload[name]).resolve())
+    message = {
+        "args": payload,
+        "width": os.get_terminal_size().columns if sys.stdout.isatty() else None,
+        "color": sys.stdout.isatty(),
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError as exc:
+            raise DaemonUnavailable(f"No daemon answering on {socket_path}: {exc}") from exc
+        client.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("rb") as reader:
+            response = json.loads(reader.readline())
+    sys.stdout.write(response.get("output", ""))
+    if not response.get("ok"):
+        print(response.get("error", "daemon error"), file=sys.stderr)
+        return 1
+    return 0
+
+
+__all__ = ["AgentDaemon", "DaemonUnavailable", "ReadWriteLock", "serve", "request", "is_write"]
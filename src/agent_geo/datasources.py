@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import json
+import threading
+import time
 from pathlib import Path
-from typing import List, Sequence
+from typing import Dict, Iterator, List, Sequence, Tuple
 
-from agent_geo.prompts import PROMPT_TEMPLATES
+from agent_geo.prompts import PROMPT_TEMPLATES, PromptTemplate
+from agent_geo.urls import canonical_url, host_of
 
 
 @dataclass(slots=True)
@@ -17,7 +20,7 @@ class DataSource:
     tags: List[str] = field(default_factory=list)
 
 
-_SOURCE_PATH = Path(__file__).resolve().parents[1] / "data" / "source_whitelist.json"
+_SOURCE_PATH = Path(__file__).resolve().parents[2] / "data" / "source_whitelist.json"
 
 
 def load_sources(path: Path | None = None) -> List[DataSource]:
@@ -30,8 +33,163 @@ def load_sources(path: Path | None = None) -> List[DataSource]:
     return [DataSource(**record) for record in records]
 
 
+@dataclass(frozen=True, slots=True)
+class _Indexes:
+    sources: Tuple[DataSource, ...]
+    by_name: Dict[str, DataSource]
+    by_tag: Dict[str, Tuple[DataSource, ...]]
+    by_category: Dict[str, Tuple[DataSource, ...]]
+    by_host: Dict[str, Tuple[DataSource, ...]]
+    by_url: Dict[str, DataSource]
+    by_prompt: Dict[str, Tuple[DataSource, ...]]
+    missing_prompt_urls: Tuple[str, ...]
+
+
+def _group(pairs: Sequence[Tuple[str, DataSource]]) -> Dict[str, Tuple[DataSource, ...]]:
+    grouped: Dict[str, List[DataSource]] = {}
+    for key, source in pairs:
+        grouped.setdefault(key, []).append(source)
+    return {key: tuple(items) for key, items in grouped.items()}
+
+
+def _build_indexes(sources: Sequence[DataSource], templates: Sequence[PromptTemplate]) -> _Indexes:
+    by_url = {}
+    for source in sources:
+        by_url.setdefault(canonical_url(source.url), source)
+    by_prompt = {
+        template.key: tuple(
+            by_url[url] for url in dict.fromkeys(map(canonical_url, template.default_source_hints)) if url in by_url
+        )
+        for template in templates
+    }
+    missing = sorted(
+        {url for template in templates for url in template.default_source_hints if canonical_url(url) not in by_url}
+    )
+    return _Indexes(
+        sources=tuple(sources),
+        by_name={source.name: source for source in sources},
+        by_tag=_group([(tag, source) for source in sources for tag in source.tags]),
+        by_category=_group([(source.category, source) for source in sources]),
+        by_host=_group([(host_of(source.url), source) for source in sources]),
+        by_url=by_url,
+        by_prompt=by_prompt,
+        missing_prompt_urls=tuple(missing),
+    )
+
+
+class SourceRegistry:
+    """The source whitelist with precomputed lookups, reloaded when the file changes.
+
+    Indexes map tag, category, canonical host, canonical URL and prompt key to sources,
+    so every lookup is a dict access. On a lookup, the file's mtime is checked at most
+    once per ``check_interval`` seconds. When it has changed, a fresh set of indexes is
+    built and swapped in with a single assignment, so readers on other threads see the
+    old or the new whitelist, never a mix. A file that fails to parse keeps the
+    previous indexes.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        *,
+        templates: Sequence[PromptTemplate] = PROMPT_TEMPLATES,
+        check_interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path) if path else _SOURCE_PATH
+        self.templates = list(templates)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime: int | None = None
+        self._checked = 0.0
+        self._indexes = self._load()
+
+    def _load(self) -> _Indexes:
+        try:
+            mtime = self.path.stat().st_mtime_ns  # read before the file so no edit is missed
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Source whitelist not found at {self.path}") from None
+        indexes = _build_indexes(load_sources(self.path), self.templates)
+        self._mtime = mtime
+        return indexes
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Reload if the whitelist changed on disk; returns True when indexes were rebuilt."""
+
+        with self._lock:
+            self._checked = time.monotonic()
+            try:
+                changed = force or self.path.stat().st_mtime_ns != self._mtime
+                if changed:
+                    self._indexes = self._load()
+            except (OSError, ValueError, TypeError):
+                return False
+            return changed
+
+    @property
+    def indexes(self) -> _Indexes:
+        if time.monotonic() - self._checked >= self.check_interval:
+            self.refresh()
+        return self._indexes
+
+    def __len__(self) -> int:
+        return len(self.indexes.sources)
+
+    def __iter__(self) -> Iterator[DataSource]:
+        return iter(self.indexes.sources)
+
+    @property
+    def sources(self) -> List[DataSource]:
+        return list(self.indexes.sources)
+
+    def get(self, name: str) -> DataSource | None:
+        return self.indexes.by_name.get(name)
+
+    def by_tag(self, tag: str) -> Tuple[DataSource, ...]:
+        return self.indexes.by_tag.get(tag, ())
+
+    def by_category(self, category: str) -> Tuple[DataSource, ...]:
+        return self.indexes.by_category.get(category, ())
+
+    def by_host(self, host: str) -> Tuple[DataSource, ...]:
+        return self.indexes.by_host.get(host_of(f"https://{host}"), ())
+
+    def by_prompt(self, key: str) -> Tuple[DataSource, ...]:
+        return self.indexes.by_prompt.get(key, ())
+
+    def tags(self) -> List[str]:
+        return sorted(self.indexes.by_tag)
+
+    def categories(self) -> List[str]:
+        return list(self.indexes.by_category)
+
+    def lookup(self, url: str) -> Tuple[DataSource, ...]:
+        """Sources for an evidence URL: the exact canonical URL, else its host or a parent domain.
+
+        ``www3.nhk.or.jp`` falls back to ``nhk.or.jp``, so the cost is one dict access
+        per host label, not per source.
+        """
+
+        indexes = self.indexes
+        canonical = canonical_url(str(url))
+        exact = indexes.by_url.get(canonical)
+        if exact is not None:
+            return (exact,)
+        host = host_of(canonical)
+        while host:
+            found = indexes.by_host.get(host)
+            if found:
+                return found
+            _, _, host = host.partition(".")
+            if "." not in host:
+                break
+        return ()
+
+    def missing_prompt_sources(self) -> List[str]:
+        return list(self.indexes.missing_prompt_urls)
+
+
 def list_sources() -> List[DataSource]:
-    return SOURCE_WHITELIST
+    return REGISTRY.sources
 
 
 def known_urls(sources: Sequence[DataSource] | None = None) -> set[str]:
@@ -49,16 +207,21 @@ def prompt_hint_urls() -> set[str]:
 def missing_prompt_sources(sources: Sequence[DataSource] | None = None) -> List[str]:
     """Return prompt default URLs that have not yet been added to the whitelist."""
 
+    if sources is None:
+        return REGISTRY.missing_prompt_sources()
     known = known_urls(sources)
     missing = sorted(prompt_hint_urls() - known)
     return missing
 
 
-SOURCE_WHITELIST = load_sources()
+REGISTRY = SourceRegistry()
+SOURCE_WHITELIST = REGISTRY.sources  # snapshot at import; use ``REGISTRY`` to follow edits
 
 
 __all__ = [
     "DataSource",
+    "SourceRegistry",
+    "REGISTRY",
     "SOURCE_WHITELIST",
     "load_sources",
     "list_sources",
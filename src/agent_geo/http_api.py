@@ -0,0 +1,291 @@
+"""Read-only JSON HTTP API over ``GeoRiskAgent`` built on ``asyncio`` streams.
+
+Endpoints (all ``GET``)::
+
+    /panel                    panel rows
+    /panel/scores             composite dimension scores
+    /forecasts?as_of=ISO      forecast ledger rows
+    /ach?question=TEXT        ACH table with matrix assessment
+    /alerts                   entrapment signal summary and red-line state
+    /prompts                  template index
+    /prompts/{key}?source=URL prompt bundle (``source`` repeatable)
+    /search?q=TEXT&limit=N    live web search (never cached)
+    /metrics                  profiling spans in Prometheus text format (``--profile``)
+
+Read responses carry a strong ``ETag`` (SHA-256 of the body) and are cached per route and
+the query parameters that route reads, in an LRU of ``_CACHE_ENTRIES`` bodies, so unused
+parameters cannot grow the cache; ``If-None-Match`` hits return ``304`` without
+recomputing anything. Request bodies are refused: ``400`` on ``GET``/``HEAD``, ``413``
+above ``_MAX_BODY_BYTES``. Every request
+stats the agent's store files first: when another process (the CLI, the daemon, ``ooda
+run``) has written one, the agent is reloaded from disk and the cache dropped, so neither
+bodies nor ETags outlive the data they were built from. Each connection is served by its
+own task and agent calls run in worker threads, so slow endpoints (search) do not stall
+the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+from agent_geo import profiling
+from agent_geo.agent import GeoRiskAgent
+from agent_geo.pipelines.forecast_tracker import parse_as_of
+
+Query = Dict[str, List[str]]
+Handler = Callable[[Query], object]
+_MAX_HEADER_LINES = 100
+_MAX_BODY_BYTES = 64 << 10
+_CACHE_ENTRIES = 256
+
+
+class NotFound(Exception):
+    pass
+
+
+class AgentHTTPAPI:
+    def __init__(
+        self,
+        agent: GeoRiskAgent | None = None,
+        *,
+        factory: Callable[[], GeoRiskAgent] = GeoRiskAgent,
+    ) -> None:
+        self.agent = agent or factory()
+        self._factory = factory
+        self._stamp = self.agent.state_stamp()
+        self._reload_lock = asyncio.Lock()
+        self._cache: OrderedDict[str, Tuple[str, bytes]] = OrderedDict()
+        # path -> (handler, query parameters the handler reads)
+        self._routes: Dict[str, Tuple[Handler, Tuple[str, ...]]] = {
+            "/panel": (lambda query: self.agent.panel_rows(), ()),
+            "/panel/scores": (lambda query: self.agent.panel_scores(), ()),
+            "/forecasts": (self._forecasts, ("as_of",)),
+            "/ach": (self._ach, ("question",)),
+            "/alerts": (self._alerts, ()),
+            "/prompts": (self._prompts, ()),
+        }
+
+    def invalidate(self) -> None:
+        """Drop cached bodies and reload the agent on the next request."""
+
+        self._cache.clear()
+        self._stamp = None
+
+    async def _refresh(self) -> None:
+        """Reload the agent and drop the cache if a store file changed on disk."""
+
+        if self.agent.state_stamp() == self._stamp:
+            return
+        async with self._reload_lock:
+            stamp = self.agent.state_stamp()
+            if stamp == self._stamp:
+                return
+            # Stamp first: a write landing during the reload triggers another one next time.
+            self.agent = await asyncio.to_thread(self._factory)
+            self._cache.clear()
+            self._stamp = stamp
+            profiling.count("api.reloads")
+
+    # -- endpoint bodies -------------------------------------------------------------
+
+    def _forecasts(self, query: Query) -> object:
+        as_of = query.get("as_of", [None])[0]
+        return self.agent.forecast_rows(parse_as_of(as_of) if as_of else None)
+
+    def _ach(self, query: Query) -> object:
+        question = query.get("question", [None])[0]
+        try:
+            table = self.agent.get_ach_table(question)
+        except KeyError:
+            raise NotFound(f"Unknown ACH question: {question}") from None
+        payload = table.model_dump(mode="json")
+        payload["assessment"] = self.agent.ach.assessment(table.question)
+        return payload
+
+    def _alerts(self, query: Query) -> object:
+        monitor = self.agent.alerts
+        return {
+            "red": monitor.is_red(),
+            "red_since": monitor.red_since.isoformat() if monitor.red_since else None,
+            "signals": monitor.summary(),
+        }
+
+    def _prompts(self, query: Query) -> object:
+        return [
+            {"key": template.key, "title": template.title, "description": template.description}
+            for template in self.agent.prompts()
+        ]
+
+    def _prompt(self, key: str, query: Query) -> object:
+        try:
+            return self.agent.prompt_messages(key, source_urls=query.get("source"))
+        except KeyError:
+            raise NotFound(f"Unknown prompt template: {key}") from None
+
+    def _search(self, query: Query) -> object:
+        text = query.get("q", [""])[0]
+        if not text:
+            raise ValueError("missing q")
+        limit = int(query.get("limit", ["5"])[0])
+        return [
+            {"title": result.title, "url": result.url, "snippet": result.snippet, "source": result.source}
+            for result in self.agent.websearch.search(text)[:limit]
+        ]
+
+    def _resolve(self, path: str) -> Tuple[Handler, Tuple[str, ...] | None]:
+        """Return ``(handler, parameters)`` for a request path; ``None`` parameters: never cached."""
+
+        if path in self._routes:
+            return self._routes[path]
+        if path.startswith("/prompts/"):
+            key = unquote(path[len("/prompts/") :])
+            return (lambda query: self._prompt(key, query)), ("source",)
+        if path == "/search":
+            return self._search, None
+        raise NotFound(f"No route for {path}")
+
+    # -- HTTP plumbing ---------------------------------------------------------------
+
+    async def respond(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Status, headers and the GET body; ``handle`` omits the body for ``HEAD``."""
+
+        if method not in ("GET", "HEAD"):
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED, "read-only API", {"Allow": "GET, HEAD"})
+        parts = urlsplit(target)
+        if parts.path == "/metrics":
+            body = profiling.prometheus().encode("utf-8")
+            return HTTPStatus.OK, {"Content-Type": "text/plain; version=0.0.4"}, body
+        query = parse_qs(parts.query)
+        path = parts.path.rstrip("/") or "/"
+        try:
+            await self._refresh()
+            handler, parameters = self._resolve(path)
+            cacheable = parameters is not None
+            key = _cache_key(path, parameters, query) if cacheable else ""
+            cached = self._cache.get(key) if cacheable else None
+            if cached is not None:
+                self._cache.move_to_end(key)
+            else:
+                agent, stamp = self.agent, self._stamp
+                payload = await asyncio.to_thread(handler, query)
+                body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+                cached = (f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+                # A reload while the handler ran means the body may come from the old agent:
+                # serve it this once, but do not cache it under the new stamp.
+                if cacheable and self.agent is agent and self._stamp == stamp:
+                    self._cache[key] = cached
+                    if len(self._cache) > _CACHE_ENTRIES:
+                        self._cache.popitem(last=False)
+        except NotFound as exc:
+            return _error(HTTPStatus.NOT_FOUND, str(exc))
+        except ValueError as exc:
+            return _error(HTTPStatus.BAD_REQUEST, str(exc))
+        except Exception as exc:  # keep the connection and server alive on handler bugs
+            return _error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}")
+        etag, body = cached
+        response_headers = {"Content-Type": "application/json; charset=utf-8"}
+        if cacheable:
+            response_headers["ETag"] = etag
+            response_headers["Cache-Control"] = "no-cache"
+            if etag in _etags(headers.get("if-none-match", "")):
+                return HTTPStatus.NOT_MODIFIED, response_headers, b""
+        return HTTPStatus.OK, response_headers, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await _write(writer, *_error(HTTPStatus.BAD_REQUEST, "malformed request line"), keep_alive=False)
+                    break
+                headers: Dict[str, str] = {}
+                for _ in range(_MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0 or (length and method in ("GET", "HEAD")):
+                    await _write(writer, *_error(HTTPStatus.BAD_REQUEST, "unexpected request body"), keep_alive=False)
+                    break
+                if length > _MAX_BODY_BYTES:
+                    too_large = _error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"body over {_MAX_BODY_BYTES} bytes")
+                    await _write(writer, *too_large, keep_alive=False)
+                    break
+                if length:
+                    await reader.readexactly(length)
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+                status, response_headers, body = await self.respond(method, target, headers)
+                await _write(writer, status, response_headers, body, keep_alive=keep_alive, head=method == "HEAD")
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def _cache_key(path: str, parameters: Tuple[str, ...], query: Query) -> str:
+    """Route plus only the query parameters its handler reads, in a fixed order."""
+
+    return f"{path}?{urlencode([(name, value) for name in parameters for value in query.get(name, [])])}"
+
+
+def _etags(header: str) -> List[str]:
+    return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+
+
+def _error(status: HTTPStatus, message: str, extra: Dict[str, str] | None = None) -> Tuple[int, Dict[str, str], bytes]:
+    headers = {"Content-Type": "application/json; charset=utf-8", **(extra or {})}
+    return status, headers, json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+
+
+async def _write(
+    writer: asyncio.StreamWriter,
+    status: int,
+    headers: Dict[str, str],
+    body: bytes,
+    *,
+    keep_alive: bool,
+    head: bool = False,
+) -> None:
+    """Send one response; for ``HEAD`` the length is the GET body's but the body is not sent."""
+
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    lines.append(f"Content-Length: {len(body)}")
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (b"" if head else body))
+    await writer.drain()
+
+
+def run(host: str = "127.0.0.1", port: int = 8765, agent: GeoRiskAgent | None = None) -> None:
+    api = AgentHTTPAPI(agent)
+    print(f"agent-geo API on http://{host}:{port}", flush=True)
+    try:
+        asyncio.run(api.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+
+
+__all__ = ["AgentHTTPAPI", "run"]
@@ -1,15 +1,20 @@
-from .indicator import IndicatorRecord, IndicatorStatus
-from .ach import ACHTable, ACHEntry
+from .indicator import IndicatorHistoryEntry, IndicatorRecord, IndicatorStatus
+from .ach import ACHTable, ACHEntry, ACHObservation
 from .forecast import ForecastEvent
-from .alert import EntrapmentSignalStatus
+from .alert import AlertEvent, EntrapmentSignalStatus
 from .evidence import EvidenceRecord
+from .evidence_table import EvidenceTable
 
 __all__ = [
     "IndicatorRecord",
     "IndicatorStatus",
+    "IndicatorHistoryEntry",
     "ACHTable",
     "ACHEntry",
+    "ACHObservation",
     "ForecastEvent",
     "EntrapmentSignalStatus",
+    "AlertEvent",
     "EvidenceRecord",
+    "EvidenceTable",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List
+from datetime import datetime
+from typing import Dict, Iterable, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +14,9 @@ class ACHEntry(BaseModel):
     supports: List[EvidenceRecord] = Field(default_factory=list)
     refutes: List[EvidenceRecord] = Field(default_factory=list)
     net_assessment: int = 0  # +1 support heavy, -1 refute heavy
+    weighted_score: float = 0.0  # quality- and diagnosticity-weighted consistency
+    probability: Optional[float] = None  # normalised across the table's hypotheses
+    posterior: Optional[float] = None  # Bayesian posterior from the evidence log
     confidence: str = "M"
     key_gaps: List[str] = Field(default_factory=list)
     next_collection: List[str] = Field(default_factory=list)
@@ -24,10 +28,23 @@ class ACHEntry(BaseModel):
 class ACHTable(BaseModel):
     question: str = ACH_QUESTION
     entries: List[ACHEntry] = Field(default_factory=list)
+    stories: Dict[str, str] = Field(default_factory=dict)  # evidence key -> story ID it was clustered into
 
     @classmethod
-    def bootstrap(cls) -> "ACHTable":
-        return cls(entries=[ACHEntry(hypothesis=h) for h in ACH_HYPOTHESES])
+    def bootstrap(cls, question: str = ACH_QUESTION, hypotheses: Iterable[str] = ACH_HYPOTHESES) -> "ACHTable":
+        return cls(question=question, entries=[ACHEntry(hypothesis=h) for h in hypotheses])
 
 
-__all__ = ["ACHEntry", "ACHTable"]
+class ACHObservation(BaseModel):
+    """One line of the ACH evidence log: an evidence item assessed against a hypothesis."""
+
+    question: str = ACH_QUESTION
+    hypothesis: str
+    kind: Literal["support", "refute"]
+    evidence: EvidenceRecord
+    recorded_at: datetime = Field(default_factory=datetime.utcnow)
+    retracted: bool = False  # True when an earlier assessment is withdrawn
+    story: Optional[str] = None  # NearDuplicateIndex cluster ID; copies of one story share it
+
+
+__all__ = ["ACHEntry", "ACHObservation", "ACHTable"]
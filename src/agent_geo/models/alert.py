@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -11,9 +11,21 @@ from agent_geo.models.evidence import EvidenceRecord
 class EntrapmentSignalStatus(BaseModel):
     key: str
     active: bool = False
+    evidence: List[EvidenceRecord] = Field(default_factory=list)  # latest items only; the event log has all
+    evidence_total: int = 0  # items ever attached, including those dropped from ``evidence``
+    last_checked: datetime = Field(default_factory=datetime.utcnow)
+    activated_at: Optional[datetime] = None  # start of the current active spell
+    notes: str | None = None
+
+
+class AlertEvent(BaseModel):
+    """One entry of the append-only alert log; replaying the log rebuilds every status."""
+
+    key: str
+    active: bool
+    at: datetime = Field(default_factory=datetime.utcnow)
     evidence: List[EvidenceRecord] = Field(default_factory=list)
-    last_checked: datetime = datetime.utcnow()
     notes: str | None = None
 
 
-__all__ = ["EntrapmentSignalStatus"]
+__all__ = ["AlertEvent", "EntrapmentSignalStatus"]
@@ -1,10 +1,43 @@
 from __future__ import annotations
 
+import unicodedata
 from datetime import datetime
 from hashlib import sha256
-from typing import Optional
+from typing import Iterable, List, Mapping, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, HttpUrl, model_validator
+
+from agent_geo.urls import canonical_url
+
+
+def _normalise_text(value: str | None) -> str:
+    # NFKC folds full-width/half-width variants common in Japanese and Chinese sources.
+    return " ".join(unicodedata.normalize("NFKC", value or "").split())
+
+
+def content_hash(title: str | None, source: str | None, quote: str | None, url: object) -> str:
+    """SHA-256 of the normalised title, source, quote and canonical URL.
+
+    Whitespace and Unicode width variants are folded and the URL goes through
+    ``canonical_url``, so the same article reached via a tracking, AMP or mobile link
+    gets the same identity.
+    """
+
+    fingerprint = "|".join(
+        [_normalise_text(title), _normalise_text(source), _normalise_text(quote), canonical_url(str(url or ""))]
+    )
+    return sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+def content_hashes(rows: Iterable[Mapping]) -> List[str]:
+    """``content_hash`` for many ``EvidenceRecord``-shaped dicts (e.g. raw log lines).
+
+    Rows are hashed one at a time; ``canonical_url`` is cached, so repeated URLs are
+    parsed once. Parallelism for bulk backfills comes from ``evidence_rehash``'s process
+    pool, not from this function.
+    """
+
+    return [content_hash(row.get("title"), row.get("source"), row.get("quote"), row.get("url")) for row in rows]
 
 
 class EvidenceRecord(BaseModel):
@@ -16,21 +49,25 @@ class EvidenceRecord(BaseModel):
     quality: str = "L"
     created_at: datetime = Field(default_factory=datetime.utcnow)
     hash: str | None = None
+    tags: List[str] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def ensure_hash(self) -> "EvidenceRecord":
+        # An explicit hash is the record's stored identity and is kept as is; rewrite old
+        # logs with ``agent-geo evidence rehash``.
+        if not self.hash:
+            self.hash = content_hash(self.title, self.source, self.quote, self.url)
+        return self
+
+    @property
+    def canonical_url(self) -> str:
+        return canonical_url(str(self.url))
+
+
+def evidence_text(evidence: EvidenceRecord) -> str:
+    """Title and quote, the text that taggers, classifiers and clustering look at."""
+
+    return f"{evidence.title}\n{evidence.quote}"
+
 
-    @field_validator("hash", mode="before")
-    @classmethod
-    def ensure_hash(cls, value, values):  # type: ignore[override]
-        if value:
-            return value
-        fingerprint = "|".join(
-            [
-                values.get("title", ""),
-                (values.get("source") or ""),
-                (values.get("quote") or ""),
-                str(values.get("url") or ""),
-            ]
-        )
-        return sha256(fingerprint.encode("utf-8")).hexdigest()
-
-
-__all__ = ["EvidenceRecord"]
+__all__ = ["EvidenceRecord", "content_hash", "content_hashes", "evidence_text"]
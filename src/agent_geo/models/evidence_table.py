@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from agent_geo.models.evidence import EvidenceRecord
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_URL_PREFIX = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://[^/?#]*")
+_DIGEST = np.dtype((np.void, 32))
+_NAT = np.iinfo(np.int64).min  # same bit pattern as numpy's NaT for datetime64
+
+
+def _epoch_us(value: datetime | str | None) -> int:
+    if value is None:
+        return _NAT
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: int) -> datetime | None:
+    return None if value == _NAT else _EPOCH + timedelta(microseconds=int(value))
+
+
+def _split_url(url: str) -> tuple[str, str]:
+    """``("scheme://host[:port]", rest)``; the prefix is what gets interned."""
+
+    match = _URL_PREFIX.match(url)
+    return (url[: match.end()], url[match.end() :]) if match else ("", url)
+
+
+class _Interner:
+    __slots__ = ("ids", "values")
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __call__(self, value: str) -> int:
+        found = self.ids.get(value)
+        if found is None:
+            found = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return found
+
+
+class PackedStrings:
+    """Immutable list of strings stored as one UTF-8 buffer plus ``int64`` offsets."""
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, data: bytes, offsets: np.ndarray) -> None:
+        self.data = data
+        self.offsets = _frozen(offsets)
+
+    @classmethod
+    def build(cls, values: Iterable[str]) -> "PackedStrings":
+        buffer = bytearray()
+        ends = [0]
+        for value in values:
+            buffer += value.encode("utf-8")
+            ends.append(len(buffer))
+        return cls(bytes(buffer), np.asarray(ends, dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.nbytes
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class EvidenceTable:
+    """Read-only struct-of-arrays view of an evidence corpus.
+
+    Titles, quotes and URL paths live in packed UTF-8 buffers; sources, qualities, URL
+    hosts (``scheme://host``) and tags are interned into small vocabularies referenced by
+    integer codes; dates are ``int64`` microseconds since the epoch (``NaT`` when
+    missing, so ``dates`` is a ``datetime64[us]`` view) and hashes are 32 raw bytes per
+    row. A row costs roughly its text bytes plus ~60 bytes instead of a few KB per
+    ``EvidenceRecord``; ``record(i)`` / ``to_records()`` rebuild models on demand.
+    Aware datetimes are stored as naive UTC.
+    """
+
+    __slots__ = (
+        "titles",
+        "quotes",
+        "paths",
+        "sources",
+        "source_ids",
+        "hosts",
+        "host_ids",
+        "qualities",
+        "quality_ids",
+        "date_us",
+        "created_us",
+        "digests",
+        "has_hash",
+        "tags",
+        "tag_offsets",
+        "tag_ids",
+        "_order",
+        "_sorted",
+    )
+
+    def __init__(
+        self,
+        *,
+        titles: PackedStrings,
+        quotes: PackedStrings,
+        paths: PackedStrings,
+        sources: Sequence[str],
+        source_ids: np.ndarray,
+        hosts: Sequence[str],
+        host_ids: np.ndarray,
+        qualities: Sequence[str],
+        quality_ids: np.ndarray,
+        date_us: np.ndarray,
+        created_us: np.ndarray,
+        digests: np.ndarray,
+        has_hash: np.ndarray,
+        tags: Sequence[str],
+        tag_offsets: np.ndarray,
+        tag_ids: np.ndarray,
+    ) -> None:
+        self.titles = titles
+        self.quotes = quotes
+        self.paths = paths
+        self.sources = tuple(sources)
+        self.source_ids = _frozen(source_ids)
+        self.hosts = tuple(hosts)
+        self.host_ids = _frozen(host_ids)
+        self.qualities = tuple(qualities)
+        self.quality_ids = _frozen(quality_ids)
+        self.date_us = _frozen(date_us)
+        self.created_us = _frozen(created_us)
+        self.digests = _frozen(digests)
+        self.has_hash = _frozen(has_hash)
+        self.tags = tuple(tags)
+        self.tag_offsets = _frozen(tag_offsets)
+        self.tag_ids = _frozen(tag_ids)
+        self._order: np.ndarray | None = None
+        self._sorted: np.ndarray | None = None
+
+    # -- construction ----------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping]) -> "EvidenceTable":
+        """Build from ``EvidenceRecord``-shaped dicts (e.g. raw evidence-log lines)."""
+
+        titles, quotes, paths = bytearray(), bytearray(), bytearray()
+        title_ends, quote_ends, path_ends = [0], [0], [0]
+        sources, hosts, qualities, tags = _Interner(), _Interner(), _Interner(), _Interner()
+        source_ids: List[int] = []
+        host_ids: List[int] = []
+        quality_ids: List[int] = []
+        dates: List[int] = []
+        created: List[int] = []
+        digests = bytearray()
+        has_hash: List[bool] = []
+        tag_ends = [0]
+        tag_ids: List[int] = []
+        for row in rows:
+            titles += row["title"].encode("utf-8")
+            title_ends.append(len(titles))
+            quotes += row["quote"].encode("utf-8")
+            quote_ends.append(len(quotes))
+            prefix, path = _split_url(str(row["url"]))
+            paths += path.encode("utf-8")
+            path_ends.append(len(paths))
+            host_ids.append(hosts(prefix))
+            source_ids.append(sources(row["source"]))
+            quality_ids.append(qualities(row.get("quality") or "L"))
+            dates.append(_epoch_us(row.get("date")))
+            created.append(_epoch_us(row.get("created_at")))
+            digest = _digest(row.get("hash"))
+            has_hash.append(digest is not None)
+            digests += digest or bytes(32)
+            tag_ids.extend(tags(tag) for tag in row.get("tags") or ())
+            tag_ends.append(len(tag_ids))
+        return cls(
+            titles=PackedStrings(bytes(titles), np.asarray(title_ends, dtype=np.int64)),
+            quotes=PackedStrings(bytes(quotes), np.asarray(quote_ends, dtype=np.int64)),
+            paths=PackedStrings(bytes(paths), np.asarray(path_ends, dtype=np.int64)),
+            sources=sources.values,
+            source_ids=np.asarray(source_ids, dtype=_code_dtype(len(sources.values))),
+            hosts=hosts.values,
+            host_ids=np.asarray(host_ids, dtype=_code_dtype(len(hosts.values))),
+            qualities=qualities.values,
+            quality_ids=np.asarray(quality_ids, dtype=np.uint8 if len(qualities.values) < 256 else np.uint16),
+            date_us=np.asarray(dates, dtype=np.int64),
+            created_us=np.asarray(created, dtype=np.int64),
+            digests=np.frombuffer(bytes(digests), dtype=np.uint8).reshape(-1, 32),
+            has_hash=np.asarray(has_hash, dtype=bool),
+            tags=tags.values,
+            tag_offsets=np.asarray(tag_ends, dtype=np.int64),
+            tag_ids=np.asarray(tag_ids, dtype=_code_dtype(len(tags.values))),
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[EvidenceRecord]) -> "EvidenceTable":
+        return cls.from_rows(
+            {
+                "title": record.title,
+                "quote": record.quote,
+                "url": str(record.url),
+                "source": record.source,
+                "quality": record.quality,
+                "date": record.date,
+                "created_at": record.created_at,
+                "hash": record.hash,
+                "tags": record.tags,
+            }
+            for record in records
+        )
+
+    @classmethod
+    def from_jsonl(cls, path: Path | str) -> "EvidenceTable":
+        """Stream an evidence log into a table without building one model per line."""
+
+        with Path(path).open("rb") as fh:
+            return cls.from_rows(json.loads(line) for line in fh if line.strip())
+
+    # -- access ----------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.source_ids)
+
+    def url(self, row: int) -> str:
+        return self.hosts[self.host_ids[row]] + self.paths[row]
+
+    def hash(self, row: int) -> str | None:
+        return self.digests[row].tobytes().hex() if self.has_hash[row] else None
+
+    def row_tags(self, row: int) -> List[str]:
+        start, end = self.tag_offsets[row], self.tag_offsets[row + 1]
+        return [self.tags[i] for i in self.tag_ids[start:end]]
+
+    def record(self, row: int) -> EvidenceRecord:
+        row = int(row)
+        return EvidenceRecord.model_validate(
+            {
+                "title": self.titles[row],
+                "date": _from_epoch_us(self.date_us[row]),
+                "source": self.sources[self.source_ids[row]],
+                "quote": self.quotes[row],
+                "url": self.url(row),
+                "quality": self.qualities[self.quality_ids[row]],
+                "created_at": _from_epoch_us(self.created_us[row]),
+                "hash": self.hash(row),
+                "tags": self.row_tags(row),
+            }
+        )
+
+    def __getitem__(self, row: int) -> EvidenceRecord:
+        if not -len(self) <= row < len(self):
+            raise IndexError(row)
+        return self.record(row % len(self))
+
+    def __iter__(self) -> Iterator[EvidenceRecord]:
+        return (self.record(row) for row in range(len(self)))
+
+    def to_records(self, rows: Iterable[int] | None = None) -> List[EvidenceRecord]:
+        return [self.record(row) for row in (range(len(self)) if rows is None else rows)]
+
+    # -- analytics -------------------------------------------------------------------
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.date_us.view("datetime64[us]")
+
+    @property
+    def created(self) -> np.ndarray:
+        return self.created_us.view("datetime64[us]")
+
+    def source_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.source_ids, minlength=len(self.sources))
+        return {source: int(count) for source, count in zip(self.sources, counts)}
+
+    def host_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.host_ids, minlength=len(self.hosts))
+        return {urlsplit(host).netloc or host: int(count) for host, count in zip(self.hosts, counts)}
+
+    def tag_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.tag_ids, minlength=len(self.tags))
+        return {tag: int(count) for tag, count in zip(self.tags, counts)}
+
+    def where(
+        self,
+        *,
+        source: str | None = None,
+        host: str | None = None,
+        quality: str | None = None,
+        tag: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> np.ndarray:
+        """Row indices matching every given filter (``host`` is a bare hostname)."""
+
+        mask = np.ones(len(self), dtype=bool)
+        if source is not None:
+            mask &= _codes_equal(self.source_ids, self.sources, source)
+        if quality is not None:
+            mask &= _codes_equal(self.quality_ids, self.qualities, quality)
+        if host is not None:
+            wanted = [i for i, prefix in enumerate(self.hosts) if urlsplit(prefix).hostname == host.lower()]
+            mask &= np.isin(self.host_ids, wanted)
+        if tag is not None:
+            mask &= self._tag_mask(tag)
+        if since is not None:
+            mask &= self.date_us >= _epoch_us(since)
+        if until is not None:
+            mask &= (self.date_us < _epoch_us(until)) & (self.date_us != _NAT)
+        return np.flatnonzero(mask)
+
+    def _tag_mask(self, tag: str) -> np.ndarray:
+        mask = np.zeros(len(self), dtype=bool)
+        if tag not in self.tags:
+            return mask
+        hits = np.flatnonzero(self.tag_ids == self.tags.index(tag))
+        rows = np.searchsorted(self.tag_offsets, hits, side="right") - 1
+        mask[rows] = True
+        return mask
+
+    def find(self, digest: str) -> int | None:
+        """Row of the first record with this hex hash (binary search over sorted digests)."""
+
+        if self._order is None:
+            keys = np.ascontiguousarray(self.digests).view(_DIGEST).ravel()
+            self._order = _frozen(np.argsort(keys, kind="stable"))
+            self._sorted = _frozen(keys[self._order])
+        try:
+            raw = bytes.fromhex(digest)
+        except ValueError:
+            return None
+        if len(raw) != 32:
+            return None
+        probe = np.frombuffer(raw, dtype=_DIGEST)[0]
+        position = int(np.searchsorted(self._sorted, probe))
+        while position < len(self) and self._sorted[position] == probe:
+            row = int(self._order[position])
+            if self.has_hash[row]:
+                return row
+            position += 1
+        return None
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (
+            self.source_ids,
+            self.host_ids,
+            self.quality_ids,
+            self.date_us,
+            self.created_us,
+            self.digests,
+            self.has_hash,
+            self.tag_offsets,
+            self.tag_ids,
+        )
+        text = self.titles.nbytes + self.quotes.nbytes + self.paths.nbytes
+        vocab = sum(len(value.encode("utf-8")) for value in (*self.sources, *self.hosts, *self.qualities, *self.tags))
+        return text + vocab + sum(array.nbytes for array in arrays)
+
+
+def _digest(value: str | None) -> bytes | None:
+    if not value:
+        return None
+    try:
+        raw = bytes.fromhex(value)
+    except ValueError:
+        return None
+    return raw if len(raw) == 32 else None
+
+
+def _code_dtype(size: int) -> type:
+    return np.uint16 if size < (1 << 16) else np.uint32
+
+
+def _codes_equal(codes: np.ndarray, vocabulary: Sequence[str], value: str) -> np.ndarray:
+    if value not in vocabulary:
+        return np.zeros(len(codes), dtype=bool)
+    return codes == vocabulary.index(value)
+
+
+__all__ = ["EvidenceTable", "PackedStrings"]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Optional
+from bisect import insort
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 
 class ForecastEvent(BaseModel):
@@ -14,10 +15,34 @@ class ForecastEvent(BaseModel):
     brier: Optional[float] = None
     rationale: Optional[str] = None
     postmortem_link: Optional[HttpUrl] = None
+    tags: List[str] = Field(default_factory=list)
+    revisions: List[Tuple[datetime, float]] = Field(default_factory=list)  # (issued_at, p), oldest first
+    resolved_at: Optional[datetime] = None
 
-    def finalize(self, outcome: int) -> None:
+    @field_validator("revisions")
+    @classmethod
+    def check_revisions(cls, value: List[Tuple[datetime, float]]) -> List[Tuple[datetime, float]]:
+        for _, probability in value:
+            if not 0.0 <= probability <= 1.0:
+                raise ValueError(f"revision probability out of range: {probability}")
+        return sorted(value, key=lambda item: item[0])
+
+    def revise(self, probability: float, at: datetime | None = None) -> None:
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError(f"probability out of range: {probability}")
+        insort(self.revisions, (at or datetime.utcnow(), probability), key=lambda item: item[0])
+        self.probability = self.revisions[-1][1]
+
+    def score_month(self) -> str:
+        """Calendar month (YYYY-MM) the score is booked under: resolution month, else due month."""
+
+        when = self.resolved_at or self.due_date
+        return f"{when.year:04d}-{when.month:02d}"
+
+    def finalize(self, outcome: int, at: datetime | None = None) -> None:
         self.outcome = outcome
         self.brier = (self.probability - outcome) ** 2
+        self.resolved_at = at or datetime.utcnow()
 
 
 __all__ = ["ForecastEvent"]
@@ -4,9 +4,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 
 from agent_geo.config import IndicatorDimension, IndicatorTemplate
+from agent_geo.models.evidence import EvidenceRecord
 
 
 class IndicatorStatus(str, Enum):
@@ -38,4 +39,12 @@ class IndicatorRecord(BaseModel):
         )
 
 
-__all__ = ["IndicatorRecord", "IndicatorStatus"]
+class IndicatorHistoryEntry(BaseModel):
+    """One applied panel update: the indicator's full state right after the change."""
+
+    recorded_at: datetime = Field(default_factory=datetime.utcnow)
+    record: IndicatorRecord
+    evidence: Optional[EvidenceRecord] = None
+
+
+__all__ = ["IndicatorRecord", "IndicatorStatus", "IndicatorHistoryEntry"]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import types
+import typing
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, HttpUrl, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+_HTTP_URL = TypeAdapter(HttpUrl)
+_PLAIN = (str, int, float, bool, Any)
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Turn a JSON value into what validation would have produced; None means keep as is.
+
+    Only the types our models use are handled: scalars, ``datetime``/``date``, enums,
+    ``HttpUrl``, nested models, and lists, tuples, dicts and optionals of those.
+    """
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (typing.Union, types.UnionType):
+        inner = [_converter(arg) for arg in args if arg is not type(None)]
+        if len(inner) != 1:  # e.g. ``str | int``: nothing our stores write needs converting
+            return None
+        convert = inner[0]
+        return None if convert is None else (lambda value: None if value is None else convert(value))
+    if origin is typing.Literal or annotation in _PLAIN:
+        return None
+    if origin in (list, List):
+        convert = _converter(args[0]) if args else None
+        return None if convert is None else (lambda value: [convert(item) for item in value])
+    if origin in (tuple, Tuple):
+        converts = [_converter(arg) or (lambda item: item) for arg in args]
+        return lambda value: tuple(convert(item) for convert, item in zip(converts, value))
+    if origin in (dict, Dict):
+        convert = _converter(args[1]) if len(args) == 2 else None
+        return None if convert is None else (lambda value: {key: convert(item) for key, item in value.items()})
+    if annotation is datetime:
+        return datetime.fromisoformat
+    if annotation is date:
+        return date.fromisoformat
+    if annotation is HttpUrl:
+        return _HTTP_URL.validate_python
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return trusted_constructor(annotation)
+    raise TypeError(f"no trusted conversion for {annotation!r}")
+
+
+@lru_cache(maxsize=None)
+def trusted_constructor(model: Type[M]) -> Callable[[Dict[str, Any]], M]:
+    """Build ``model`` from a decoded JSON object without running validation.
+
+    Meant for bytes a store wrote itself and whose checksum still matches: field and
+    model validators do not run, and only the JSON-to-Python type conversions are done.
+    Objects carrying every field (all our stores write) get their ``__dict__`` set
+    directly, which is what ``model_construct`` does minus its per-field default lookup;
+    anything else goes through ``model_construct``.
+    """
+
+    converters = [
+        (name, convert) for name, field in model.model_fields.items() if (convert := _converter(field.annotation))
+    ]
+    names = frozenset(model.model_fields)
+    new = model.__new__
+    assign = object.__setattr__
+
+    def construct(data: Dict[str, Any]) -> M:
+        for name, convert in converters:
+            if name in data:
+                data[name] = convert(data[name])
+        if data.keys() != names:
+            return model.model_construct(**data)
+        instance = new(model)
+        assign(instance, "__dict__", data)
+        assign(instance, "__pydantic_fields_set__", set(names))
+        assign(instance, "__pydantic_extra__", None)
+        assign(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+__all__ = ["trusted_constructor"]
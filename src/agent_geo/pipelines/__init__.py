@@ -1,11 +1,36 @@
 from .indicator_panel import IndicatorPanelBuilder
+from .panel_scoring import PanelScorer
+from .panel_diff import PanelChangeSet
 from .ach_runner import ACHManager
+from .ach_matrix import ACHMatrix
+from .ach_bayes import ACHPosteriorEngine
+from .near_duplicates import NearDuplicateIndex
 from .forecast_tracker import ForecastTracker
+from .forecast_scoring import RevisionSeries
+from .forecast_pool import ForecastPool
 from .alert_monitor import AlertMonitor
+from .alert_rules import StreamingAlertEvaluator
+from .alert_latency import LatencyRecorder
+from .keyword_tagger import KeywordTagger
+from .evidence_rehash import RehashReport, rehash_evidence_log
+from .ooda import OODAScheduler
 
 __all__ = [
     "IndicatorPanelBuilder",
+    "PanelScorer",
+    "PanelChangeSet",
     "ACHManager",
+    "ACHMatrix",
+    "ACHPosteriorEngine",
+    "NearDuplicateIndex",
     "ForecastTracker",
+    "RevisionSeries",
+    "ForecastPool",
     "AlertMonitor",
+    "StreamingAlertEvaluator",
+    "LatencyRecorder",
+    "KeywordTagger",
+    "RehashReport",
+    "rehash_evidence_log",
+    "OODAScheduler",
 ]
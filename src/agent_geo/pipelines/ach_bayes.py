@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from agent_geo.config import ACH_HYPOTHESES, ACH_LIKELIHOOD_RATIOS, ACH_QUESTION
+from agent_geo.models.ach import ACHObservation, ACHTable
+from agent_geo.pipelines.ach_matrix import evidence_key
+from agent_geo.profiling import profiled
+from agent_geo.storage import ACHLogStore
+
+_DEFAULT_RATIO = min(ACH_LIKELIHOOD_RATIOS.values())
+# story -> (Σ log LR, copies) per hypothesis
+StorySums = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def log_likelihood_ratio(kind: str, quality: str) -> float:
+    ratio = ACH_LIKELIHOOD_RATIOS.get(quality.upper(), _DEFAULT_RATIO)
+    return math.log(ratio) if kind == "support" else -math.log(ratio)
+
+
+def _score_range(
+    path: str, start: int, end: int, hypotheses: Sequence[str], question: str
+) -> tuple[np.ndarray, np.ndarray, StorySums]:
+    """Sum log-likelihood ratios and net observation counts per hypothesis over one byte range.
+
+    Observations without a story go straight into the totals; the others are summed per
+    story, since a story's weight depends on copies that may sit in other ranges. Module-
+    level so it can run in a worker process. Lines are parsed with ``json`` only; the log
+    was written by ``ACHLogStore`` so full model validation is unnecessary here.
+    """
+
+    index = {hypothesis: i for i, hypothesis in enumerate(hypotheses)}
+    totals = np.zeros(len(hypotheses))
+    counts = np.zeros(len(hypotheses), dtype=np.int64)
+    stories: StorySums = {}
+    for line in ACHLogStore.read_range(path, start, end):
+        if not line.strip():
+            continue
+        payload = json.loads(line)
+        if payload.get("question", ACH_QUESTION) != question:
+            continue
+        position = index.get(payload["hypothesis"])
+        if position is None:
+            continue
+        ratio = log_likelihood_ratio(payload["kind"], payload["evidence"].get("quality", "L"))
+        step = -1 if payload.get("retracted") else 1
+        counts[position] += step
+        story = payload.get("story")
+        if story is None:
+            totals[position] += step * ratio
+            continue
+        sums = stories.get(story)
+        if sums is None:
+            sums = stories[story] = (np.zeros(len(hypotheses)), np.zeros(len(hypotheses), dtype=np.int64))
+        sums[0][position] += step * ratio
+        sums[1][position] += step
+    return totals, counts, stories
+
+
+class ACHPosteriorEngine:
+    """Log-odds posteriors over mutually exclusive ACH hypotheses.
+
+    Each observation multiplies the likelihood of its hypothesis by the quality-graded
+    ratio in ``ACH_LIKELIHOOD_RATIOS`` (or its reciprocal for refuting evidence).
+    Posteriors are the softmax of ``log_prior + Σ log LR``. Observations that carry a
+    ``story`` (a ``NearDuplicateIndex`` cluster ID) are weighted ``1/copies``: a story
+    contributes the mean log LR of its copies per hypothesis, so twenty syndicated
+    reprints count like one report. Because the evidence term is built from plain sums,
+    the log can be scored in independent chunks and the partial sums added, which is
+    what ``rebuild`` does across a process pool.
+    """
+
+    def __init__(
+        self,
+        hypotheses: Iterable[str] = ACH_HYPOTHESES,
+        *,
+        question: str = ACH_QUESTION,
+        priors: Sequence[float] | None = None,
+    ) -> None:
+        self.hypotheses: List[str] = list(hypotheses)
+        self.question = question
+        self._index: Dict[str, int] = {hypothesis: i for i, hypothesis in enumerate(self.hypotheses)}
+        if priors is None:
+            priors = [1.0 / len(self.hypotheses)] * len(self.hypotheses)
+        if len(priors) != len(self.hypotheses):
+            raise ValueError("priors must match the number of hypotheses")
+        self.log_prior = np.log(np.asarray(priors, dtype=np.float64))
+        self.log_evidence = np.zeros(len(self.hypotheses))
+        self.counts = np.zeros(len(self.hypotheses), dtype=np.int64)
+        self._stories: StorySums = {}
+
+    @property
+    def observations(self) -> int:
+        return int(self.counts.sum())
+
+    def reset(self) -> None:
+        self.log_evidence = np.zeros(len(self.hypotheses))
+        self.counts = np.zeros(len(self.hypotheses), dtype=np.int64)
+        self._stories = {}
+
+    def _story_sums(self, story: str) -> Tuple[np.ndarray, np.ndarray]:
+        sums = self._stories.get(story)
+        if sums is None:
+            size = len(self.hypotheses)
+            sums = self._stories[story] = (np.zeros(size), np.zeros(size, dtype=np.int64))
+        return sums
+
+    def _step(self, position: int, ratio: float, step: int, story: str | None) -> None:
+        self.counts[position] += step
+        if story is None:
+            self.log_evidence[position] += step * ratio
+            return
+        totals, copies = self._story_sums(story)
+        before = totals[position] / copies[position] if copies[position] else 0.0
+        totals[position] += step * ratio
+        copies[position] += step
+        if copies[position]:
+            after = totals[position] / copies[position]
+        else:
+            after = totals[position] = 0.0
+        self.log_evidence[position] += after - before
+
+    def _position(self, hypothesis: str) -> int:
+        try:
+            return self._index[hypothesis]
+        except KeyError:
+            raise KeyError(f"Unknown hypothesis: {hypothesis}") from None
+
+    def observe(self, hypothesis: str, kind: str, quality: str, story: str | None = None) -> None:
+        self._step(self._position(hypothesis), log_likelihood_ratio(kind, quality), 1, story)
+
+    def retract(self, hypothesis: str, kind: str, quality: str, story: str | None = None) -> None:
+        """Withdraw one earlier observation; refuses to take a hypothesis (or story) below zero."""
+
+        position = self._position(hypothesis)
+        if self.counts[position] <= 0:
+            raise ValueError(f"No observation left to retract for hypothesis: {hypothesis}")
+        if story is not None and (story not in self._stories or self._stories[story][1][position] <= 0):
+            raise ValueError(f"No observation of story {story} left to retract for hypothesis: {hypothesis}")
+        self._step(position, log_likelihood_ratio(kind, quality), -1, story)
+
+    def consistent_with(self, table: ACHTable) -> bool:
+        """True if every hypothesis holds as many observations as ``table`` has evidence items."""
+
+        expected = np.zeros(len(self.hypotheses), dtype=np.int64)
+        for entry in table.entries:
+            if entry.hypothesis in self._index:
+                expected[self._index[entry.hypothesis]] = len(entry.supports) + len(entry.refutes)
+        return bool(np.array_equal(self.counts, expected))
+
+    def observe_record(self, observation: ACHObservation) -> None:
+        if observation.question != self.question:
+            return
+        update = self.retract if observation.retracted else self.observe
+        update(observation.hypothesis, observation.kind, observation.evidence.quality, observation.story)
+
+    def load_table(self, table: ACHTable, stories: Mapping[str, str] | None = None) -> None:
+        """Seed from an ACH table; ``stories`` maps evidence keys to story IDs."""
+
+        self.reset()
+        for entry in table.entries:
+            if entry.hypothesis not in self._index:
+                continue
+            for kind, items in (("support", entry.supports), ("refute", entry.refutes)):
+                for evidence in items:
+                    story = stories.get(evidence_key(evidence)) if stories is not None else None
+                    self.observe(entry.hypothesis, kind, evidence.quality, story)
+
+    def posteriors(self) -> np.ndarray:
+        logits = self.log_prior + self.log_evidence
+        logits = logits - logits.max()
+        weights = np.exp(logits)
+        return weights / weights.sum()
+
+    def log_odds(self) -> np.ndarray:
+        posteriors = np.clip(self.posteriors(), 1e-12, 1 - 1e-12)
+        return np.log(posteriors / (1.0 - posteriors))
+
+    def summary(self) -> List[dict]:
+        posteriors = self.posteriors()
+        log_odds = self.log_odds()
+        return [
+            {"hypothesis": hypothesis, "posterior": float(posteriors[i]), "log_odds": float(log_odds[i])}
+            for i, hypothesis in enumerate(self.hypotheses)
+        ]
+
+    @profiled("ach.posterior.rebuild")
+    def rebuild(
+        self,
+        log_store: ACHLogStore,
+        *,
+        chunk_bytes: int = 8 << 20,
+        workers: int | None = None,
+    ) -> int:
+        """Recompute the evidence term from the full log; returns observations used.
+
+        Raises ``ValueError`` if the log retracts more than it observed for a hypothesis.
+        The log is split into newline-aligned byte ranges of ``chunk_bytes``; each range
+        is read and scored by a worker process, so only the per-chunk sums cross process
+        boundaries. With a single worker (or a single chunk) the ranges are scored inline.
+        """
+
+        self.reset()
+        if workers is None:
+            workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+        ranges = log_store.byte_ranges(chunk_bytes)
+        path = str(log_store.path)
+        if workers <= 1 or len(ranges) <= 1:
+            for start, end in ranges:
+                self._merge(_score_range(path, start, end, self.hypotheses, self.question))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+                futures = [
+                    pool.submit(_score_range, path, start, end, self.hypotheses, self.question)
+                    for start, end in ranges
+                ]
+                for future in futures:
+                    self._merge(future.result())
+        # A chunk may hold a retraction whose observation is in an earlier chunk, so only
+        # the merged counts have to be non-negative.
+        negative = self.counts < 0
+        for totals, copies in self._stories.values():
+            negative |= copies < 0
+            self.log_evidence += np.divide(totals, copies, out=np.zeros_like(totals), where=copies > 0)
+        if negative.any():
+            names = [self.hypotheses[i] for i in np.flatnonzero(negative)]
+            self.reset()
+            raise ValueError(f"ACH log retracts more than it observed for: {', '.join(names)}")
+        return self.observations
+
+    def _merge(self, partial: tuple[np.ndarray, np.ndarray, StorySums]) -> None:
+        totals, counts, stories = partial
+        self.log_evidence += totals
+        self.counts += counts
+        for story, (story_totals, story_copies) in stories.items():
+            totals, copies = self._story_sums(story)
+            totals += story_totals
+            copies += story_copies
+
+
+__all__ = ["ACHPosteriorEngine", "log_likelihood_ratio"]
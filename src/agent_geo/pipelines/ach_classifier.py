@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from agent_geo.config import ACH_HYPOTHESIS_DESCRIPTIONS
+from agent_geo.models.ach import ACHTable
+from agent_geo.models.evidence import EvidenceRecord, evidence_text
+from agent_geo.profiling import profiled
+
+# Han, kana and hangul runs are split into character bigrams; everything else into words.
+_CJK_RUN = r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff66-\uff9f]+"
+_TOKEN_PATTERN = re.compile(rf"(?P<cjk>{_CJK_RUN})|(?P<word>[^\W_]+(?:[-'][^\W_]+)*)")
+
+
+def tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for match in _TOKEN_PATTERN.finditer(text.lower()):
+        run = match.group("cjk")
+        if run is None:
+            word = match.group("word")
+            if len(word) > 1:
+                tokens.append(word)
+        elif len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+@dataclass(slots=True)
+class SparseRows:
+    """Minimal CSR matrix: row ``i`` is ``indices/data[indptr[i]:indptr[i + 1]]``."""
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    n_cols: int
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def dot_dense(self, dense: np.ndarray) -> np.ndarray:
+        """``self @ dense.T`` for a dense ``(k, n_cols)`` matrix, returning ``(n_rows, k)``."""
+
+        out = np.zeros((self.n_rows, dense.shape[0]))
+        if self.data.size == 0:
+            return out
+        products = self.data[:, np.newaxis] * dense.T[self.indices]
+        non_empty = np.flatnonzero(np.diff(self.indptr) > 0)
+        out[non_empty] = np.add.reduceat(products, self.indptr[non_empty], axis=0)
+        return out
+
+    def mean_rows(self, rows: Sequence[int]) -> np.ndarray:
+        centroid = np.zeros(self.n_cols)
+        for row in rows:
+            start, end = self.indptr[row], self.indptr[row + 1]
+            np.add.at(centroid, self.indices[start:end], self.data[start:end])
+        return centroid / max(len(rows), 1)
+
+
+class TfidfVectorizer:
+    """TF-IDF over ``tokenize`` output with L2-normalised sparse rows."""
+
+    def __init__(self) -> None:
+        self.vocabulary: Dict[str, int] = {}
+        self.idf = np.empty(0)
+
+    def fit(self, documents: Iterable[str]) -> "TfidfVectorizer":
+        document_frequency: Dict[str, int] = {}
+        count = 0
+        for document in documents:
+            count += 1
+            for token in set(tokenize(document)):
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+        self.vocabulary = {token: i for i, token in enumerate(document_frequency)}
+        self.idf = np.array(
+            [math.log((1 + count) / (1 + df)) + 1.0 for df in document_frequency.values()], dtype=np.float64
+        )
+        return self
+
+    def transform(self, documents: Iterable[str]) -> SparseRows:
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for document in documents:
+            counts: Dict[int, int] = {}
+            for token in tokenize(document):
+                column = self.vocabulary.get(token)
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+            indices.extend(counts)
+            data.extend(counts.values())
+            indptr.append(len(indices))
+        rows = SparseRows(
+            indptr=np.asarray(indptr, dtype=np.int64),
+            indices=np.asarray(indices, dtype=np.int64),
+            data=np.asarray(data, dtype=np.float64),
+            n_cols=len(self.vocabulary),
+        )
+        if rows.data.size:
+            rows.data *= self.idf[rows.indices]
+            squared = np.zeros(rows.n_rows)
+            owners = np.repeat(np.arange(rows.n_rows), np.diff(rows.indptr))
+            np.add.at(squared, owners, rows.data**2)
+            rows.data /= np.sqrt(squared)[owners]
+        return rows
+
+
+UNKNOWN = "unknown"
+
+
+@dataclass(slots=True)
+class ACHSuggestion:
+    evidence: EvidenceRecord
+    hypothesis: str
+    kind: str  # "support" | "refute" | "unknown" (direction not decided)
+    score: float  # cosine similarity to the winning hypothesis centroid
+    margin: float  # lead over the runner-up hypothesis
+
+
+def _centroids(rows: SparseRows, groups: Sequence[Sequence[int]]) -> np.ndarray:
+    if not groups:
+        return np.empty((0, rows.n_cols))
+    centroids = np.vstack([rows.mean_rows(group) for group in groups])
+    norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+    return np.divide(centroids, norms, out=np.zeros_like(centroids), where=norms > 0)
+
+
+class ACHEvidenceClassifier:
+    """Nearest-centroid classifier proposing ``(hypothesis, support|refute)`` per evidence.
+
+    The hypothesis is chosen by the nearest topic centroid, which averages the TF-IDF
+    vectors of the hypothesis description and all evidence labeled for it, so it works
+    before any labels exist. The direction is then chosen between the ``support`` and
+    ``refute`` centroids of that hypothesis, built from labeled evidence only (a missing
+    centroid scores 0). A description says what a hypothesis is about, not which way
+    evidence cuts, so when the two directions are closer than ``direction_margin`` the
+    suggestion abstains with kind ``"unknown"``. On a cold start (no labels) every
+    suggestion is ``"unknown"``; once a hypothesis has labels in one direction only,
+    evidence resembling them is proposed in that direction and never the other. A whole
+    batch is scored with sparse × dense products against the centroid matrices.
+    """
+
+    def __init__(
+        self,
+        descriptions: Mapping[str, str] = ACH_HYPOTHESIS_DESCRIPTIONS,
+        labeled: Iterable[Tuple[str, str, EvidenceRecord]] = (),
+    ) -> None:
+        self.descriptions = dict(descriptions)
+        self.labeled = list(labeled)
+        self.vectorizer = TfidfVectorizer()
+        self.hypotheses: List[str] = []
+        self.topics = np.empty((0, 0))
+        self.classes: List[Tuple[str, str]] = []
+        self.centroids = np.empty((0, 0))
+
+    @classmethod
+    def from_table(cls, table: ACHTable, descriptions: Mapping[str, str] = ACH_HYPOTHESIS_DESCRIPTIONS):
+        labeled: List[Tuple[str, str, EvidenceRecord]] = []
+        for entry in table.entries:
+            labeled.extend((entry.hypothesis, "support", evidence) for evidence in entry.supports)
+            labeled.extend((entry.hypothesis, "refute", evidence) for evidence in entry.refutes)
+        hypotheses = {entry.hypothesis: descriptions.get(entry.hypothesis, entry.hypothesis) for entry in table.entries}
+        return cls(hypotheses, labeled)
+
+    @profiled("ach.classifier.fit")
+    def fit(self, unlabeled: Sequence[EvidenceRecord] = ()) -> "ACHEvidenceClassifier":
+        """Fit IDF over descriptions, labeled and (optionally) the batch to classify."""
+
+        seeds = list(self.descriptions.items())
+        labeled_texts = [evidence_text(evidence) for _, _, evidence in self.labeled]
+        corpus = [text for _, text in seeds] + labeled_texts + [evidence_text(e) for e in unlabeled]
+        self.vectorizer.fit(corpus)
+        rows = self.vectorizer.transform([text for _, text in seeds] + labeled_texts)
+
+        topics: Dict[str, List[int]] = {}
+        members: Dict[Tuple[str, str], List[int]] = {}
+        for i, (hypothesis, _) in enumerate(seeds):
+            topics.setdefault(hypothesis, []).append(i)
+        for offset, (hypothesis, kind, _) in enumerate(self.labeled, start=len(seeds)):
+            topics.setdefault(hypothesis, []).append(offset)
+            members.setdefault((hypothesis, kind), []).append(offset)
+        self.hypotheses = list(topics)
+        self.topics = _centroids(rows, [topics[hypothesis] for hypothesis in self.hypotheses])
+        self.classes = list(members)
+        self.centroids = _centroids(rows, [members[label] for label in self.classes])
+        return self
+
+    def scores(self, evidence: Sequence[EvidenceRecord]) -> np.ndarray:
+        """Cosine similarity of each evidence item to each hypothesis topic, ``(n, hypotheses)``."""
+
+        rows = self.vectorizer.transform(evidence_text(item) for item in evidence)
+        return rows.dot_dense(self.topics)
+
+    @profiled("ach.classifier.suggest")
+    def suggest(
+        self,
+        evidence: Sequence[EvidenceRecord],
+        *,
+        min_score: float = 0.0,
+        direction_margin: float = 0.02,
+    ) -> List[ACHSuggestion]:
+        if not evidence or not self.hypotheses:
+            return []
+        rows = self.vectorizer.transform(evidence_text(item) for item in evidence)
+        scores = rows.dot_dense(self.topics)
+        directions = rows.dot_dense(self.centroids)
+        column = {label: i for i, label in enumerate(self.classes)}
+        order = np.argsort(-scores, axis=1)
+        best = order[:, 0]
+        index = np.arange(len(evidence))
+        top = scores[index, best]
+        runner_up = scores[index, order[:, 1]] if len(self.hypotheses) > 1 else np.zeros(len(evidence))
+        suggestions = []
+        for i in np.flatnonzero(top > min_score):
+            hypothesis = self.hypotheses[best[i]]
+            support, refute = (
+                directions[i, column[(hypothesis, kind)]] if (hypothesis, kind) in column else 0.0
+                for kind in ("support", "refute")
+            )
+            if abs(support - refute) < direction_margin:
+                kind = UNKNOWN
+            else:
+                kind = "support" if support > refute else "refute"
+            suggestions.append(
+                ACHSuggestion(
+                    evidence=evidence[i],
+                    hypothesis=hypothesis,
+                    kind=kind,
+                    score=float(top[i]),
+                    margin=float(top[i] - runner_up[i]),
+                )
+            )
+        return suggestions
+
+
+__all__ = ["ACHEvidenceClassifier", "ACHSuggestion", "UNKNOWN", "TfidfVectorizer", "SparseRows", "tokenize"]
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping
+
+import numpy as np
+
+from agent_geo.config import EVIDENCE_QUALITY_WEIGHTS
+from agent_geo.models.ach import ACHTable
+from agent_geo.models.evidence import EvidenceRecord
+
+SUPPORT = 1.0
+NEUTRAL = 0.0
+REFUTE = -1.0
+
+_DEFAULT_QUALITY_WEIGHT = min(EVIDENCE_QUALITY_WEIGHTS.values())
+
+
+def evidence_key(evidence: EvidenceRecord) -> str:
+    return evidence.hash or str(evidence.url)
+
+
+def quality_weight(quality: str) -> float:
+    return EVIDENCE_QUALITY_WEIGHTS.get(quality.upper(), _DEFAULT_QUALITY_WEIGHT)
+
+
+class ACHMatrix:
+    """Evidence × hypothesis consistency matrix with quality weights and diagnosticity.
+
+    Cells hold +1 (consistent), -1 (inconsistent) or 0 (not assessed / neutral). A row's
+    diagnosticity is half the spread of its cells, so evidence that fits every hypothesis
+    equally carries no weight, as Heuer prescribes. Hypothesis scores are the sum of
+    ``quality × diagnosticity × consistency`` over rows; they are kept as a running vector
+    and adjusted by the old/new contribution of the one row that changes, so a cell edit
+    costs O(H) rather than a rescan of the table.
+
+    Rows can be grouped into stories, e.g. syndicated copies clustered by
+    ``NearDuplicateIndex``. A story's score is the mean of its assessed rows'
+    contributions, so one story counts once however many outlets ran it. Each story keeps
+    a running contribution sum and an assessed-row count, so an edit stays O(H).
+    """
+
+    def __init__(self, hypotheses: Iterable[str], *, temperature: float = 1.0) -> None:
+        self.hypotheses: List[str] = list(hypotheses)
+        self._h_index: Dict[str, int] = {h: i for i, h in enumerate(self.hypotheses)}
+        self.temperature = temperature
+        self.keys: List[str] = []
+        self._e_index: Dict[str, int] = {}
+        capacity = 64
+        self._cells = np.zeros((capacity, len(self.hypotheses)))
+        self._quality = np.zeros(capacity)
+        self._diagnosticity = np.zeros(capacity)
+        self._row_story = np.zeros(capacity, dtype=np.int64)
+        self._scores = np.zeros(len(self.hypotheses))
+        self._story_index: Dict[str, int] = {}
+        self._stories: List[str] = []
+        self._story_sums = np.zeros((capacity, len(self.hypotheses)))
+        self._story_sizes = np.zeros(capacity, dtype=np.int64)  # assessed (non-neutral) rows
+
+    @classmethod
+    def from_table(cls, table: ACHTable, stories: Mapping[str, str] | None = None, **kwargs) -> "ACHMatrix":
+        """Matrix for ``table``; ``stories`` maps evidence keys to story (cluster) IDs."""
+
+        matrix = cls([entry.hypothesis for entry in table.entries], **kwargs)
+        stories = stories or {}
+        for entry in table.entries:
+            for kind, value in ((entry.supports, SUPPORT), (entry.refutes, REFUTE)):
+                for evidence in kind:
+                    key = evidence_key(evidence)
+                    matrix.set_cell(key, entry.hypothesis, value, quality=evidence.quality, story=stories.get(key))
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def cells(self) -> np.ndarray:
+        return self._cells[: len(self.keys)]
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Quality weight per row, shared out over the assessed rows of its story."""
+
+        count = len(self.keys)
+        sizes = self._story_sizes[self._row_story[:count]]
+        return self._quality[:count] / np.maximum(sizes, 1)
+
+    @property
+    def diagnosticity(self) -> np.ndarray:
+        return self._diagnosticity[: len(self.keys)]
+
+    @property
+    def scores(self) -> np.ndarray:
+        return self._scores.copy()
+
+    def _story(self, story: str) -> int:
+        index = self._story_index.get(story)
+        if index is not None:
+            return index
+        index = len(self._stories)
+        if index == self._story_sums.shape[0]:
+            self._story_sums = np.vstack([self._story_sums, np.zeros_like(self._story_sums)])
+            self._story_sizes = np.concatenate([self._story_sizes, np.zeros_like(self._story_sizes)])
+        self._stories.append(story)
+        self._story_index[story] = index
+        return index
+
+    def _row(self, key: str, story: str | None) -> int:
+        row = self._e_index.get(key)
+        if row is not None:
+            return row
+        row = len(self.keys)
+        if row == self._cells.shape[0]:
+            capacity = 2 * row
+            self._cells = np.vstack([self._cells, np.zeros_like(self._cells)])
+            self._quality = np.resize(self._quality, capacity)
+            self._diagnosticity = np.resize(self._diagnosticity, capacity)
+            self._row_story = np.resize(self._row_story, capacity)
+            self._quality[row:] = 0.0
+            self._diagnosticity[row:] = 0.0
+        self.keys.append(key)
+        self._e_index[key] = row
+        self._row_story[row] = self._story(story or key)
+        return row
+
+    def _contribution(self, row: int) -> np.ndarray:
+        return self._quality[row] * self._diagnosticity[row] * self._cells[row]
+
+    def _story_score(self, story: int) -> np.ndarray | float:
+        size = self._story_sizes[story]
+        return self._story_sums[story] / size if size else 0.0
+
+    def _detach(self, row: int) -> None:
+        """Take ``row`` out of its story's sum and size (the caller handles the scores)."""
+
+        if self._cells[row].any():
+            story = self._row_story[row]
+            self._story_sums[story] -= self._contribution(row)
+            self._story_sizes[story] -= 1
+
+    def _attach(self, row: int) -> None:
+        if self._cells[row].any():
+            story = self._row_story[row]
+            self._story_sums[story] += self._contribution(row)
+            self._story_sizes[story] += 1
+
+    def story_of(self, key: str) -> str:
+        return self._stories[self._row_story[self._e_index[key]]]
+
+    def set_cell(
+        self, key: str, hypothesis: str, value: float, *, quality: str | None = None, story: str | None = None
+    ) -> None:
+        """Set one cell; ``story`` (re)assigns the row's story, otherwise it is its own."""
+
+        if hypothesis not in self._h_index:
+            raise KeyError(f"Unknown hypothesis: {hypothesis}")
+        is_new = key not in self._e_index
+        row = self._row(key, story)
+        previous = int(self._row_story[row])
+        current = self._story(story) if story is not None else previous
+        touched = {previous, current}
+        for index in touched:
+            self._scores -= self._story_score(index)
+        self._detach(row)
+        self._cells[row, self._h_index[hypothesis]] = value
+        if quality is not None or is_new:
+            self._quality[row] = quality_weight(quality or "")
+        cells = self._cells[row]
+        self._diagnosticity[row] = (cells.max() - cells.min()) / 2.0
+        self._row_story[row] = current
+        self._attach(row)
+        for index in touched:
+            self._scores += self._story_score(index)
+
+    def remove_evidence(self, key: str) -> None:
+        """Drop a row by moving the last row into its slot (O(H))."""
+
+        row = self._e_index.pop(key)
+        story = int(self._row_story[row])
+        self._scores -= self._story_score(story)
+        self._detach(row)
+        self._scores += self._story_score(story)
+        last = len(self.keys) - 1
+        if row != last:
+            moved = self.keys[last]
+            self._cells[row] = self._cells[last]
+            self._quality[row] = self._quality[last]
+            self._diagnosticity[row] = self._diagnosticity[last]
+            self._row_story[row] = self._row_story[last]
+            self.keys[row] = moved
+            self._e_index[moved] = row
+        self._cells[last] = 0.0
+        self._quality[last] = 0.0
+        self._diagnosticity[last] = 0.0
+        self.keys.pop()
+
+    def recompute(self) -> np.ndarray:
+        """Full rebuild of the score vector; used to resynchronise after bulk edits."""
+
+        count = len(self.keys)
+        self._story_sums[:] = 0.0
+        self._story_sizes[:] = 0
+        if count == 0:
+            self._scores = np.zeros(len(self.hypotheses))
+            return self.scores
+        cells = self.cells
+        self._diagnosticity[:count] = (cells.max(axis=1) - cells.min(axis=1)) / 2.0
+        assessed = cells.any(axis=1)
+        stories = self._row_story[:count]
+        np.add.at(self._story_sums, stories, (self._quality[:count] * self.diagnosticity)[:, None] * cells)
+        np.add.at(self._story_sizes, stories[assessed], 1)
+        self._scores = (self.weights * self.diagnosticity) @ cells
+        return self.scores
+
+    def inconsistency(self) -> np.ndarray:
+        """Heuer's weighted inconsistency per hypothesis (lower is better-supported)."""
+
+        return (self.weights * self.diagnosticity) @ np.maximum(-self.cells, 0.0)
+
+    def probabilities(self) -> np.ndarray:
+        """Softmax over hypothesis scores; uniform when no diagnostic evidence exists."""
+
+        logits = self._scores / self.temperature
+        logits = logits - logits.max() if logits.size else logits
+        exp = np.exp(logits)
+        return exp / exp.sum()
+
+    def assessment(self) -> Dict[str, dict]:
+        probabilities = self.probabilities()
+        inconsistency = self.inconsistency()
+        return {
+            hypothesis: {
+                "score": float(self._scores[i]),
+                "inconsistency": float(inconsistency[i]),
+                "probability": float(probabilities[i]),
+            }
+            for i, hypothesis in enumerate(self.hypotheses)
+        }
+
+
+__all__ = ["ACHMatrix", "SUPPORT", "NEUTRAL", "REFUTE", "evidence_key", "quality_weight"]
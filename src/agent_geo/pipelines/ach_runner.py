@@ -1,44 +1,389 @@
 from __future__ import annotations
 
-from typing import Iterable
+import warnings
+from typing import Dict, Iterable, List, Literal, Tuple
 
-from agent_geo.models.ach import ACHTable
+from agent_geo.config import ACH_HYPOTHESES, NEAR_DUPLICATE_THRESHOLD
+from agent_geo.models.ach import ACHEntry, ACHObservation, ACHTable
 from agent_geo.models.evidence import EvidenceRecord
-from agent_geo.storage import ACHStore
+from agent_geo.pipelines.ach_bayes import ACHPosteriorEngine
+from agent_geo.pipelines.ach_matrix import NEUTRAL, REFUTE, SUPPORT, ACHMatrix, evidence_key
+from agent_geo.pipelines.near_duplicates import NearDuplicateIndex
+from agent_geo.profiling import profiled
+from agent_geo.storage import ACHLogStore, ACHStore
+
+Kind = Literal["support", "refute"]
+_CELL_VALUES = {"support": SUPPORT, "refute": REFUTE}
+
+
+class _HypothesisIndex:
+    """Ordered hash sets (insertion-ordered dicts keyed by evidence hash) for one entry."""
+
+    __slots__ = ("entry", "supports", "refutes")
+
+    def __init__(self, entry: ACHEntry) -> None:
+        self.entry = entry
+        self.supports: Dict[str, EvidenceRecord] = {evidence_key(e): e for e in entry.supports}
+        self.refutes: Dict[str, EvidenceRecord] = {evidence_key(e): e for e in entry.refutes}
+
+    def bucket(self, kind: Kind) -> Dict[str, EvidenceRecord]:
+        return self.supports if kind == "support" else self.refutes
+
+    def flush(self) -> None:
+        self.entry.supports = list(self.supports.values())
+        self.entry.refutes = list(self.refutes.values())
+        self.entry.recompute()
+
+
+class _QuestionState:
+    __slots__ = ("table", "entries", "matrix", "engine")
+
+    def __init__(self, table: ACHTable, stories: NearDuplicateIndex | None = None) -> None:
+        self.table = table
+        self.entries: Dict[str, _HypothesisIndex] = {e.hypothesis: _HypothesisIndex(e) for e in table.entries}
+        for index in self.entries.values():
+            index.flush()  # drop duplicates persisted by older versions
+        clusters = None
+        if stories is not None:
+            # Reuse the story IDs saved with the table: re-clustering in table order could
+            # group copies differently from the live run that logged them.
+            clusters = {}
+            for entry in table.entries:
+                for evidence in (*entry.supports, *entry.refutes):
+                    key = evidence_key(evidence)
+                    clusters[key] = stories.add_evidence(evidence, table.stories.get(key))
+        self.matrix = ACHMatrix.from_table(table, clusters)
+        self.engine = ACHPosteriorEngine(self.entries, question=table.question)
+        self.engine.load_table(table, clusters)
+
+    def sync_scores(self) -> None:
+        scores = self.matrix.scores
+        probabilities = self.matrix.probabilities()
+        posteriors = self.engine.posteriors()
+        for i, entry in enumerate(self.table.entries):
+            entry.weighted_score = float(scores[i])
+            entry.probability = float(probabilities[i])
+            entry.posterior = float(posteriors[i])
 
 
 class ACHManager:
-    def __init__(self, store: ACHStore | None = None) -> None:
+    """ACH tables for one or more questions with O(1) evidence add/remove/contains.
+
+    Each hypothesis keeps insertion-ordered hash sets of supporting and refuting
+    evidence keyed by evidence hash; the ``ACHEntry`` lists are refreshed from them only
+    when a question is saved. Methods default to the primary question (the first table
+    on disk, normally ``ACH_QUESTION``) unless ``question`` is given. With
+    ``collapse_syndicated`` (the default) evidence is clustered by ``NearDuplicateIndex``
+    and both the matrix and the log-odds posteriors weight each syndicated story once;
+    tables save and log records carry the story ID of each item, so a restart or a
+    rebuild groups them exactly as they were grouped when added.
+    """
+
+    @profiled("ach.init")
+    def __init__(
+        self,
+        store: ACHStore | None = None,
+        log_store: ACHLogStore | None = None,
+        *,
+        question: str | None = None,
+        collapse_syndicated: bool = True,
+    ) -> None:
         self.store = store or ACHStore()
-        self.table = self.store.load()
-
-    def _get_entry(self, hypothesis: str):
-        for entry in self.table.entries:
-            if entry.hypothesis == hypothesis:
-                return entry
-        raise KeyError(f"Unknown hypothesis: {hypothesis}")
-
-    def add_support(self, hypothesis: str, evidence: EvidenceRecord) -> None:
-        entry = self._get_entry(hypothesis)
-        entry.supports.append(evidence)
-        entry.recompute()
-        self.store.save(self.table)
-
-    def add_refute(self, hypothesis: str, evidence: EvidenceRecord) -> None:
-        entry = self._get_entry(hypothesis)
-        entry.refutes.append(evidence)
-        entry.recompute()
-        self.store.save(self.table)
-
-    def set_gaps(self, hypothesis: str, gaps: Iterable[str]) -> None:
-        entry = self._get_entry(hypothesis)
+        self.log_store = log_store or ACHLogStore()
+        self.stories = NearDuplicateIndex(threshold=NEAR_DUPLICATE_THRESHOLD) if collapse_syndicated else None
+        self._questions: Dict[str, _QuestionState] = {
+            name: _QuestionState(table, self.stories) for name, table in self.store.load_all().items()
+        }
+        if question is not None and question not in self._questions:
+            self._questions[question] = _QuestionState(ACHTable.bootstrap(question), self.stories)
+        self.question = question or next(iter(self._questions))
+        for state in self._questions.values():
+            state.sync_scores()
+
+    @property
+    def table(self) -> ACHTable:
+        return self._questions[self.question].table
+
+    @property
+    def tables(self) -> Dict[str, ACHTable]:
+        return {name: state.table for name, state in self._questions.items()}
+
+    @property
+    def matrix(self) -> ACHMatrix:
+        return self._questions[self.question].matrix
+
+    @property
+    def engine(self) -> ACHPosteriorEngine:
+        return self._questions[self.question].engine
+
+    def questions(self) -> List[str]:
+        return list(self._questions)
+
+    def add_question(self, question: str, hypotheses: Iterable[str] = ACH_HYPOTHESES) -> ACHTable:
+        if question in self._questions:
+            raise ValueError(f"ACH question already exists: {question}")
+        state = _QuestionState(ACHTable.bootstrap(question, hypotheses), self.stories)
+        state.sync_scores()
+        self._questions[question] = state
+        self._save()
+        return state.table
+
+    def _state(self, question: str | None) -> _QuestionState:
+        name = question or self.question
+        try:
+            return self._questions[name]
+        except KeyError:
+            raise KeyError(f"Unknown ACH question: {name}") from None
+
+    def _index(self, state: _QuestionState, hypothesis: str) -> _HypothesisIndex:
+        try:
+            return state.entries[hypothesis]
+        except KeyError:
+            raise KeyError(f"Unknown hypothesis: {hypothesis}") from None
+
+    def _get_entry(self, hypothesis: str, question: str | None = None) -> ACHEntry:
+        return self._index(self._state(question), hypothesis).entry
+
+    def _save(self, dirty: Iterable[_QuestionState] = ()) -> None:
+        for state in dirty:
+            for index in state.entries.values():
+                index.flush()
+            clusters = self._clusters(state)
+            if clusters is None:
+                # Not clustering now: keep the IDs of items still in the table for later runs.
+                clusters = {key: story for key, story in state.table.stories.items() if self._in_table(state, key)}
+            state.table.stories = clusters
+            state.sync_scores()
+        self.store.save_all(state.table for state in self._questions.values())
+
+    def _apply(
+        self, state: _QuestionState, hypothesis: str, kind: Kind, evidence: EvidenceRecord
+    ) -> List[ACHObservation]:
+        """Update indexes, matrix and posterior; return the log records to append."""
+
+        index = self._index(state, hypothesis)
+        key = evidence_key(evidence)
+        bucket = index.bucket(kind)
+        if key in bucket:
+            return []
+        question = state.table.question
+        records = []
+        story = self.stories.add_evidence(evidence) if self.stories is not None else None
+        other_kind: Kind = "refute" if kind == "support" else "support"
+        other = index.bucket(other_kind)
+        if key in other:
+            # Re-assessing the same item flips its direction rather than counting it twice.
+            state.engine.retract(hypothesis, other_kind, other[key].quality, story)
+            previous = other.pop(key)
+            records.append(
+                ACHObservation(
+                    question=question,
+                    hypothesis=hypothesis,
+                    kind=other_kind,
+                    evidence=previous,
+                    retracted=True,
+                    story=story,
+                )
+            )
+        bucket[key] = evidence
+        state.matrix.set_cell(key, hypothesis, _CELL_VALUES[kind], quality=evidence.quality, story=story)
+        state.engine.observe(hypothesis, kind, evidence.quality, story)
+        records.append(
+            ACHObservation(question=question, hypothesis=hypothesis, kind=kind, evidence=evidence, story=story)
+        )
+        return records
+
+    def _add(self, hypothesis: str, kind: Kind, evidence: EvidenceRecord, question: str | None) -> bool:
+        state = self._state(question)
+        records = self._apply(state, hypothesis, kind, evidence)
+        if not records:
+            return False
+        self._append_log(records)
+        self._save([state])
+        return True
+
+    def add_support(self, hypothesis: str, evidence: EvidenceRecord, *, question: str | None = None) -> bool:
+        """Record supporting evidence; returns False if it was already recorded."""
+
+        return self._add(hypothesis, "support", evidence, question)
+
+    def add_refute(self, hypothesis: str, evidence: EvidenceRecord, *, question: str | None = None) -> bool:
+        """Record refuting evidence; returns False if it was already recorded."""
+
+        return self._add(hypothesis, "refute", evidence, question)
+
+    @profiled("ach.add_many")
+    def add_many(
+        self,
+        items: Iterable[Tuple[str, Kind, EvidenceRecord]],
+        *,
+        question: str | None = None,
+    ) -> int:
+        """Apply ``(hypothesis, kind, evidence)`` triples, appending the log and saving once.
+
+        Every triple is checked before any is applied, so an unknown hypothesis or a bad
+        ``kind`` leaves the table, indexes and log untouched.
+        """
+
+        state = self._state(question)
+        items = list(items)
+        for hypothesis, kind, _ in items:
+            self._index(state, hypothesis)
+            if kind not in _CELL_VALUES:
+                raise ValueError(f"kind must be 'support' or 'refute', got {kind!r}")
+        records: List[ACHObservation] = []
+        applied = 0
+        for hypothesis, kind, evidence in items:
+            new_records = self._apply(state, hypothesis, kind, evidence)
+            if new_records:
+                records.extend(new_records)
+                applied += 1
+        if records:
+            self._append_log(records)
+            self._save([state])
+        return applied
+
+    def _remove(self, hypothesis: str, kind: Kind, evidence: EvidenceRecord, question: str | None) -> bool:
+        state = self._state(question)
+        index = self._index(state, hypothesis)
+        key = evidence_key(evidence)
+        bucket = index.bucket(kind)
+        if key not in bucket:
+            return False
+        story = self._story(key)
+        state.engine.retract(hypothesis, kind, bucket[key].quality, story)
+        removed = bucket.pop(key)
+        state.matrix.set_cell(key, hypothesis, NEUTRAL)
+        self._append_log(
+            [
+                ACHObservation(
+                    question=state.table.question,
+                    hypothesis=hypothesis,
+                    kind=kind,
+                    evidence=removed,
+                    retracted=True,
+                    story=story,
+                )
+            ]
+        )
+        self._save([state])
+        if self.stories is not None and not self._referenced(key):
+            self.stories.remove(key)  # no longer a bucket representative for new copies
+        return True
+
+    def _story(self, key: str) -> str | None:
+        return self.stories.get_cluster(key) if self.stories is not None else None
+
+    def _clusters(self, state: _QuestionState) -> Dict[str, str] | None:
+        """Story ID of every item in ``state``'s table, or None without clustering."""
+
+        if self.stories is None:
+            return None
+        return {
+            key: self.stories.cluster_of(key)
+            for index in state.entries.values()
+            for key in (*index.supports, *index.refutes)
+        }
+
+    @staticmethod
+    def _in_table(state: _QuestionState, key: str) -> bool:
+        return any(key in index.supports or key in index.refutes for index in state.entries.values())
+
+    def _referenced(self, key: str) -> bool:
+        return any(self._in_table(state, key) for state in self._questions.values())
+
+    def _append_log(self, records: List[ACHObservation]) -> None:
+        """Append to the evidence log, first backfilling it with the tables if it is new.
+
+        Evidence recorded before the log existed lives only in the tables; without the
+        backfill a rebuild would drop it. The ``ACHEntry`` lists are only refreshed from
+        the indexes in ``_save``, so here they still hold the state before ``records``.
+        """
+
+        if not self.log_store.exists():
+            self.log_store.append_many(
+                ACHObservation(
+                    question=state.table.question,
+                    hypothesis=entry.hypothesis,
+                    kind=kind,
+                    evidence=evidence,
+                    story=self._story(evidence_key(evidence)),
+                )
+                for state in self._questions.values()
+                for entry in state.table.entries
+                for kind, items in (("support", entry.supports), ("refute", entry.refutes))
+                for evidence in items
+            )
+        self.log_store.append_many(records)
+
+    def remove_support(self, hypothesis: str, evidence: EvidenceRecord, *, question: str | None = None) -> bool:
+        return self._remove(hypothesis, "support", evidence, question)
+
+    def remove_refute(self, hypothesis: str, evidence: EvidenceRecord, *, question: str | None = None) -> bool:
+        return self._remove(hypothesis, "refute", evidence, question)
+
+    def contains(
+        self,
+        hypothesis: str,
+        evidence: EvidenceRecord,
+        *,
+        kind: Kind | None = None,
+        question: str | None = None,
+    ) -> bool:
+        index = self._index(self._state(question), hypothesis)
+        key = evidence_key(evidence)
+        if kind is None:
+            return key in index.supports or key in index.refutes
+        return key in index.bucket(kind)
+
+    @profiled("ach.recompute_posteriors")
+    def recompute_posteriors(
+        self,
+        *,
+        workers: int | None = None,
+        chunk_bytes: int = 8 << 20,
+        question: str | None = None,
+    ) -> int:
+        """Weekly batch: rebuild posteriors from the full evidence log (or the table if none).
+
+        A log that disagrees with the table on the number of items per hypothesis (for
+        example one started before logs were backfilled) is not trusted: the posteriors
+        are seeded from the table instead and a ``RuntimeWarning`` is issued.
+        """
+
+        state = self._state(question)
+        consistent = False
+        if self.log_store.exists():
+            problem = "item counts disagree with the ACH table"
+            try:
+                state.engine.rebuild(self.log_store, workers=workers, chunk_bytes=chunk_bytes)
+                consistent = state.engine.consistent_with(state.table)
+            except ValueError as exc:
+                problem = str(exc)
+            if not consistent:
+                warnings.warn(
+                    f"{self.log_store.path}: {problem} ({state.table.question!r}); posteriors seeded from the table",
+                    RuntimeWarning,
+                    stacklevel=3,  # past the profiling wrapper
+                )
+        if not consistent:
+            state.engine.load_table(state.table, self._clusters(state))
+        used = state.engine.observations
+        self._save([state])
+        return used
+
+    def assessment(self, question: str | None = None) -> dict:
+        return self._state(question).matrix.assessment()
+
+    def set_gaps(self, hypothesis: str, gaps: Iterable[str], *, question: str | None = None) -> None:
+        entry = self._get_entry(hypothesis, question)
         entry.key_gaps = list(gaps)
-        self.store.save(self.table)
+        self._save()
 
-    def set_next_collection(self, hypothesis: str, tasks: Iterable[str]) -> None:
-        entry = self._get_entry(hypothesis)
+    def set_next_collection(self, hypothesis: str, tasks: Iterable[str], *, question: str | None = None) -> None:
+        entry = self._get_entry(hypothesis, question)
         entry.next_collection = list(tasks)
-        self.store.save(self.table)
+        self._save()
 
 
 __all__ = ["ACHManager"]
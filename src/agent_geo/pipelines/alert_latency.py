@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import numpy as np
+
+from agent_geo.models.evidence import EvidenceRecord
+from agent_geo.storage import LatencyStore
+
+# Interval name -> (from stage, to stage) along published → collected → classified →
+# signal update → brief rendered; "total" spans the whole flash-brief path.
+LATENCY_STAGES: Dict[str, tuple[str, str]] = {
+    "collect": ("published", "collected"),
+    "classify": ("collected", "classified"),
+    "signal": ("classified", "signal_update"),
+    "brief": ("signal_update", "brief_rendered"),
+    "total": ("published", "brief_rendered"),
+}
+
+FLASH_BRIEF_SLA_SECONDS = 6 * 3600
+
+# Log-spaced bucket upper bounds from 1 ms to ~115 days, 20 per decade (≈12% resolution).
+_BUCKET_BOUNDS = np.logspace(-3, 7, 201)
+
+
+def _utc(moment: datetime) -> datetime:
+    """Naive UTC, matching ``datetime.utcnow()`` used for ``created_at``."""
+
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class LatencyHistogram:
+    """Fixed log-bucket histogram with exact count/sum/min/max."""
+
+    def __init__(self) -> None:
+        self.counts = np.zeros(len(_BUCKET_BOUNDS) + 1, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        self.counts[int(np.searchsorted(_BUCKET_BOUNDS, seconds))] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q``-th percentile, capped at ``max``."""
+
+        if self.count == 0:
+            return None
+        rank = max(int(np.ceil(q / 100.0 * self.count)), 1)
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank))
+        bound = _BUCKET_BOUNDS[bucket] if bucket < len(_BUCKET_BOUNDS) else self.max
+        return float(min(max(bound, self.min), self.max))
+
+    def fraction_within(self, seconds: float) -> float | None:
+        """Share of latencies at or below ``seconds``, never overstated.
+
+        Only buckets whose upper bound is at or below ``seconds`` count, so the bucket
+        that straddles the threshold is treated as outside it (unless ``max`` shows
+        that every latency is within).
+        """
+
+        if self.count == 0:
+            return None
+        if self.max <= seconds:
+            return 1.0
+        complete = int(np.searchsorted(_BUCKET_BOUNDS, seconds, side="right"))
+        return float(self.counts[:complete].sum() / self.count)
+
+    def to_dict(self) -> dict:
+        nonzero = np.flatnonzero(self.counts)
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max,
+            "buckets": {str(int(i)): int(self.counts[i]) for i in nonzero},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "LatencyHistogram":
+        histogram = cls()
+        for bucket, count in payload.get("buckets", {}).items():
+            histogram.counts[int(bucket)] = count
+        histogram.count = int(payload.get("count", 0))
+        histogram.total = float(payload.get("sum", 0.0))
+        histogram.min = float(payload["min"]) if payload.get("min") is not None else float("inf")
+        histogram.max = float(payload.get("max", 0.0))
+        return histogram
+
+
+class LatencyRecorder:
+    """Collects per-stage latencies for evidence moving through the alert path."""
+
+    def __init__(self, store: LatencyStore | None = None) -> None:
+        self.store = store or LatencyStore()
+        payload = self.store.load() or {}
+        self.histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram.from_dict(payload.get(name, {})) for name in LATENCY_STAGES
+        }
+
+    def observe(self, evidence: EvidenceRecord, **stamps: datetime | None) -> None:
+        """Record every interval whose two endpoints are known.
+
+        ``published`` and ``collected`` default to the evidence's ``date`` and
+        ``created_at``; later stages are passed as keyword timestamps.
+        """
+
+        moments = {"published": evidence.date, "collected": evidence.created_at, **stamps}
+        for name, (start, end) in LATENCY_STAGES.items():
+            begin, finish = moments.get(start), moments.get(end)
+            if begin is None or finish is None:
+                continue
+            self.histograms[name].record((_utc(finish) - _utc(begin)).total_seconds())
+
+    def save(self) -> None:
+        self.store.save({name: histogram.to_dict() for name, histogram in self.histograms.items()})
+
+    def report(self) -> List[dict]:
+        rows = []
+        for name, histogram in self.histograms.items():
+            rows.append(
+                {
+                    "stage": name,
+                    "count": histogram.count,
+                    "p50": histogram.percentile(50),
+                    "p95": histogram.percentile(95),
+                    "p99": histogram.percentile(99),
+                    "max": histogram.max if histogram.count else None,
+                }
+            )
+        return rows
+
+    def sla_attainment(self) -> float | None:
+        """Share of red-line evidence whose brief was rendered within 6 hours of publication."""
+
+        return self.histograms["total"].fraction_within(FLASH_BRIEF_SLA_SECONDS)
+
+
+__all__ = ["LatencyHistogram", "LatencyRecorder", "LATENCY_STAGES", "FLASH_BRIEF_SLA_SECONDS"]
@@ -1,21 +1,107 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 from agent_geo.config import ENTRAPMENT_SIGNALS, EntrapmentSignalDefinition
-from agent_geo.models.alert import EntrapmentSignalStatus
+from agent_geo.models.alert import AlertEvent, EntrapmentSignalStatus
 from agent_geo.models.evidence import EvidenceRecord
+from agent_geo.profiling import profiled
+from agent_geo.storage import AlertStore
 
 
 class AlertMonitor:
-    def __init__(self, definitions: Iterable[EntrapmentSignalDefinition] = ENTRAPMENT_SIGNALS) -> None:
+    """Entrapment signal state rebuilt from an append-only event log.
+
+    Every ``update`` is appended to the ``AlertStore`` log before it is applied, and a
+    snapshot is written every ``snapshot_every`` events so start-up replays only the
+    tail of the log. An active-signal counter makes ``is_red`` O(1). Each status keeps
+    only its latest ``evidence_tail`` evidence items (plus a running total), so snapshots
+    stay the same size however long the log grows; ``timeline`` still has every item.
+    """
+
+    @profiled("alerts.init")
+    def __init__(
+        self,
+        definitions: Iterable[EntrapmentSignalDefinition] = ENTRAPMENT_SIGNALS,
+        store: AlertStore | None = None,
+        *,
+        snapshot_every: int = 100,
+        evidence_tail: int = 50,
+    ) -> None:
         self.definitions = list(definitions)
+        self.store = store or AlertStore()
+        self.snapshot_every = snapshot_every
+        self.evidence_tail = evidence_tail
         self.status: Dict[str, EntrapmentSignalStatus] = {
             definition.key: EntrapmentSignalStatus(key=definition.key)
             for definition in self.definitions
         }
+        self.red_since: datetime | None = None
+        self._active = 0
+        self._offset = 0
+        self._events = 0
+        self._since_snapshot = 0
+        self._restore()
+
+    def _restore(self) -> None:
+        statuses, offset, events = self.store.load_snapshot()
+        log_size = self.store.path.stat().st_size if self.store.path.exists() else 0
+        if offset > log_size:
+            # Log was rotated or truncated under the snapshot; trust the log.
+            statuses, offset, events = [], 0, 0
+        for status in statuses:
+            if status.key in self.status:
+                # Snapshots written before the tail existed carry every item.
+                status.evidence_total = max(status.evidence_total, len(status.evidence))
+                self._trim(status)
+                self.status[status.key] = status
+        self._offset, self._events = offset, events
+        self._recount()
+        for end, event in self.store.iter_events(offset):
+            self._apply(event)
+            self._offset = end
+            self._events += 1
+            self._since_snapshot += 1
+
+    def _trim(self, status: EntrapmentSignalStatus) -> None:
+        excess = len(status.evidence) - self.evidence_tail
+        if excess > 0:
+            del status.evidence[:excess]
+
+    def _recount(self) -> None:
+        self._active = sum(1 for status in self.status.values() if status.active)
+        if self.is_red():
+            self.red_since = max(status.activated_at or status.last_checked for status in self.status.values())
+        else:
+            self.red_since = None
+
+    def _apply(self, event: AlertEvent) -> EntrapmentSignalStatus:
+        status = self.status.get(event.key)
+        if status is None:
+            # Retired signal still present in the log: nothing to rebuild.
+            return EntrapmentSignalStatus(key=event.key)
+        was_red = self.is_red()
+        if event.active and not status.active:
+            self._active += 1
+            status.activated_at = event.at
+        elif status.active and not event.active:
+            self._active -= 1
+            status.activated_at = None
+        status.active = event.active
+        status.last_checked = event.at
+        status.notes = event.notes
+        if event.evidence:
+            status.evidence.extend(event.evidence)
+            status.evidence_total += len(event.evidence)
+            self._trim(status)
+        if self.is_red() and not was_red:
+            self.red_since = event.at
+        elif was_red and not self.is_red():
+            self.red_since = None
+        return status
 
+    @profiled("alerts.update")
     def update(
         self,
         key: str,
@@ -23,19 +109,54 @@ class AlertMonitor:
         active: bool,
         evidence: List[EvidenceRecord] | None = None,
         notes: str | None = None,
+        at: datetime | None = None,
     ) -> EntrapmentSignalStatus:
         if key not in self.status:
             raise KeyError(f"Unknown signal {key}")
-        status = self.status[key]
-        status.active = active
-        status.last_checked = datetime.utcnow()
-        status.notes = notes
-        if evidence:
-            status.evidence.extend(evidence)
+        event = AlertEvent(key=key, active=active, at=at or datetime.utcnow(), evidence=evidence or [], notes=notes)
+        self._offset = self.store.append(event)
+        self._events += 1
+        self._since_snapshot += 1
+        status = self._apply(event)
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
         return status
 
+    def snapshot(self) -> None:
+        self.store.save_snapshot(self.status.values(), self._offset, self._events)
+        self._since_snapshot = 0
+
     def is_red(self) -> bool:
-        return all(status.active for status in self.status.values())
+        return self._active == len(self.status)
+
+    def active_count(self) -> int:
+        return self._active
+
+    def timeline(self) -> List[AlertEvent]:
+        """Full signal history, oldest first, replayed from the log."""
+
+        return [event for _, event in self.store.iter_events()]
+
+    def red_intervals(self) -> List[Tuple[datetime, datetime | None]]:
+        """``(start, end)`` spells during which every signal was active; ``end`` is None if ongoing.
+
+        ``start`` is the moment the last of the three signals came on — the clock for the
+        "<6 小时" flash-brief SLA.
+        """
+
+        active: Dict[str, bool] = {key: False for key in self.status}
+        intervals: List[Tuple[datetime, datetime | None]] = []
+        count = 0
+        for event in self.timeline():
+            if event.key not in active or active[event.key] == event.active:
+                continue
+            active[event.key] = event.active
+            count += 1 if event.active else -1
+            if count == len(active):
+                intervals.append((event.at, None))
+            elif not event.active and count == len(active) - 1 and intervals and intervals[-1][1] is None:
+                intervals[-1] = (intervals[-1][0], event.at)
+        return intervals
 
     def summary(self) -> List[dict]:
         rows = []
@@ -46,8 +167,9 @@ class AlertMonitor:
                     "key": definition.key,
                     "description": definition.description,
                     "active": status.active,
-                    "evidence_count": len(status.evidence),
+                    "evidence_count": status.evidence_total,
                     "last_checked": status.last_checked.isoformat(),
+                    "activated_at": status.activated_at.isoformat() if status.activated_at else None,
                 }
             )
         return rows
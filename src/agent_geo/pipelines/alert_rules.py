@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Sequence
+
+from agent_geo.config import EntrapmentSignalDefinition
+from agent_geo.models.evidence import EvidenceRecord
+from agent_geo.pipelines.ach_matrix import evidence_key
+from agent_geo.pipelines.alert_latency import LatencyRecorder
+from agent_geo.pipelines.alert_monitor import AlertMonitor
+from agent_geo.pipelines.keyword_tagger import KeywordTagger
+from agent_geo.profiling import profiled
+
+
+@dataclass(slots=True)
+class StreamResult:
+    items: int = 0
+    matches: Dict[str, List[EvidenceRecord]] = field(default_factory=dict)
+    fired: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Evidence items evaluated per second."""
+
+        return self.items / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+class StreamingAlertEvaluator:
+    """Evaluates incoming evidence against the entrapment signal rules.
+
+    Signal rules are compiled once into a ``KeywordTagger`` automaton and evidence the
+    monitor has already seen is skipped. An item that turns a signal on is written to the
+    ``AlertMonitor`` at once, together with any matches held back so far; matches for
+    signals that are already on are held and written at the end of the batch, one event
+    per signal. When an item switches the last signal on, ``on_red`` is called right
+    away with the evidence matched so far, so the flash brief does not wait for the rest
+    of the batch.
+    Rules only switch signals on; standing a signal down stays an analyst decision.
+    With a ``LatencyRecorder`` the classified / signal-update / brief-rendered moments of
+    each item are recorded against its publication and collection times.
+    """
+
+    def __init__(
+        self,
+        monitor: AlertMonitor,
+        definitions: Sequence[EntrapmentSignalDefinition] | None = None,
+        *,
+        on_red: Callable[[List[EvidenceRecord]], object] | None = None,
+        latency: LatencyRecorder | None = None,
+    ) -> None:
+        self.monitor = monitor
+        self.latency = latency
+        self.tagger = KeywordTagger(definitions if definitions is not None else monitor.definitions, templates=())
+        self.on_red = on_red
+        self._seen: Dict[str, set[str]] = {
+            key: {evidence_key(evidence) for evidence in status.evidence} for key, status in monitor.status.items()
+        }
+
+    def evaluate(self, evidence: EvidenceRecord) -> List[str]:
+        """Signal keys whose rule matches ``evidence``."""
+
+        return self.tagger.tag(evidence).signals
+
+    @profiled("alerts.stream.consume_many")
+    def consume_many(self, stream: Iterable[EvidenceRecord], *, at: datetime | None = None) -> StreamResult:
+        result = StreamResult()
+        started = time.perf_counter()
+        classified: Dict[int, tuple[EvidenceRecord, datetime]] = {}
+        pending: Dict[str, List[EvidenceRecord]] = {}
+        updated: Dict[int, datetime] = {}
+        briefed: set[int] = set()
+        rendered_at = None
+        for evidence in stream:
+            result.items += 1
+            keys = self.evaluate(evidence)
+            if self.latency is not None:
+                classified_at = datetime.utcnow()
+                if not keys:
+                    self.latency.observe(evidence, classified=classified_at)
+                else:
+                    classified[id(evidence)] = (evidence, classified_at)
+            switches_on = False
+            for key in keys:
+                seen = self._seen.setdefault(key, set())
+                fingerprint = evidence_key(evidence)
+                if fingerprint in seen:
+                    continue
+                seen.add(fingerprint)
+                result.matches.setdefault(key, []).append(evidence)
+                status = self.monitor.status.get(key)
+                if status is not None:
+                    pending.setdefault(key, []).append(evidence)
+                    switches_on = switches_on or not status.active
+            if not switches_on:
+                continue
+            # This item turns a signal on: publish now so the red line is not held for the batch.
+            was_red = self.monitor.is_red()
+            self._flush(pending, updated, at)
+            if self.monitor.is_red() and not was_red:
+                result.fired = True
+                if self.on_red is not None:
+                    self.on_red([evidence for matched in result.matches.values() for evidence in matched])
+                    rendered_at = datetime.utcnow()
+                    briefed = set(updated)
+        self._flush(pending, updated, at)
+        result.elapsed = time.perf_counter() - started
+        if self.latency is not None:
+            self._record_latency(classified, updated, briefed, rendered_at)
+        return result
+
+    def _flush(
+        self, pending: Dict[str, List[EvidenceRecord]], updated: Dict[int, datetime], at: datetime | None
+    ) -> None:
+        """Write ``pending`` matches to the monitor, one event per signal, and clear them."""
+
+        for key, matched in pending.items():
+            self.monitor.update(
+                key,
+                active=True,
+                evidence=matched,
+                notes=f"auto: {len(matched)} matching item(s)",
+                at=at,
+            )
+        updated_at = datetime.utcnow()
+        updated.update((id(evidence), updated_at) for matched in pending.values() for evidence in matched)
+        pending.clear()
+
+    def _record_latency(
+        self,
+        classified: Dict[int, tuple[EvidenceRecord, datetime]],
+        updated: Dict[int, datetime],
+        briefed: set[int],
+        rendered_at: datetime | None,
+    ) -> None:
+        for item_id, (evidence, classified_at) in classified.items():
+            if item_id in updated:
+                self.latency.observe(
+                    evidence,
+                    classified=classified_at,
+                    signal_update=updated[item_id],
+                    brief_rendered=rendered_at if item_id in briefed else None,
+                )
+            else:
+                # Already attached to its signal earlier: only the front of the path applies.
+                self.latency.observe(evidence, classified=classified_at)
+        self.latency.save()
+
+    def consume(self, evidence: EvidenceRecord, *, at: datetime | None = None) -> StreamResult:
+        return self.consume_many([evidence], at=at)
+
+
+__all__ = ["StreamingAlertEvaluator", "StreamResult"]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Set
+
+from agent_geo.models.evidence import EvidenceRecord, content_hash, content_hashes
+from agent_geo.profiling import profiled
+from agent_geo.storage import ACHLogStore, ACHStore, AlertStore, EvidenceStore
+
+
+def _rehash_range(path: str, start: int, end: int) -> tuple[List[str], List[bytes], int]:
+    """Content hashes, rewritten lines and changed-hash count for one range of the log.
+
+    Module-level so it can run in a worker process; lines are handled as plain JSON,
+    hashed row by row with ``content_hashes``, and only the results cross the process
+    boundary.
+    """
+
+    rows = [json.loads(line) for line in EvidenceStore.read_range(path, start, end) if line.strip()]
+    digests = content_hashes(rows)
+    lines = []
+    changed = 0
+    for row, digest in zip(rows, digests):
+        changed += row.get("hash") != digest
+        row["hash"] = digest
+        lines.append(json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+    return digests, lines, changed
+
+
+@dataclass(slots=True)
+class RehashReport:
+    records: int = 0
+    changed: int = 0
+    duplicates: int = 0
+    dependents: int = 0  # hashes changed in ACH tables, the ACH log and alert state
+
+
+def _rehash_row(row: dict, remap: Dict[str, str]) -> bool:
+    """Give one evidence dict its content hash; record ``old key -> new hash`` in ``remap``."""
+
+    digest = content_hash(row.get("title"), row.get("source"), row.get("quote"), row.get("url"))
+    remap[row.get("hash") or str(row.get("url"))] = digest  # old ``evidence_key``
+    changed = row.get("hash") != digest
+    row["hash"] = digest
+    return changed
+
+
+def _rehash_record(evidence: EvidenceRecord, remap: Dict[str, str]) -> bool:
+    digest = content_hash(evidence.title, evidence.source, evidence.quote, evidence.url)
+    remap[evidence.hash or str(evidence.url)] = digest
+    changed = evidence.hash != digest
+    evidence.hash = digest
+    return changed
+
+
+def _remap_story(story: str | None, remap: Dict[str, str]) -> str | None:
+    """Story IDs are evidence keys, or ``key#row`` when a removed key came back."""
+
+    if story is None or story in remap:
+        return remap.get(story, story) if story is not None else None
+    key, sep, row = story.rpartition("#")
+    return f"{remap[key]}{sep}{row}" if sep and key in remap else story
+
+
+def _dump_line(row: dict) -> bytes:
+    return json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _read_rows(path: Path) -> List[dict]:
+    if not path.exists():
+        return []
+    with path.open("rb") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def _migrate_ach(ach_store: ACHStore, ach_log: ACHLogStore) -> int:
+    """Rehash the evidence held by the ACH tables and log, and re-key the story maps.
+
+    Story IDs are evidence keys themselves, so table ``stories`` keys and values and the
+    log's ``story`` fields go through the same old-to-new map.
+    """
+
+    remap: Dict[str, str] = {}
+    changed = 0
+    tables = list(ach_store.load_all().values()) if ach_store.path.exists() else []
+    for table in tables:
+        for entry in table.entries:
+            for evidence in (*entry.supports, *entry.refutes):
+                changed += _rehash_record(evidence, remap)
+    rows = _read_rows(ach_log.path)
+    for row in rows:
+        changed += _rehash_row(row["evidence"], remap)
+    stories = 0
+    for table in tables:
+        rekeyed = {remap.get(key, key): _remap_story(story, remap) for key, story in table.stories.items()}
+        stories += rekeyed != table.stories
+        table.stories = rekeyed
+    for row in rows:
+        story = _remap_story(row.get("story"), remap)
+        stories += story != row.get("story")
+        row["story"] = story
+    if tables and (changed or stories):
+        ach_store.save_all(tables)
+    if rows and (changed or stories):
+        ach_log.rewrite(_dump_line(row) for row in rows)
+    return changed
+
+
+def _migrate_alerts(alert_store: AlertStore) -> int:
+    """Rehash alert event and snapshot evidence, moving the snapshot offset with the log."""
+
+    remap: Dict[str, str] = {}
+    changed = 0
+    statuses, offset, events = alert_store.load_snapshot()
+    for status in statuses:
+        for evidence in status.evidence:
+            changed += _rehash_record(evidence, remap)
+    lines: List[bytes] = []
+    new_offset = 0 if offset == 0 else None
+    if alert_store.path.exists():
+        old_end = new_end = 0
+        with alert_store.path.open("rb") as fh:
+            for line in fh:
+                old_end += len(line)
+                if line.strip():
+                    row = json.loads(line)
+                    for evidence in row.get("evidence") or ():
+                        changed += _rehash_row(evidence, remap)
+                    line = _dump_line(row)
+                    lines.append(line)
+                    new_end += len(line)
+                if old_end == offset:
+                    new_offset = new_end
+    if not changed:
+        return 0
+    if lines:
+        alert_store.rewrite(lines)
+    if new_offset is None:
+        # The snapshot did not end on a line of this log; replay it all instead.
+        alert_store.snapshot_path.unlink(missing_ok=True)
+    elif alert_store.snapshot_path.exists():
+        alert_store.save_snapshot(statuses, new_offset, events)
+    return changed
+
+
+@profiled("evidence.rehash")
+def rehash_evidence_log(
+    store: EvidenceStore,
+    *,
+    dedupe: bool = False,
+    workers: int | None = None,
+    chunk_bytes: int = 8 << 20,
+    ach_store: ACHStore | None = None,
+    ach_log: ACHLogStore | None = None,
+    alert_store: AlertStore | None = None,
+) -> RehashReport:
+    """Rewrite every evidence hash as ``content_hash`` of its canonicalised fields.
+
+    Backfill for logs written before hashes were content-addressed. Newline-aligned
+    byte ranges are hashed by a process pool (inline with one worker or one range) and
+    written back in log order; with ``dedupe`` later lines whose hash was already seen
+    are dropped, so one article collected through several links is kept once.
+
+    Stores that keep copies of evidence are migrated in the same call, so items already
+    assessed are still recognised by ``ACHManager.contains`` afterwards: the ACH tables
+    with their story maps and the ACH log (given ``ach_store`` and ``ach_log``), and the
+    alert event log and snapshot (given ``alert_store``).
+    """
+
+    if workers is None:
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    report = RehashReport()
+    if ach_store is not None and ach_log is not None:
+        report.dependents += _migrate_ach(ach_store, ach_log)
+    if alert_store is not None:
+        report.dependents += _migrate_alerts(alert_store)
+    ranges = store.byte_ranges(chunk_bytes)
+    if not ranges:
+        return report
+    path = str(store.path)
+    if workers <= 1 or len(ranges) <= 1:
+        results = [_rehash_range(path, start, end) for start, end in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            futures = [pool.submit(_rehash_range, path, start, end) for start, end in ranges]
+            results = [future.result() for future in futures]
+
+    seen: Set[str] = set()
+    chunks: List[bytes] = []
+    for digests, lines, changed in results:
+        report.records += len(lines)
+        report.changed += changed
+        kept = []
+        for digest, line in zip(digests, lines):
+            if dedupe and digest in seen:
+                report.duplicates += 1
+                continue
+            seen.add(digest)
+            kept.append(line)
+        chunks.append(b"".join(kept))
+    if report.changed or report.duplicates:
+        store.rewrite(chunks)
+    return report
+
+
+__all__ = ["RehashReport", "rehash_evidence_log"]
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from agent_geo.models.forecast import ForecastEvent
+from agent_geo.profiling import profiled
+from agent_geo.storage import PoolStore
+
+AGGREGATION_METHODS = ("mean", "median", "extremized", "brier_weighted")
+
+_EPS = 1e-3
+
+
+def _grow(array: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    """Return ``array`` padded with NaN to at least ``shape``, doubling only the axes that overflow."""
+
+    if all(current >= wanted for current, wanted in zip(array.shape, shape)):
+        return array
+    new_shape = tuple(
+        current if current >= wanted else max(wanted, 2 * current) for current, wanted in zip(array.shape, shape)
+    )
+    grown = np.full(new_shape, np.nan)
+    grown[tuple(slice(0, n) for n in array.shape)] = array
+    return grown
+
+
+class ForecastPool:
+    """Per-forecaster probabilities for the brier_pool questions.
+
+    Probabilities live in a forecaster × question matrix (NaN where a forecaster has not
+    answered) and outcomes in a question vector (NaN while open), so leaderboards and
+    consensus forecasts are a handful of NumPy reductions over the whole pool.
+    """
+
+    def __init__(self, store: PoolStore | None = None, *, extremize: float = 2.5) -> None:
+        self.store = store or PoolStore()
+        self.extremize = extremize
+        state = self.store.load()
+        self.forecasters: List[str] = list(state.get("forecasters", []))
+        self.questions: List[str] = list(state.get("questions", []))
+        self.due_dates: Dict[str, str] = dict(state.get("due_dates", {}))
+        self._forecaster_index = {name: i for i, name in enumerate(self.forecasters)}
+        self._question_index = {name: j for j, name in enumerate(self.questions)}
+        shape = (max(len(self.forecasters), 4), max(len(self.questions), 8))
+        self._probabilities = np.full(shape, np.nan)
+        self._outcomes = np.full(shape[1], np.nan)
+        if self.forecasters and self.questions:
+            stored = np.array(state.get("probabilities", []), dtype=np.float64)
+            self._probabilities[: stored.shape[0], : stored.shape[1]] = stored
+        if self.questions:
+            outcomes = np.array(state.get("outcomes", []), dtype=np.float64)
+            self._outcomes[: outcomes.shape[0]] = outcomes
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._probabilities[: len(self.forecasters), : len(self.questions)]
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        return self._outcomes[: len(self.questions)]
+
+    def _forecaster(self, name: str) -> int:
+        if name not in self._forecaster_index:
+            self._forecaster_index[name] = len(self.forecasters)
+            self.forecasters.append(name)
+            self._probabilities = _grow(self._probabilities, (len(self.forecasters), len(self.questions)))
+        return self._forecaster_index[name]
+
+    def _question(self, name: str) -> int:
+        if name not in self._question_index:
+            self._question_index[name] = len(self.questions)
+            self.questions.append(name)
+            self._probabilities = _grow(self._probabilities, (len(self.forecasters), len(self.questions)))
+            self._outcomes = _grow(self._outcomes, (len(self.questions),))
+        return self._question_index[name]
+
+    def save(self) -> None:
+        probabilities = self.probabilities
+        outcomes = self.outcomes
+        self.store.save(
+            {
+                "forecasters": self.forecasters,
+                "questions": self.questions,
+                "due_dates": self.due_dates,
+                "probabilities": [
+                    [None if np.isnan(value) else float(value) for value in row] for row in probabilities
+                ],
+                "outcomes": [None if np.isnan(value) else int(value) for value in outcomes],
+            }
+        )
+
+    def submit(
+        self,
+        forecaster: str,
+        question: str,
+        probability: float,
+        *,
+        due_date: date | str | None = None,
+        save: bool = True,
+    ) -> None:
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError(f"probability out of range: {probability}")
+        i = self._forecaster(forecaster)
+        j = self._question(question)
+        self._probabilities[i, j] = probability
+        if due_date is not None:
+            self.due_dates[question] = due_date if isinstance(due_date, str) else due_date.isoformat()
+        if save:
+            self.save()
+
+    @profiled("forecast.pool.ingest")
+    def ingest_brier_pool(self, forecaster: str, payload: dict) -> int:
+        """Load one forecaster's answer to the ``brier_pool`` prompt (``events`` list)."""
+
+        count = 0
+        for item in payload.get("events", []):
+            self.submit(forecaster, item["event"], float(item["p"]), due_date=item.get("deadline"), save=False)
+            if item.get("outcome") is not None:
+                self._outcomes[self._question_index[item["event"]]] = int(item["outcome"])
+            count += 1
+        self.save()
+        return count
+
+    def resolve(self, question: str, outcome: int, *, save: bool = True) -> None:
+        if question not in self._question_index:
+            raise KeyError(f"Unknown pool question: {question}")
+        if outcome not in (0, 1):
+            raise ValueError(f"outcome must be 0 or 1, got {outcome}")
+        self._outcomes[self._question_index[question]] = outcome
+        if save:
+            self.save()
+
+    def brier_matrix(self) -> np.ndarray:
+        """Squared error per forecaster × question (NaN where unanswered or unresolved)."""
+
+        return (self.probabilities - self.outcomes[np.newaxis, :]) ** 2
+
+    def forecaster_brier(self) -> np.ndarray:
+        scores = self.brier_matrix()
+        counts = np.sum(~np.isnan(scores), axis=1)
+        totals = np.nansum(scores, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, totals / counts, np.nan)
+
+    def _weights(self) -> np.ndarray:
+        briers = self.forecaster_brier()
+        weights = 1.0 / (briers + _EPS)
+        known = ~np.isnan(weights)
+        fallback = float(np.median(weights[known])) if known.any() else 1.0
+        return np.where(known, weights, fallback)
+
+    @profiled("forecast.pool.aggregate")
+    def aggregate(self, method: str = "mean") -> np.ndarray:
+        """Consensus probability per question (NaN where nobody has answered)."""
+
+        probabilities = self.probabilities
+        answered = ~np.isnan(probabilities)
+        counts = answered.sum(axis=0)
+        result = np.full(len(self.questions), np.nan)
+        has_answers = counts > 0
+        if not has_answers.any():
+            return result
+        columns = probabilities[:, has_answers]
+        if method == "mean":
+            result[has_answers] = np.nanmean(columns, axis=0)
+        elif method == "median":
+            result[has_answers] = np.nanmedian(columns, axis=0)
+        elif method == "extremized":
+            clipped = np.clip(columns, 0.01, 0.99)
+            log_odds = np.nanmean(np.log(clipped / (1.0 - clipped)), axis=0)
+            result[has_answers] = 1.0 / (1.0 + np.exp(-self.extremize * log_odds))
+        elif method == "brier_weighted":
+            weights = self._weights()[:, np.newaxis] * ~np.isnan(columns)
+            result[has_answers] = np.nansum(weights * columns, axis=0) / weights.sum(axis=0)
+        else:
+            raise ValueError(f"Unknown aggregation method {method!r}; choose from {AGGREGATION_METHODS}")
+        return result
+
+    def consensus(self, question: str, method: str = "mean") -> float:
+        if question not in self._question_index:
+            raise KeyError(f"Unknown pool question: {question}")
+        return float(self.aggregate(method)[self._question_index[question]])
+
+    def leaderboard(self) -> List[dict]:
+        probabilities = self.probabilities
+        answered = (~np.isnan(probabilities)).sum(axis=1)
+        scores = self.brier_matrix()
+        resolved = (~np.isnan(scores)).sum(axis=1)
+        mean_brier = self.forecaster_brier()
+        order = np.lexsort((-resolved, np.where(np.isnan(mean_brier), np.inf, mean_brier)))
+        rows = []
+        for rank, i in enumerate(order, start=1):
+            rows.append(
+                {
+                    "rank": rank,
+                    "forecaster": self.forecasters[i],
+                    "answered": int(answered[i]),
+                    "resolved": int(resolved[i]),
+                    "brier": None if np.isnan(mean_brier[i]) else float(mean_brier[i]),
+                }
+            )
+        return rows
+
+    def to_events(self, method: str = "mean", questions: Optional[Iterable[str]] = None) -> List[ForecastEvent]:
+        """Consensus forecasts as ledger events for questions that carry a due date."""
+
+        consensus = self.aggregate(method)
+        wanted = set(questions) if questions is not None else None
+        events = []
+        for j, name in enumerate(self.questions):
+            if wanted is not None and name not in wanted:
+                continue
+            if name not in self.due_dates or np.isnan(consensus[j]):
+                continue
+            events.append(
+                ForecastEvent(
+                    event=name,
+                    due_date=date.fromisoformat(self.due_dates[name]),
+                    probability=float(consensus[j]),
+                    rationale=f"pool consensus ({method}) of {int((~np.isnan(self.probabilities[:, j])).sum())} forecasters",
+                )
+            )
+        return events
+
+
+__all__ = ["AGGREGATION_METHODS", "ForecastPool"]
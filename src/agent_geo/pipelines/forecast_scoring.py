@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from agent_geo.models.forecast import ForecastEvent
+
+
+def _epoch(value: datetime | date) -> float:
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.max)
+    return value.timestamp()
+
+
+@dataclass(slots=True)
+class RevisionSeries:
+    """Struct-of-arrays view over every probability revision in the ledger.
+
+    Revisions are flattened event by event (CSR layout): the revisions of event ``i``
+    live in ``times[offsets[i]:offsets[i + 1]]`` / ``probs[...]``. Every event owns at
+    least one revision; ledgers written before revisions existed get a single synthetic
+    revision at resolution time, which makes their time-weighted score equal the plain
+    Brier score. Unresolved events of that kind have no creation time, so theirs is
+    placed at the earliest time in the ledger and they appear in every ``as_of`` view.
+    """
+
+    names: List[str]
+    offsets: np.ndarray  # int64, len(names) + 1
+    owner: np.ndarray  # int64, event index of each revision
+    times: np.ndarray  # float64 epoch seconds
+    probs: np.ndarray  # float64
+    outcomes: np.ndarray  # float64, NaN while unresolved
+    resolved: np.ndarray  # float64 epoch seconds, NaN while unresolved
+
+    @classmethod
+    def from_events(cls, events: Sequence[ForecastEvent]) -> "RevisionSeries":
+        names: List[str] = []
+        counts: List[int] = []
+        times: List[float] = []
+        probs: List[float] = []
+        outcomes = np.full(len(events), np.nan)
+        resolved = np.full(len(events), np.nan)
+        undated: List[int] = []  # positions in ``times`` of unresolved events without revisions
+        for i, event in enumerate(events):
+            names.append(event.event)
+            if event.outcome is not None:
+                outcomes[i] = event.outcome
+                resolved[i] = _epoch(event.resolved_at or event.due_date)
+            if event.revisions:
+                counts.append(len(event.revisions))
+                for issued_at, probability in event.revisions:
+                    times.append(issued_at.timestamp())
+                    probs.append(probability)
+            else:
+                counts.append(1)
+                if event.outcome is None:
+                    undated.append(len(times))
+                times.append(resolved[i])
+                probs.append(event.probability)
+        if undated:
+            known = [value for value in times if not np.isnan(value)] + list(resolved[~np.isnan(resolved)])
+            earliest = min(known, default=-np.inf)
+            for position in undated:
+                times[position] = earliest
+        count_array = np.asarray(counts, dtype=np.int64)
+        offsets = np.zeros(len(events) + 1, dtype=np.int64)
+        np.cumsum(count_array, out=offsets[1:])
+        return cls(
+            names=names,
+            offsets=offsets,
+            owner=np.repeat(np.arange(len(events), dtype=np.int64), count_array),
+            times=np.asarray(times, dtype=np.float64),
+            probs=np.asarray(probs, dtype=np.float64),
+            outcomes=outcomes,
+            resolved=resolved,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def time_weighted_brier(self) -> np.ndarray:
+        """Brier score integrated over each forecast's lifetime (NaN while unresolved).
+
+        Each revision is held from its timestamp until the next revision, or until the
+        resolution time for the last one, so early correct calls score better than late
+        ones. Forecasts with zero lifetime fall back to the final-probability Brier.
+        """
+
+        n_events = len(self.names)
+        if n_events == 0:
+            return np.empty(0)
+        owner = self.owner
+        end = self.resolved[owner]
+        following = np.empty_like(self.times)
+        following[:-1] = self.times[1:]
+        last = self.offsets[1:] - 1
+        following[last] = end[last]
+        following = np.minimum(following, end)
+        durations = np.clip(following - self.times, 0.0, None)
+        durations = np.nan_to_num(durations, nan=0.0)
+        errors = (self.probs - self.outcomes[owner]) ** 2
+        weighted = np.bincount(owner, weights=np.nan_to_num(durations * errors), minlength=n_events)
+        total = np.bincount(owner, weights=durations, minlength=n_events)
+        final = (self.probs[last] - self.outcomes) ** 2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = np.where(total > 0, weighted / total, final)
+        scores[np.isnan(self.outcomes)] = np.nan
+        return scores
+
+    def probabilities_as_of(self, when: datetime | date) -> np.ndarray:
+        """Latest probability issued at or before ``when`` (NaN before the first revision)."""
+
+        if not self.names:
+            return np.empty(0)
+        cutoff = _epoch(when)
+        positions = np.where(self.times <= cutoff, np.arange(len(self.times)), -1)
+        latest = np.maximum.reduceat(positions, self.offsets[:-1])
+        return np.where(latest >= 0, self.probs[np.maximum(latest, 0)], np.nan)
+
+    def outcomes_as_of(self, when: datetime | date) -> np.ndarray:
+        """Outcomes known at ``when`` (NaN for questions still open at that date)."""
+
+        with np.errstate(invalid="ignore"):
+            known = self.resolved <= _epoch(when)
+        return np.where(known, self.outcomes, np.nan)
+
+
+@dataclass(slots=True)
+class BrierTally:
+    total: float = 0.0
+    count: int = 0
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def add(self, brier: float, sign: int = 1) -> None:
+        self.total += sign * brier
+        self.count += sign
+        if self.count == 0:
+            self.total = 0.0  # drop accumulated float drift once the bucket empties
+
+
+@dataclass(slots=True)
+class ScoreAggregates:
+    """Running Brier sums and counts, overall and bucketed by score month and tag.
+
+    ``add``/``remove`` are O(1) in the ledger size (O(tags) per event), so the tracker
+    keeps these current on every finalize and persists them next to the ledger.
+    """
+
+    overall: BrierTally = field(default_factory=BrierTally)
+    by_month: Dict[str, BrierTally] = field(default_factory=dict)
+    by_tag: Dict[str, BrierTally] = field(default_factory=dict)
+
+    @classmethod
+    def from_events(cls, events: Iterable[ForecastEvent]) -> "ScoreAggregates":
+        aggregates = cls()
+        for event in events:
+            aggregates.add(event)
+        return aggregates
+
+    def _apply(self, event: ForecastEvent, sign: int) -> None:
+        if event.brier is None:
+            return
+        self.overall.add(event.brier, sign)
+        buckets = [(self.by_month, event.score_month())]
+        buckets.extend((self.by_tag, tag) for tag in dict.fromkeys(event.tags))
+        for table, key in buckets:
+            tally = table.setdefault(key, BrierTally())
+            tally.add(event.brier, sign)
+            if tally.count == 0:
+                del table[key]
+
+    def add(self, event: ForecastEvent) -> None:
+        self._apply(event, 1)
+
+    def remove(self, event: ForecastEvent) -> None:
+        self._apply(event, -1)
+
+    def to_dict(self) -> dict:
+        def dump(tally: BrierTally) -> dict:
+            return {"total": tally.total, "count": tally.count, "mean": tally.mean}
+
+        return {
+            "overall": dump(self.overall),
+            "by_month": {key: dump(value) for key, value in sorted(self.by_month.items())},
+            "by_tag": {key: dump(value) for key, value in sorted(self.by_tag.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "ScoreAggregates":
+        def load(item: dict) -> BrierTally:
+            return BrierTally(total=float(item["total"]), count=int(item["count"]))
+
+        return cls(
+            overall=load(payload["overall"]),
+            by_month={key: load(value) for key, value in payload.get("by_month", {}).items()},
+            by_tag={key: load(value) for key, value in payload.get("by_tag", {}).items()},
+        )
+
+
+__all__ = ["BrierTally", "RevisionSeries", "ScoreAggregates"]
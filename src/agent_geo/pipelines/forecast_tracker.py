@@ -1,43 +1,256 @@
 from __future__ import annotations
 
-from datetime import date
-from statistics import mean
-from typing import Iterable, List
+import heapq
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from agent_geo.models.forecast import ForecastEvent
+from agent_geo.pipelines.forecast_scoring import RevisionSeries, ScoreAggregates
+from agent_geo.profiling import profiled
 from agent_geo.storage import ForecastStore
 
 
 class ForecastTracker:
+    """Forecast ledger keyed by event name with a due-date heap for pending questions.
+
+    ``_index`` is the source of truth (insertion ordered, one entry per event name).
+    ``_due_heap`` holds ``(due_date, seq, name)`` tuples for unresolved events and is
+    cleaned lazily: an entry is live only while it matches the indexed event's due date
+    and sequence number and the event has no outcome yet.
+    """
+
+    @profiled("forecast.init")
     def __init__(self, store: ForecastStore | None = None) -> None:
         self.store = store or ForecastStore()
-        self.events: List[ForecastEvent] = self.store.load()
+        self._index: Dict[str, ForecastEvent] = {}
+        self._due_heap: List[Tuple[date, int, str]] = []
+        self._heap_seq: Dict[str, int] = {}
+        self._seq = 0
+        self._series: RevisionSeries | None = None
+        for event in self.store.load():
+            # Older ledgers may contain duplicate names; the last write wins.
+            self._index.pop(event.event, None)
+            self._index[event.event] = event
+        for event in self._index.values():
+            self._schedule(event)
+        self.scores = self._load_scores()
 
-    def add_event(self, event: ForecastEvent) -> None:
-        self.events.append(event)
-        self.store.save(self.events)
+    def _load_scores(self) -> ScoreAggregates:
+        stored = self.store.load_scores()
+        if stored is not None and stored.get("ledger") == self.store.ledger_stamp():
+            return ScoreAggregates.from_dict(stored)
+        # Missing or stale sidecar (ledger written since, e.g. edited by hand): rebuild once and persist.
+        aggregates = ScoreAggregates.from_events(self._index.values())
+        if stored is not None or any(event.brier is not None for event in self._index.values()):
+            self.store.save_scores(aggregates.to_dict())
+        return aggregates
 
-    def finalize(self, event_name: str, outcome: int) -> None:
-        for event in self.events:
-            if event.event == event_name:
-                event.finalize(outcome)
-                self.store.save(self.events)
-                return
-        raise KeyError(f"Event not found: {event_name}")
+    def _save(self) -> None:
+        # Always after the ledger, so the sidecar carries the stamp of the file it matches.
+        self.store.save(self._index.values())
+        self.store.save_scores(self.scores.to_dict())
 
-    def pending(self) -> List[ForecastEvent]:
-        today = date.today()
-        return [event for event in self.events if event.outcome is None and event.due_date >= today]
+    @property
+    def events(self) -> List[ForecastEvent]:
+        return list(self._index.values())
 
-    def aggregate_brier(self) -> float | None:
-        scored = [event.brier for event in self.events if event.brier is not None]
-        if not scored:
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, event_name: object) -> bool:
+        return event_name in self._index
+
+    def get(self, event_name: str) -> ForecastEvent:
+        try:
+            return self._index[event_name]
+        except KeyError:
+            raise KeyError(f"Event not found: {event_name}") from None
+
+    def _schedule(self, event: ForecastEvent) -> None:
+        if event.outcome is not None:
+            self._heap_seq.pop(event.event, None)
+            return
+        self._seq += 1
+        self._heap_seq[event.event] = self._seq
+        heapq.heappush(self._due_heap, (event.due_date, self._seq, event.event))
+        # Rebuild once stale entries dominate so the heap stays O(pending).
+        if len(self._due_heap) > 2 * len(self._heap_seq) + 64:
+            self._compact_heap()
+
+    def _is_live(self, item: Tuple[date, int, str]) -> bool:
+        due, seq, name = item
+        return self._heap_seq.get(name) == seq
+
+    def _compact_heap(self) -> None:
+        self._due_heap = [item for item in self._due_heap if self._is_live(item)]
+        heapq.heapify(self._due_heap)
+
+    def _drop_stale_top(self) -> None:
+        while self._due_heap and not self._is_live(self._due_heap[0]):
+            heapq.heappop(self._due_heap)
+
+    @profiled("forecast.add_event")
+    def add_event(self, event: ForecastEvent, at: datetime | None = None) -> None:
+        """Insert or replace the event with the same name, then persist the ledger.
+
+        Replacing an unresolved event keeps its revision history and records the new
+        probability as a further revision instead of overwriting it. ``tags``,
+        ``rationale`` and ``postmortem_link`` left unset on ``event`` keep their stored
+        values, so the event stays in the same score buckets.
+        """
+
+        previous = self._index.get(event.event)
+        if previous is not None:
+            self.scores.remove(previous)
+            if not event.tags:
+                event.tags = list(previous.tags)
+            if event.rationale is None:
+                event.rationale = previous.rationale
+            if event.postmortem_link is None:
+                event.postmortem_link = previous.postmortem_link
+        self.scores.add(event)
+        if previous is not None and previous.outcome is None and event.outcome is None:
+            history = sorted([*previous.revisions, *event.revisions], key=lambda item: item[0])
+            event.revisions = history
+            if not history or history[-1][1] != event.probability:
+                event.revise(event.probability, at)
+        elif not event.revisions:
+            event.revise(event.probability, at)
+        self._index[event.event] = event
+        self._schedule(event)
+        self._series = None
+        self._save()
+
+    def revise(self, event_name: str, probability: float, at: datetime | None = None) -> ForecastEvent:
+        event = self.get(event_name)
+        if event.outcome is not None:
+            raise ValueError(f"Event already resolved: {event_name}")
+        event.revise(probability, at)
+        self._series = None
+        self._save()
+        return event
+
+    @profiled("forecast.finalize")
+    def finalize(self, event_name: str, outcome: int, at: datetime | None = None) -> None:
+        event = self.get(event_name)
+        self.scores.remove(event)
+        event.finalize(outcome, at)
+        self.scores.add(event)
+        self._heap_seq.pop(event_name, None)
+        self._series = None
+        self._save()
+
+    @profiled("forecast.series")
+    def series(self) -> RevisionSeries:
+        if self._series is None:
+            self._series = RevisionSeries.from_events(list(self._index.values()))
+        return self._series
+
+    def time_weighted_brier(self) -> float | None:
+        scores = self.series().time_weighted_brier()
+        scored = scores[~np.isnan(scores)]
+        if scored.size == 0:
+            return None
+        return float(scored.mean())
+
+    @profiled("forecast.as_of")
+    def as_of(self, when: datetime | date) -> List[dict]:
+        """Ledger rows as they stood at ``when``: latest probability then, and outcome if known."""
+
+        series = self.series()
+        probabilities = series.probabilities_as_of(when)
+        outcomes = series.outcomes_as_of(when)
+        rows = []
+        for i, event in enumerate(self._index.values()):
+            if np.isnan(probabilities[i]):
+                continue
+            outcome = None if np.isnan(outcomes[i]) else int(outcomes[i])
+            probability = float(probabilities[i])
+            rows.append(
+                {
+                    "event": event.event,
+                    "due_date": event.due_date.isoformat(),
+                    "probability": probability,
+                    "outcome": outcome,
+                    "brier": None if outcome is None else (probability - outcome) ** 2,
+                    "rationale": event.rationale,
+                }
+            )
+        return rows
+
+    def next_due(self) -> ForecastEvent | None:
+        """Return the unresolved event with the earliest due date."""
+
+        self._drop_stale_top()
+        if not self._due_heap:
             return None
-        return float(mean(scored))
+        return self._index[self._due_heap[0][2]]
+
+    def overdue(self, today: date | None = None) -> List[ForecastEvent]:
+        """Unresolved events whose due date has passed, earliest first.
+
+        Walks only the heap nodes with ``due_date < today`` (a heap subtree whose root is
+        not overdue cannot contain overdue children), so the sweep costs O(k log k) for k
+        overdue events rather than a scan over the whole ledger.
+        """
+
+        today = today or date.today()
+        heap = self._due_heap
+        found: List[Tuple[date, int, str]] = []
+        stack = [0] if heap else []
+        while stack:
+            position = stack.pop()
+            item = heap[position]
+            if item[0] >= today:
+                continue
+            if self._is_live(item):
+                found.append(item)
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    stack.append(child)
+        found.sort()
+        return [self._index[name] for _, _, name in found]
+
+    def pending(self, today: date | None = None) -> List[ForecastEvent]:
+        """Unresolved events not yet due, earliest first.
+
+        Descends through the overdue top of the heap to the roots of the not-yet-due
+        subtrees, then pops those in order from a frontier heap seeded with the roots, so
+        the output comes out sorted without sorting the whole ledger.
+        """
+
+        today = today or date.today()
+        heap = self._due_heap
+        frontier: List[Tuple[Tuple[date, int, str], int]] = []
+        stack = [0] if heap else []
+        while stack:
+            position = stack.pop()
+            if heap[position][0] >= today:
+                frontier.append((heap[position], position))
+                continue
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    stack.append(child)
+        heapq.heapify(frontier)
+        found: List[ForecastEvent] = []
+        while frontier:
+            item, position = heapq.heappop(frontier)
+            if self._is_live(item):
+                found.append(self._index[item[2]])
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return found
+
+    def aggregate_brier(self) -> float | None:
+        return self.scores.overall.mean
 
     def to_rows(self) -> List[dict]:
         rows = []
-        for event in self.events:
+        weighted = self.series().time_weighted_brier()
+        for i, event in enumerate(self._index.values()):
             rows.append(
                 {
                     "event": event.event,
@@ -45,10 +258,21 @@ class ForecastTracker:
                     "probability": event.probability,
                     "outcome": event.outcome,
                     "brier": event.brier,
+                    "time_weighted_brier": None if np.isnan(weighted[i]) else float(weighted[i]),
+                    "revisions": len(event.revisions),
                     "rationale": event.rationale,
                 }
             )
         return rows
 
 
-__all__ = ["ForecastTracker"]
+def parse_as_of(value: str) -> datetime | date:
+    """Parse an ``as_of`` argument; a bare date means the end of that day, not midnight."""
+
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value)
+
+
+__all__ = ["ForecastTracker", "parse_as_of"]
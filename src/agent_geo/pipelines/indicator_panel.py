@@ -1,13 +1,28 @@
 from __future__ import annotations
 
-from datetime import datetime
+import csv
+import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
 
 from agent_geo.config import INDICATOR_TEMPLATES, IndicatorTemplate
 from agent_geo.models.evidence import EvidenceRecord
-from agent_geo.models.indicator import IndicatorRecord, IndicatorStatus
-from agent_geo.storage import EvidenceStore, PanelStore
+from agent_geo.models.indicator import IndicatorHistoryEntry, IndicatorRecord, IndicatorStatus
+from agent_geo.pipelines.panel_diff import PanelChangeSet, diff_history
+from agent_geo.pipelines.panel_scoring import PanelScorer, ScoreSeries, score_history
+from agent_geo.profiling import profiled
+from agent_geo.storage import EvidenceStore, PanelHistoryStore, PanelStore
+
+
+def _utc(moment: datetime) -> datetime:
+    """Naive UTC, matching ``datetime.utcnow()`` used for every other panel timestamp."""
+
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class IndicatorPanelBuilder:
@@ -16,17 +31,21 @@ class IndicatorPanelBuilder:
         templates: Iterable[IndicatorTemplate] = INDICATOR_TEMPLATES,
         panel_store: PanelStore | None = None,
         evidence_store: EvidenceStore | None = None,
+        history_store: PanelHistoryStore | None = None,
     ) -> None:
         self.templates = list(templates)
         self.panel_store = panel_store or PanelStore()
         self.evidence_store = evidence_store or EvidenceStore()
+        self.history_store = history_store or PanelHistoryStore()
         self.records: Dict[str, IndicatorRecord] = {t.key: IndicatorRecord.from_template(t) for t in self.templates}
         self._load_existing()
+        self.scorer = PanelScorer(self.records.values())
 
     def _load_existing(self) -> None:
         existing = {record.template_key: record for record in self.panel_store.load()}
         self.records.update(existing)
 
+    @profiled("panel.update_indicator")
     def update_indicator(
         self,
         key: str,
@@ -49,11 +68,115 @@ class IndicatorPanelBuilder:
         record.confidence = confidence
         record.analyst_note = analyst_note
         record.date = datetime.utcnow()
+        self.scorer.update(record)
         if evidence:
             self.evidence_store.append(evidence)
+        self.history_store.append(
+            IndicatorHistoryEntry(recorded_at=record.date, record=record.model_copy(), evidence=evidence)
+        )
         self.panel_store.save(self.records.values())
         return record
 
+    @profiled("panel.import_rows")
+    def import_rows(self, rows: Iterable[Tuple[int, dict]]) -> List[IndicatorRecord]:
+        """Validate every ``(line, row)`` first, then apply them all with one save.
+
+        Rows name their indicator by ``template_key`` (or ``key``) or, as in
+        ``export_csv`` output, by the ``indicator`` label. Fields left empty keep the
+        current value; ``evidence`` (or flat ``evidence_*`` columns) attach an
+        ``EvidenceRecord``. Rows that change nothing but the date and carry no evidence
+        are skipped, so re-importing an unchanged export writes no history. Changed
+        records are dated ``imported_at`` unless the row gives a new ``date``; a date with
+        a UTC offset is stored as naive UTC like the rest of the history log. Any
+        invalid row aborts the import before anything is written.
+        """
+
+        by_label = {record.indicator: key for key, record in self.records.items()}
+        staged: Dict[str, IndicatorRecord] = {}
+        updates: List[Tuple[IndicatorRecord, Optional[EvidenceRecord]]] = []
+        errors: List[str] = []
+        imported_at = datetime.utcnow()
+        for line, row in rows:
+            row = {name: value for name, value in row.items() if name and value not in (None, "")}
+            key = row.pop("template_key", None) or row.pop("key", None) or by_label.get(row.get("indicator", ""))
+            if key not in self.records:
+                errors.append(f"line {line}: unknown indicator {key or row.get('indicator')!r}")
+                continue
+            evidence_payload = row.pop("evidence", None) or {
+                name[len("evidence_") :]: row.pop(name) for name in list(row) if name.startswith("evidence_")
+            }
+            for fixed in ("dimension", "indicator"):
+                row.pop(fixed, None)
+            current = staged.get(key, self.records[key])
+            try:
+                record = IndicatorRecord.model_validate({**current.model_dump(), **row, "template_key": key})
+                evidence = EvidenceRecord.model_validate(evidence_payload) if evidence_payload else None
+            except ValidationError as exc:
+                fields = ", ".join(".".join(str(part) for part in error["loc"]) for error in exc.errors())
+                errors.append(f"line {line}: invalid {fields}")
+                continue
+            if record.date is not None:
+                record.date = _utc(record.date)
+            if evidence is None and record.model_copy(update={"date": current.date}) == current:
+                continue
+            if record.date == current.date:
+                record.date = imported_at
+            staged[key] = record
+            updates.append((record, evidence))
+        if errors:
+            raise ValueError("Panel import rejected:\n" + "\n".join(errors))
+        if not updates:
+            return []
+
+        self.records.update(staged)
+        for record in staged.values():
+            self.scorer.update(record)
+        self.evidence_store.append_many(evidence for _, evidence in updates if evidence is not None)
+        self.history_store.append_many(
+            IndicatorHistoryEntry(recorded_at=record.date or imported_at, record=record, evidence=evidence)
+            for record, evidence in updates
+        )
+        self.panel_store.save(self.records.values())
+        return list(staged.values())
+
+    def import_file(self, path: Path | str) -> List[IndicatorRecord]:
+        """Bulk update from a ``.csv`` (e.g. ``export_csv`` output) or ``.jsonl`` file."""
+
+        return self.import_rows(_read_rows(Path(path)))
+
+    def scores(self) -> dict:
+        """Current weighted composite risk (0 green … 1 red) per dimension and overall."""
+
+        return {"dimensions": self.scorer.dimension_scores(), "overall": self.scorer.overall()}
+
+    @profiled("panel.score_series")
+    def score_series(self) -> ScoreSeries:
+        """Composite scores after every recorded update, recomputed from the history log."""
+
+        return score_history(self.history_store.load(), self.templates)
+
+    @profiled("panel.diff")
+    def diff(self, since: datetime, until: datetime | None = None) -> PanelChangeSet:
+        """Changes between the panel as of ``since`` and as of ``until`` (default: now).
+
+        Bounds with a UTC offset, and aware ``recorded_at`` values written before imports
+        normalised them, are compared as naive UTC.
+        """
+
+        baseline = {template.key: IndicatorRecord.from_template(template) for template in self.templates}
+        entries = (
+            entry
+            if entry.recorded_at.tzinfo is None
+            else entry.model_copy(update={"recorded_at": _utc(entry.recorded_at)})
+            for entry in self.history_store.load()
+        )
+        end = _utc(until) if until else datetime.utcnow()
+        return diff_history(entries, baseline, start=_utc(since), end=end)
+
+    def weekly_diff(self, until: datetime | None = None) -> PanelChangeSet:
+        until = until or datetime.utcnow()
+        return self.diff(until - timedelta(days=7), until)
+
     def to_rows(self) -> List[dict]:
         rows = []
         for record in self.records.values():
@@ -73,9 +196,8 @@ class IndicatorPanelBuilder:
             )
         return rows
 
+    @profiled("panel.export_csv")
     def export_csv(self, path: Path | str) -> Path:
-        import csv
-
         destination = Path(path)
         destination.parent.mkdir(parents=True, exist_ok=True)
         with destination.open("w", newline="", encoding="utf-8") as fh:
@@ -99,4 +221,15 @@ class IndicatorPanelBuilder:
         return destination
 
 
+def _read_rows(path: Path) -> Iterator[Tuple[int, dict]]:
+    with path.open("r", newline="", encoding="utf-8-sig") as fh:
+        if path.suffix.lower() == ".csv":
+            # Header is line 1, so the first data row is line 2.
+            yield from enumerate(csv.DictReader(fh), start=2)
+        else:
+            for line, text in enumerate(fh, start=1):
+                if text.strip():
+                    yield line, json.loads(text)
+
+
 __all__ = ["IndicatorPanelBuilder"]
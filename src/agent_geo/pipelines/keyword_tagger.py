@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from agent_geo.config import (
+    ENTRAPMENT_SIGNALS,
+    INDICATOR_TAG_TERMS,
+    INDICATOR_TEMPLATES,
+    EntrapmentSignalDefinition,
+    IndicatorTemplate,
+)
+from agent_geo.models.evidence import EvidenceRecord, evidence_text
+from agent_geo.profiling import profiled
+
+_QUOTED = re.compile(r"'([^']{3,})'")
+_ACRONYM = re.compile(r"\b[A-Z]{3,}\b")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def description_terms(description: str) -> List[str]:
+    """Quoted phrases and acronyms from a template description, e.g. 'existential crisis situation', NSC."""
+
+    return _QUOTED.findall(description) + _ACRONYM.findall(description)
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over casefolded patterns.
+
+    ``search`` walks the text once, following failure links on mismatch, and reports the
+    id of every pattern ending at each position. Patterns that begin with an ASCII
+    letter/digit must start on a word boundary, so "NSC" does not fire inside "transcript";
+    their end is left open so inflected forms still match ("russia" in "Russian", "north
+    korea" in "North Korean"). CJK patterns match anywhere.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.patterns = [pattern.casefold() for pattern in patterns]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        for pattern_id, pattern in enumerate(self.patterns):
+            self._insert(pattern, pattern_id)
+        self._link()
+        self._bounded = [bool(pattern) and _is_word_char(pattern[0]) for pattern in self.patterns]
+
+    def _insert(self, pattern: str, pattern_id: int) -> None:
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] += (pattern_id,)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def search(self, text: str) -> Iterable[Tuple[int, int]]:
+        """Yield ``(end, pattern_id)`` for each match; ``end`` is exclusive, in ``text.casefold()``."""
+
+        folded = text.casefold()
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for position, char in enumerate(folded):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not out[node]:
+                continue
+            end = position + 1
+            for pattern_id in out[node]:
+                start = end - len(self.patterns[pattern_id])
+                if self._bounded[pattern_id] and start > 0 and _is_word_char(folded[start - 1]):
+                    continue
+                yield end, pattern_id
+
+
+@dataclass(slots=True)
+class EvidenceTags:
+    signals: List[str] = field(default_factory=list)
+    indicators: List[str] = field(default_factory=list)
+
+    @property
+    def keys(self) -> List[str]:
+        return self.signals + self.indicators
+
+
+class KeywordTagger:
+    """Tags evidence with every matching entrapment signal and indicator key in one pass.
+
+    Signals use their ``rule_terms`` (every group must hit); indicators match on any of the
+    quoted phrases/acronyms in their description plus ``INDICATOR_TAG_TERMS``. All terms
+    are compiled into a single ``AhoCorasick`` automaton whose outputs point at
+    ``(key, group)`` slots, so text length — not vocabulary size — drives the cost.
+    """
+
+    @profiled("tagger.compile")
+    def __init__(
+        self,
+        signals: Iterable[EntrapmentSignalDefinition] = ENTRAPMENT_SIGNALS,
+        templates: Iterable[IndicatorTemplate] = INDICATOR_TEMPLATES,
+        terms: Mapping[str, Iterable[str]] = INDICATOR_TAG_TERMS,
+    ) -> None:
+        self.signal_keys: List[str] = []
+        self.indicator_keys: List[str] = []
+        self._groups: List[int] = []  # groups required per key id
+        slots: List[Tuple[int, int]] = []
+        pattern_slots: Dict[str, List[int]] = {}
+
+        def add(key_id: int, group: int, term: str) -> None:
+            folded = term.strip().casefold()
+            if not folded:
+                return
+            slot = len(slots)
+            slots.append((key_id, group))
+            pattern_slots.setdefault(folded, []).append(slot)
+
+        for definition in signals:
+            groups = [group for group in definition.rule_terms if group]
+            if not groups:
+                continue
+            key_id = len(self._groups)
+            self.signal_keys.append(definition.key)
+            self._groups.append(len(groups))
+            for group_id, group in enumerate(groups):
+                for term in group:
+                    add(key_id, group_id, term)
+        for template in templates:
+            vocabulary = description_terms(template.description) + list(terms.get(template.key, ()))
+            if not vocabulary:
+                continue
+            key_id = len(self._groups)
+            self.indicator_keys.append(template.key)
+            self._groups.append(1)
+            for term in vocabulary:
+                add(key_id, 0, term)
+
+        self._keys = self.signal_keys + self.indicator_keys
+        self._slots = slots
+        self._pattern_slots = list(pattern_slots.values())
+        self.automaton = AhoCorasick(list(pattern_slots))
+
+    def tag_text(self, text: str) -> EvidenceTags:
+        hits: Dict[int, set[int]] = {}
+        for _, pattern_id in self.automaton.search(text):
+            for slot in self._pattern_slots[pattern_id]:
+                key_id, group = self._slots[slot]
+                hits.setdefault(key_id, set()).add(group)
+        tags = EvidenceTags()
+        signal_count = len(self.signal_keys)
+        for key_id in sorted(hits):
+            if len(hits[key_id]) < self._groups[key_id]:
+                continue
+            bucket = tags.signals if key_id < signal_count else tags.indicators
+            bucket.append(self._keys[key_id])
+        return tags
+
+    def tag(self, evidence: EvidenceRecord) -> EvidenceTags:
+        return self.tag_text(evidence_text(evidence))
+
+    @profiled("tagger.tag_many")
+    def tag_many(self, evidence: Iterable[EvidenceRecord], *, apply: bool = False) -> List[EvidenceTags]:
+        """Tag a batch; with ``apply`` each record's ``tags`` field is overwritten."""
+
+        results = []
+        for item in evidence:
+            tags = self.tag(item)
+            if apply:
+                item.tags = tags.keys
+            results.append(tags)
+        return results
+
+
+__all__ = ["AhoCorasick", "KeywordTagger", "EvidenceTags", "description_terms"]
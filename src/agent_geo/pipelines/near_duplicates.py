@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+import zlib
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from agent_geo.models.evidence import EvidenceRecord, evidence_text
+from agent_geo.pipelines.ach_matrix import evidence_key
+from agent_geo.profiling import profiled
+
+_CJK = r"\u3040-\u30ff\u3100-\u312f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+# One token per CJK character (kana, hanzi/kanji, hangul), one per run of other word characters.
+_TOKEN = re.compile(rf"[{_CJK}]|[^\W_{_CJK}]+")
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+
+def tokens(text: str) -> List[str]:
+    return _TOKEN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def shingles(text: str, size: int = 2) -> List[str]:
+    """Overlapping ``size``-token shingles: character n-grams inside CJK runs, word n-grams elsewhere.
+
+    Chinese and Japanese have no spaces, so each CJK character is a token; Latin text is
+    split into words. Texts shorter than ``size`` tokens become a single shingle.
+    """
+
+    items = tokens(text)
+    if len(items) <= size:
+        return [" ".join(items)] if items else []
+    return [" ".join(items[i : i + size]) for i in range(len(items) - size + 1)]
+
+
+class NearDuplicateIndex:
+    """MinHash signatures with LSH banding for clustering syndicated copies of a story.
+
+    Each text gets a ``num_perm`` MinHash signature over its shingles, built with
+    vectorised multiply-shift hashes. The signature is cut into ``bands`` bands, and
+    items that share any band bucket become candidates. An insert compares only
+    against those candidates, so it costs time in proportion to the bucket sizes, not
+    the corpus size. A bucket holds at most one item per cluster, so a story that
+    spreads to hundreds of outlets does not slow later inserts. The new item joins the
+    cluster of its most similar candidate whose estimated Jaccard similarity is at least
+    ``threshold``; otherwise it starts a new cluster. A cluster ID is the key of the
+    cluster's first member and never changes, even if that member is later removed.
+    ``remove`` takes a key out of its cluster and hands its bucket slots to another
+    member that shares the band, so retracted items stop attracting new copies.
+    Clustering depends on insertion order, so callers that persist cluster IDs pass them
+    back to ``add`` when rebuilding the index instead of clustering again.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.5,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 2,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self.keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._cluster: List[str] = []
+        self._sizes: Dict[str, int] = {}
+        self._members: Dict[str, List[int]] = {}
+        self._signatures = np.zeros((64, num_perm), dtype=np.uint32)
+        # band -> bucket -> cluster -> representative row
+        self._buckets: List[Dict[bytes, Dict[str, int]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def signature(self, text: str) -> np.ndarray | None:
+        items = shingles(text, self.shingle_size)
+        if not items:
+            return None
+        hashed = np.fromiter((zlib.crc32(item.encode("utf-8")) for item in items), dtype=np.uint64, count=len(items))
+        # Multiply-shift hashing: (a·x + b) mod 2^64, keep the high 32 bits.
+        values = (np.multiply.outer(self._a, hashed) + self._b[:, None]) >> np.uint64(32)
+        return (values.min(axis=1) & _MASK32).astype(np.uint32)
+
+    def similarity(self, first: str, second: str) -> float:
+        """Estimated Jaccard similarity of two indexed items."""
+
+        rows = self._signatures[[self._rows[first], self._rows[second]]]
+        return float(np.mean(rows[0] == rows[1]))
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows : (i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: str, text: str, cluster: str | None = None) -> str:
+        """Index ``text`` under ``key`` and return its cluster ID (idempotent per key).
+
+        With ``cluster`` the item joins that cluster as is, without a similarity search.
+        """
+
+        row = self._rows.get(key)
+        if row is not None:
+            return self._cluster[row]
+        signature = self.signature(text)
+        row = len(self.keys)
+        if row == self._signatures.shape[0]:
+            self._signatures = np.vstack([self._signatures, np.zeros_like(self._signatures)])
+        self.keys.append(key)
+        self._rows[key] = row
+        band_keys = self._band_keys(signature) if signature is not None else []
+        if cluster is None:
+            # A removed key that comes back must not reuse the ID of the cluster it left.
+            cluster = key if key not in self._sizes else f"{key}#{row}"
+            candidates = {
+                other
+                for band, bucket_key in enumerate(band_keys)
+                for other in self._buckets[band].get(bucket_key, {}).values()
+            }
+            if candidates:
+                others = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+                scores = (self._signatures[others] == signature).mean(axis=1)
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    cluster = self._cluster[int(others[best])]
+        if signature is not None:
+            self._signatures[row] = signature
+        self._cluster.append(cluster)
+        self._sizes[cluster] = self._sizes.get(cluster, 0) + 1
+        self._members.setdefault(cluster, []).append(row)
+        for band, bucket_key in enumerate(band_keys):
+            self._buckets[band].setdefault(bucket_key, {}).setdefault(cluster, row)
+        return cluster
+
+    def remove(self, key: str) -> bool:
+        """Drop ``key`` from the index; returns False if it was not indexed."""
+
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        cluster = self._cluster[row]
+        members = self._members[cluster]
+        members.remove(row)
+        self._sizes[cluster] -= 1
+        if not self._sizes[cluster]:
+            del self._sizes[cluster], self._members[cluster]
+        for band, bucket_key in enumerate(self._band_keys(self._signatures[row])):
+            bucket = self._buckets[band].get(bucket_key)
+            if bucket is None or bucket.get(cluster) != row:
+                continue
+            span = slice(band * self.rows, (band + 1) * self.rows)
+            heir = next((other for other in members if self._signatures[other, span].tobytes() == bucket_key), None)
+            if heir is not None:
+                bucket[cluster] = heir
+            else:
+                del bucket[cluster]
+                if not bucket:
+                    del self._buckets[band][bucket_key]
+        return True
+
+    def add_evidence(self, evidence: EvidenceRecord, cluster: str | None = None) -> str:
+        return self.add(evidence_key(evidence), evidence_text(evidence), cluster)
+
+    @profiled("near_duplicates.add_many")
+    def add_many(self, evidence: Iterable[EvidenceRecord]) -> List[str]:
+        return [self.add_evidence(item) for item in evidence]
+
+    def cluster_of(self, key: str) -> str:
+        return self._cluster[self._rows[key]]
+
+    def get_cluster(self, key: str) -> str | None:
+        row = self._rows.get(key)
+        return None if row is None else self._cluster[row]
+
+    def cluster_size(self, cluster: str) -> int:
+        return self._sizes.get(cluster, 0)
+
+    def clusters(self, *, min_size: int = 1) -> Dict[str, List[str]]:
+        """Cluster ID → member keys in insertion order, largest clusters first."""
+
+        members = {
+            cluster: [self.keys[row] for row in rows]
+            for cluster, rows in self._members.items()
+            if len(rows) >= min_size
+        }
+        return dict(sorted(members.items(), key=lambda item: -len(item[1])))
+
+
+def cluster_evidence(evidence: Sequence[EvidenceRecord], **kwargs) -> List[str]:
+    """Cluster IDs for ``evidence`` in one pass with a fresh index."""
+
+    return NearDuplicateIndex(**kwargs).add_many(evidence)
+
+
+__all__ = ["NearDuplicateIndex", "cluster_evidence", "shingles", "tokens"]
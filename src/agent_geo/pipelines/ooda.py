@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Sequence
+
+from agent_geo.config import INDICATOR_TAG_TERMS, INDICATOR_TEMPLATES
+from agent_geo import profiling
+from agent_geo.models.evidence import EvidenceRecord
+from agent_geo.pipelines.ach_classifier import UNKNOWN
+from agent_geo.pipelines.ach_matrix import evidence_key
+from agent_geo.storage import RunStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from agent_geo.agent import GeoRiskAgent
+
+StageFn = Callable[[Mapping[str, Any]], Any]
+
+
+@dataclass(slots=True)
+class Stage:
+    """One DAG node; ``run`` receives the results of ``after`` keyed by stage name.
+
+    Stages naming the same entry in ``holds`` never run at the same time.
+    """
+
+    name: str
+    run: StageFn
+    after: Sequence[str] = ()
+    holds: Sequence[str] = ()
+
+
+@dataclass(slots=True)
+class StageRecord:
+    name: str
+    status: str = "pending"  # pending | running | done | failed | skipped
+    started_at: str | None = None
+    seconds: float | None = None
+    result: Any = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "started_at": self.started_at,
+            "seconds": self.seconds,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class RunReport:
+    run_id: str
+    stages: Dict[str, StageRecord] = field(default_factory=dict)
+    resumed: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(record.status == "done" for record in self.stages.values())
+
+
+class OODAScheduler:
+    """Runs stages as a dependency graph on a thread pool with per-run checkpoints.
+
+    Every stage whose dependencies are done is submitted immediately, so independent
+    branches overlap, unless a running stage holds one of the resources it ``holds``; it
+    then waits for that stage to finish. After each stage finishes the run file in ``RunStore`` is
+    rewritten (atomically) with its status, timing and JSON result; re-running the same
+    ``run_id`` skips stages already marked done and feeds their stored results to the
+    stages that remain. A failed stage marks its dependants ``skipped``.
+    """
+
+    def __init__(self, stages: Iterable[Stage], store: RunStore | None = None, *, workers: int = 4) -> None:
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+        for stage in self.stages.values():
+            missing = [name for name in stage.after if name not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown {missing}")
+        self.order = self._topological_order()
+        self.store = store or RunStore()
+        self.workers = workers
+
+    def _topological_order(self) -> List[str]:
+        indegree = {name: len(stage.after) for name, stage in self.stages.items()}
+        dependants: Dict[str, List[str]] = {name: [] for name in self.stages}
+        for stage in self.stages.values():
+            for parent in stage.after:
+                dependants[parent].append(stage.name)
+        ready = [name for name, degree in indegree.items() if degree == 0]
+        order: List[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for child in dependants[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        if len(order) != len(self.stages):
+            raise ValueError("Stage graph has a cycle")
+        return order
+
+    def run(self, run_id: str | None = None) -> RunReport:
+        run_id = run_id or datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        report = RunReport(run_id=run_id, stages={name: StageRecord(name) for name in self.order})
+        previous = self.store.load(run_id) or {}
+        for name, saved in previous.get("stages", {}).items():
+            if name in report.stages and saved.get("status") == "done":
+                report.stages[name] = StageRecord(name, **saved)
+                report.resumed.append(name)
+
+        def save() -> None:
+            self.store.save(
+                run_id,
+                {
+                    "run_id": run_id,
+                    "updated_at": datetime.utcnow().isoformat(),
+                    "order": self.order,
+                    "stages": {name: record.to_dict() for name, record in report.stages.items()},
+                },
+            )
+
+        running: Dict[Future, str] = {}
+        held: set[str] = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                for name in self.order:
+                    record = report.stages[name]
+                    if record.status != "pending":
+                        continue
+                    parents = [report.stages[parent] for parent in self.stages[name].after]
+                    if any(parent.status in ("failed", "skipped") for parent in parents):
+                        record.status = "skipped"
+                        continue
+                    if all(parent.status == "done" for parent in parents):
+                        if held.intersection(self.stages[name].holds):
+                            continue
+                        held.update(self.stages[name].holds)
+                        record.status = "running"
+                        record.started_at = datetime.utcnow().isoformat()
+                        inputs = {parent.name: parent.result for parent in parents}
+                        running[pool.submit(_timed, name, self.stages[name].run, inputs)] = name
+                save()
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record = report.stages[running.pop(future)]
+                    held.difference_update(self.stages[record.name].holds)
+                    outcome, record.seconds, record.error = future.result()
+                    record.status = "failed" if record.error else "done"
+                    record.result = None if record.error else outcome
+        return report
+
+
+def _timed(name: str, fn: StageFn, inputs: Mapping[str, Any]) -> tuple[Any, float, str | None]:
+    started = time.perf_counter()
+    try:
+        with profiling.span(f"ooda.{name}"):
+            result = fn(inputs)
+    except Exception:
+        return None, time.perf_counter() - started, traceback.format_exc(limit=5)
+    return result, time.perf_counter() - started, None
+
+
+def _evidence(payload: Iterable[dict]) -> List[EvidenceRecord]:
+    return [EvidenceRecord.model_validate(item) for item in payload]
+
+
+def _dump(evidence: Iterable[EvidenceRecord]) -> List[dict]:
+    return [item.model_dump(mode="json") for item in evidence]
+
+
+def default_queries() -> Dict[str, str]:
+    """One search query per indicator: its first configured tag term, else its label."""
+
+    return {
+        template.key: (INDICATOR_TAG_TERMS.get(template.key) or [template.indicator])[0]
+        for template in INDICATOR_TEMPLATES
+    }
+
+
+def weekly_cycle(
+    agent: "GeoRiskAgent",
+    *,
+    queries: Mapping[str, str] | None = None,
+    ach_min_score: float = 0.25,
+    search_workers: int = 4,
+) -> List[Stage]:
+    """观察→定位→决策→行动 as stages over the agent's existing pipelines.
+
+    ``observe.collect`` fans the queries out over ``search_workers`` threads.
+    ``orient.panel``, ``orient.ach`` and ``decide.alerts`` only depend on the tagged
+    evidence, but they write the agent's stores and alert monitor, which are not
+    thread-safe, so they hold the ``agent`` resource and run one at a time before
+    ``act.brief`` gathers their output.
+    """
+
+    queries = dict(queries or default_queries())
+
+    def observe_sources(_: Mapping[str, Any]) -> dict:
+        return {"queries": queries}
+
+    def observe_collect(inputs: Mapping[str, Any]) -> dict:
+        planned = inputs["observe.sources"]["queries"]
+        with ThreadPoolExecutor(max_workers=search_workers) as pool:
+            batches = list(pool.map(agent.websearch.search_as_evidence, planned.values()))
+        unique: Dict[str, EvidenceRecord] = {}
+        for batch in batches:
+            for item in batch:
+                unique.setdefault(evidence_key(item), item)
+        return {"evidence": _dump(unique.values())}
+
+    def orient_tag(inputs: Mapping[str, Any]) -> dict:
+        evidence = agent.tag_evidence(_evidence(inputs["observe.collect"]["evidence"]))
+        return {"evidence": _dump(evidence)}
+
+    def orient_panel(inputs: Mapping[str, Any]) -> dict:
+        evidence = _evidence(inputs["orient.tag"]["evidence"])
+        known = {evidence_key(item) for item in agent.panel.evidence_store.load()}
+        fresh = [item for item in evidence if item.tags and evidence_key(item) not in known]
+        agent.panel.evidence_store.append_many(fresh)
+        return {"appended": len(fresh), "scores": agent.panel_scores(), "note": agent.panel_diff().render_note()}
+
+    def orient_ach(inputs: Mapping[str, Any]) -> dict:
+        evidence = _evidence(inputs["orient.tag"]["evidence"])
+        suggestions = agent.suggest_ach(evidence, min_score=ach_min_score)
+        applied = agent.ach.add_many((s.hypothesis, s.kind, s.evidence) for s in suggestions if s.kind != UNKNOWN)
+        return {"suggested": len(suggestions), "applied": applied}
+
+    def decide_alerts(inputs: Mapping[str, Any]) -> dict:
+        evidence = _evidence(inputs["orient.tag"]["evidence"])
+        result = agent.stream_alert_evidence(evidence)
+        return {
+            "matches": {key: len(items) for key, items in result.matches.items()},
+            "fired": result.fired,
+            "red": agent.red_alert(),
+        }
+
+    def act_brief(inputs: Mapping[str, Any]) -> dict:
+        evidence = _evidence(inputs["orient.tag"]["evidence"])
+        urls = [str(item.url) for item in evidence if item.tags][:10]
+        bundle = agent.prompt_messages("ach_update", source_urls=urls or None)
+        return {
+            "change_note": inputs["orient.panel"]["note"],
+            "ach_update": bundle,
+            "flash_brief": inputs["decide.alerts"]["fired"],
+        }
+
+    return [
+        Stage("observe.sources", observe_sources),
+        Stage("observe.collect", observe_collect, after=("observe.sources",)),
+        Stage("orient.tag", orient_tag, after=("observe.collect",)),
+        Stage("orient.panel", orient_panel, after=("orient.tag",), holds=("agent",)),
+        Stage("orient.ach", orient_ach, after=("orient.tag",), holds=("agent",)),
+        Stage("decide.alerts", decide_alerts, after=("orient.tag",), holds=("agent",)),
+        Stage("act.brief", act_brief, after=("orient.tag", "orient.panel", "orient.ach", "decide.alerts")),
+    ]
+
+
+__all__ = ["OODAScheduler", "Stage", "StageRecord", "RunReport", "weekly_cycle", "default_queries"]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from agent_geo.config import INDICATOR_COLOR_SCORES
+from agent_geo.models.evidence import EvidenceRecord
+from agent_geo.models.indicator import IndicatorHistoryEntry, IndicatorRecord
+
+_COLOR_LABELS = {"green": "绿", "yellow": "黄", "red": "红"}
+
+
+@dataclass(slots=True)
+class IndicatorChange:
+    key: str
+    indicator: str
+    dimension: str
+    weight: int
+    color_before: str
+    color_after: str
+    value_before: Optional[str]
+    value_after: Optional[str]
+    direction_before: Optional[str]
+    direction_after: Optional[str]
+    new_evidence: List[EvidenceRecord] = field(default_factory=list)
+
+    @property
+    def color_changed(self) -> bool:
+        return self.color_before != self.color_after
+
+    @property
+    def severity(self) -> float:
+        """Signed colour move: +1 green→red, −0.5 red→yellow."""
+
+        return INDICATOR_COLOR_SCORES[self.color_after] - INDICATOR_COLOR_SCORES[self.color_before]
+
+    def summary(self) -> str:
+        parts = []
+        if self.color_changed:
+            parts.append(f"{_COLOR_LABELS[self.color_before]}→{_COLOR_LABELS[self.color_after]}")
+        if self.value_before != self.value_after and self.value_after:
+            parts.append(self.value_after)
+        if self.direction_before != self.direction_after and self.direction_after:
+            parts.append(f"趋势{self.direction_after}")
+        if self.new_evidence:
+            parts.append(f"+{len(self.new_evidence)}证据")
+        return f"{self.indicator} " + "，".join(parts)
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "indicator": self.indicator,
+            "dimension": self.dimension,
+            "weight": self.weight,
+            "color": [self.color_before, self.color_after],
+            "value": [self.value_before, self.value_after],
+            "direction": [self.direction_before, self.direction_after],
+            "new_evidence": [str(evidence.url) for evidence in self.new_evidence],
+        }
+
+
+@dataclass(slots=True)
+class PanelChangeSet:
+    start: datetime
+    end: datetime
+    changes: List[IndicatorChange] = field(default_factory=list)
+
+    @property
+    def color_transitions(self) -> List[IndicatorChange]:
+        return [change for change in self.changes if change.color_changed]
+
+    def to_dict(self) -> dict:
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "changes": [change.to_dict() for change in self.changes],
+        }
+
+    def render_note(self, limit: int = 300) -> str:
+        """``变化说明`` of at most ``limit`` characters, highest-ranked changes first."""
+
+        head = "变化说明："
+        if not self.changes:
+            return head + "本周指标无变化。"
+        note = head
+        for shown, change in enumerate(self.changes):
+            item = change.summary() + "；"
+            remaining = len(self.changes) - shown - 1
+            tail = f"另{remaining}项略。" if remaining else ""
+            if len(note) + len(item) + len(tail) > limit:
+                rest = len(self.changes) - shown
+                return (note + f"另{rest}项略。")[:limit]
+            note += item
+        return note[:limit]
+
+
+def diff_records(
+    before: Mapping[str, IndicatorRecord],
+    after: Mapping[str, IndicatorRecord],
+    evidence: Mapping[str, List[EvidenceRecord]],
+    *,
+    start: datetime,
+    end: datetime,
+) -> PanelChangeSet:
+    """Changed indicators between two panel states, ranked by weight then colour move."""
+
+    changes = []
+    for key, new in after.items():
+        old = before.get(key, new)
+        added = evidence.get(key, [])
+        if (
+            old.color == new.color
+            and old.latest_value == new.latest_value
+            and old.direction == new.direction
+            and not added
+        ):
+            continue
+        changes.append(
+            IndicatorChange(
+                key=key,
+                indicator=new.indicator,
+                dimension=new.dimension.value,
+                weight=new.weight,
+                color_before=old.color.value,
+                color_after=new.color.value,
+                value_before=old.latest_value,
+                value_after=new.latest_value,
+                direction_before=old.direction,
+                direction_after=new.direction,
+                new_evidence=list(added),
+            )
+        )
+    changes.sort(key=lambda change: (-change.weight, -abs(change.severity), -len(change.new_evidence), change.key))
+    return PanelChangeSet(start=start, end=end, changes=changes)
+
+
+def diff_history(
+    entries: Iterable[IndicatorHistoryEntry],
+    baseline: Mapping[str, IndicatorRecord],
+    *,
+    start: datetime,
+    end: datetime,
+) -> PanelChangeSet:
+    """Diff the panel as of ``start`` against ``end`` in one pass over the history log.
+
+    ``baseline`` supplies the state of indicators with no history before ``start``
+    (normally the template defaults). Evidence attached in ``(start, end]`` is collected
+    on the way.
+    """
+
+    before: Dict[str, tuple[datetime, IndicatorRecord]] = {}
+    after: Dict[str, tuple[datetime, IndicatorRecord]] = {}
+    evidence: Dict[str, List[EvidenceRecord]] = {}
+    for entry in entries:
+        moment = entry.recorded_at
+        if moment > end:
+            continue
+        key = entry.record.template_key
+        # The log is append-ordered; back-dated imports may arrive out of time order.
+        if moment <= start and (key not in before or before[key][0] <= moment):
+            before[key] = (moment, entry.record)
+        if key not in after or after[key][0] <= moment:
+            after[key] = (moment, entry.record)
+        if moment > start and entry.evidence is not None:
+            evidence.setdefault(key, []).append(entry.evidence)
+    states_before = {**baseline, **{key: record for key, (_, record) in before.items()}}
+    states_after = {**baseline, **{key: record for key, (_, record) in after.items()}}
+    return diff_records(states_before, states_after, evidence, start=start, end=end)
+
+
+__all__ = ["IndicatorChange", "PanelChangeSet", "diff_records", "diff_history"]
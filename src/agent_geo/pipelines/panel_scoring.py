@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from agent_geo.config import INDICATOR_COLOR_SCORES, IndicatorDimension, IndicatorTemplate
+from agent_geo.models.indicator import IndicatorHistoryEntry, IndicatorRecord
+from agent_geo.profiling import profiled
+
+DIMENSIONS: List[IndicatorDimension] = list(IndicatorDimension)
+_DIMENSION_INDEX = {dimension: i for i, dimension in enumerate(DIMENSIONS)}
+
+
+def color_score(record: IndicatorRecord) -> float:
+    return INDICATOR_COLOR_SCORES[record.color.value]
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(numerator, denominator, out=np.full_like(numerator, np.nan), where=denominator > 0)
+
+
+class PanelScorer:
+    """Weighted composite risk per dimension: ``Σ weight × colour score / Σ weight``.
+
+    Running numerator/denominator sums are kept per dimension, together with each
+    indicator's current contribution, so ``update`` after a single indicator change
+    is O(1) instead of a pass over the board.
+    """
+
+    def __init__(self, records: Iterable[IndicatorRecord] = ()) -> None:
+        self._numerator = np.zeros(len(DIMENSIONS))
+        self._denominator = np.zeros(len(DIMENSIONS))
+        self._contributions: Dict[str, tuple[int, float, float]] = {}
+        for record in records:
+            self.update(record)
+
+    def update(self, record: IndicatorRecord) -> None:
+        previous = self._contributions.get(record.template_key)
+        if previous is not None:
+            dimension, numerator, weight = previous
+            self._numerator[dimension] -= numerator
+            self._denominator[dimension] -= weight
+        dimension = _DIMENSION_INDEX[record.dimension]
+        weight = float(record.weight)
+        numerator = weight * color_score(record)
+        self._numerator[dimension] += numerator
+        self._denominator[dimension] += weight
+        self._contributions[record.template_key] = (dimension, numerator, weight)
+
+    def dimension_scores(self) -> Dict[str, float | None]:
+        scores = _ratio(self._numerator, self._denominator)
+        return {
+            dimension.value: None if np.isnan(scores[i]) else float(scores[i]) for i, dimension in enumerate(DIMENSIONS)
+        }
+
+    def overall(self) -> float | None:
+        total = self._denominator.sum()
+        return float(self._numerator.sum() / total) if total > 0 else None
+
+
+@dataclass(slots=True)
+class ScoreSeries:
+    """Composite scores after every history entry: ``dimensions`` is ``(T, D)``."""
+
+    times: np.ndarray  # datetime64[us], sorted
+    dimensions: np.ndarray
+    overall: np.ndarray
+
+    def at(self, moments: Sequence[datetime]) -> tuple[np.ndarray, np.ndarray]:
+        """Scores in force at each moment (NaN before the first entry)."""
+
+        wanted = np.asarray(moments, dtype="datetime64[us]")
+        positions = np.searchsorted(self.times, wanted, side="right") - 1
+        dims = np.full((len(wanted), len(DIMENSIONS)), np.nan)
+        overall = np.full(len(wanted), np.nan)
+        known = positions >= 0
+        dims[known] = self.dimensions[positions[known]]
+        overall[known] = self.overall[positions[known]]
+        return dims, overall
+
+
+@profiled("panel.score_history")
+def score_history(
+    entries: Sequence[IndicatorHistoryEntry],
+    templates: Iterable[IndicatorTemplate],
+) -> ScoreSeries:
+    """Replay the panel history into a score series without a Python loop over scores.
+
+    Each entry replaces one indicator's contribution. Its previous contribution comes
+    from the prior entry for the same indicator (or the template default), found by a
+    stable sort on indicator; the per-dimension deltas are then cumulatively summed.
+    """
+
+    baseline = {
+        template.key: (_DIMENSION_INDEX[template.dimension], float(template.default_weight)) for template in templates
+    }
+    yellow = INDICATOR_COLOR_SCORES["yellow"]
+    base_numerator = np.zeros(len(DIMENSIONS))
+    base_denominator = np.zeros(len(DIMENSIONS))
+    for dimension, weight in baseline.values():
+        base_numerator[dimension] += weight * yellow
+        base_denominator[dimension] += weight
+
+    count = len(entries)
+    if count == 0:
+        empty = np.empty(0, dtype="datetime64[us]")
+        return ScoreSeries(times=empty, dimensions=np.empty((0, len(DIMENSIONS))), overall=np.empty(0))
+
+    times = np.array([entry.recorded_at for entry in entries], dtype="datetime64[us]")
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    keys = [entries[i].record.template_key for i in order]
+    key_index: Dict[str, int] = {}
+    indicator = np.array([key_index.setdefault(key, len(key_index)) for key in keys], dtype=np.int64)
+    dimension = np.array([_DIMENSION_INDEX[entries[i].record.dimension] for i in order], dtype=np.int64)
+    weight = np.array([entries[i].record.weight for i in order], dtype=np.float64)
+    numerator = weight * np.array([color_score(entries[i].record) for i in order])
+
+    # Contribution before each entry: the previous entry of the same indicator, else the default.
+    initial_weight = np.empty(len(key_index))
+    initial_dimension = np.empty(len(key_index), dtype=np.int64)
+    for key, position in key_index.items():
+        default = baseline.get(key)
+        initial_dimension[position], initial_weight[position] = default if default else (-1, 0.0)
+    prev_numerator = initial_weight[indicator] * yellow
+    prev_weight = initial_weight[indicator].copy()
+    prev_dimension = initial_dimension[indicator].copy()
+    by_indicator = np.argsort(indicator, kind="stable")
+    same = indicator[by_indicator][1:] == indicator[by_indicator][:-1]
+    current, previous = by_indicator[1:][same], by_indicator[:-1][same]
+    prev_numerator[current] = numerator[previous]
+    prev_weight[current] = weight[previous]
+    prev_dimension[current] = dimension[previous]
+
+    rows = np.arange(count)
+    delta_numerator = np.zeros((count, len(DIMENSIONS)))
+    delta_denominator = np.zeros((count, len(DIMENSIONS)))
+    np.add.at(delta_numerator, (rows, dimension), numerator)
+    np.add.at(delta_denominator, (rows, dimension), weight)
+    had_previous = prev_dimension >= 0
+    np.add.at(delta_numerator, (rows[had_previous], prev_dimension[had_previous]), -prev_numerator[had_previous])
+    np.add.at(delta_denominator, (rows[had_previous], prev_dimension[had_previous]), -prev_weight[had_previous])
+
+    cumulative_numerator = base_numerator + np.cumsum(delta_numerator, axis=0)
+    cumulative_denominator = base_denominator + np.cumsum(delta_denominator, axis=0)
+    dimensions = _ratio(cumulative_numerator, np.round(cumulative_denominator, 9))
+    total = cumulative_denominator.sum(axis=1)
+    overall = _ratio(cumulative_numerator.sum(axis=1), np.round(total, 9))
+    return ScoreSeries(times=times, dimensions=dimensions, overall=overall)
+
+
+__all__ = ["PanelScorer", "ScoreSeries", "score_history", "color_score", "DIMENSIONS"]
@@ -0,0 +1,239 @@
+"""Lightweight timing spans for stores, web search, pipelines and the agent.
+
+``span("storage.evidence.load")`` is a context manager and ``@profiled(name)`` wraps a
+function in one. While profiling is disabled (the default) both cost one attribute
+check. When enabled, every span feeds a per-name aggregate: call and error counters,
+total and self time (total minus time spent in nested spans on the same thread) and a
+fixed-bucket histogram, exportable as a table or in Prometheus text format::
+
+    from agent_geo import profiling
+
+    profiling.enable()
+    agent.run_ooda()
+    print(profiling.prometheus())
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterator, List, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+# Upper bounds in seconds, Prometheus-style (cumulative ``le`` buckets plus +Inf).
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_NULL = nullcontext()
+
+
+@dataclass(slots=True)
+class SpanStats:
+    name: str
+    calls: int = 0
+    errors: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+    max: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(BUCKETS) + 1))
+
+    def observe(self, elapsed: float, children: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.total += elapsed
+        self.self_time += max(elapsed - children, 0.0)
+        self.max = max(self.max, elapsed)
+        self.buckets[bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (capped at the observed max)."""
+
+        if not self.calls:
+            return math.nan
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "span": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total": self.total,
+            "self": self.self_time,
+            "mean": self.total / self.calls if self.calls else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+        }
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._spans: Dict[str, SpanStats] = {}
+        self._counters: Dict[str, float] = {}
+        self._local = threading.local()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)  # time spent in child spans
+        failed = False
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                stats = self._spans.get(name)
+                if stats is None:
+                    stats = self._spans[name] = SpanStats(name)
+                stats.observe(elapsed, children, failed)
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def report(self) -> List[dict]:
+        """Span aggregates, most total time first."""
+
+        with self._lock:
+            rows = [stats.to_dict() for stats in self._spans.values()]
+        return sorted(rows, key=lambda row: -row["total"])
+
+    def counters(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def prometheus(self, prefix: str = "agent_geo") -> str:
+        with self._lock:
+            spans = [replace(stats, buckets=list(stats.buckets)) for stats in self._spans.values()]
+            counters = dict(self._counters)
+        lines = [
+            f"# HELP {prefix}_span_seconds Wall time of instrumented spans.",
+            f"# TYPE {prefix}_span_seconds histogram",
+        ]
+        for stats in spans:
+            label = _label(stats.name)
+            cumulative = 0
+            for bound, count in zip(BUCKETS, stats.buckets):
+                cumulative += count
+                lines.append(f'{prefix}_span_seconds_bucket{{span="{label}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{prefix}_span_seconds_bucket{{span="{label}",le="+Inf"}} {stats.calls}')
+            lines.append(f'{prefix}_span_seconds_sum{{span="{label}"}} {stats.total:.9g}')
+            lines.append(f'{prefix}_span_seconds_count{{span="{label}"}} {stats.calls}')
+        lines.append(f"# HELP {prefix}_span_self_seconds_total Span time not spent in nested spans.")
+        lines.append(f"# TYPE {prefix}_span_self_seconds_total counter")
+        for stats in spans:
+            lines.append(f'{prefix}_span_self_seconds_total{{span="{_label(stats.name)}"}} {stats.self_time:.9g}')
+        lines.append(f"# HELP {prefix}_span_errors_total Spans that exited with an exception.")
+        lines.append(f"# TYPE {prefix}_span_errors_total counter")
+        for stats in spans:
+            lines.append(f'{prefix}_span_errors_total{{span="{_label(stats.name)}"}} {stats.errors}')
+        if counters:
+            lines.append(f"# HELP {prefix}_events_total Instrumented event counters.")
+            lines.append(f"# TYPE {prefix}_events_total counter")
+            for name, value in counters.items():
+                lines.append(f'{prefix}_events_total{{name="{_label(name)}"}} {value:g}')
+        return "\n".join(lines) + "\n"
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+PROFILER = Profiler()
+
+
+def enable() -> None:
+    PROFILER.enabled = True
+
+
+def disable() -> None:
+    PROFILER.enabled = False
+
+
+def is_enabled() -> bool:
+    return PROFILER.enabled
+
+
+def span(name: str):
+    return PROFILER.span(name) if PROFILER.enabled else _NULL
+
+
+def count(name: str, value: float = 1) -> None:
+    if PROFILER.enabled:
+        PROFILER.count(name, value)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Decorator form of ``span``."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return fn(*args, **kwargs)
+            with PROFILER.span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def report() -> List[dict]:
+    return PROFILER.report()
+
+
+def counters() -> Dict[str, float]:
+    return PROFILER.counters()
+
+
+def prometheus(prefix: str = "agent_geo") -> str:
+    return PROFILER.prometheus(prefix)
+
+
+def reset() -> None:
+    PROFILER.reset()
+
+
+__all__ = [
+    "Profiler",
+    "SpanStats",
+    "PROFILER",
+    "BUCKETS",
+    "enable",
+    "disable",
+    "is_enabled",
+    "span",
+    "count",
+    "profiled",
+    "report",
+    "counters",
+    "prometheus",
+    "reset",
+]
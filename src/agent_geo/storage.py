@@ -1,74 +1,674 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
 
 from agent_geo.models.evidence import EvidenceRecord
-from agent_geo.models.indicator import IndicatorRecord
+from agent_geo.models.evidence_table import EvidenceTable
+from agent_geo.models.indicator import IndicatorHistoryEntry, IndicatorRecord
 from agent_geo.models.forecast import ForecastEvent
-from agent_geo.models.ach import ACHTable
+from agent_geo.models.ach import ACHObservation, ACHTable
+from agent_geo.models.alert import AlertEvent, EntrapmentSignalStatus
+from agent_geo.models.trusted import trusted_constructor
+from agent_geo.profiling import count, profiled, span
+
+M = TypeVar("M", bound=BaseModel)
+
+_MAX_SEGMENTS = 256
+_BATCH_LINES = 10_000
+
+
+class FileChecksum:
+    """SHA-256 sidecar (``<file>.sha256``) over the bytes this process wrote.
+
+    The sidecar holds contiguous ``[end_offset, sha256]`` segments from the start of the
+    file: a rewrite records one segment, an append adds one. Loaders trust only the
+    leading segments that still match and fully validate anything after them, whether
+    edited by hand, appended by another tool or left behind by a crash between the data
+    write and the sidecar write.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.sidecar = path.with_name(f"{path.name}.sha256")
+
+    def segments(self) -> List[List]:
+        try:
+            return json.loads(self.sidecar.read_text(encoding="utf-8"))["segments"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+
+    def save(self, segments: List[List]) -> None:
+        self.sidecar.write_text(json.dumps({"segments": segments}), encoding="utf-8")
+
+    def clear(self) -> None:
+        self.sidecar.unlink(missing_ok=True)
+
+    def record(self, data: bytes) -> None:
+        self.save([[len(data), hashlib.sha256(data).hexdigest()]])
+
+    def extend(self, start: int, end: int, digest: str) -> None:
+        """Cover bytes appended at ``start``; only if everything before them is covered."""
+
+        segments = self.segments()
+        if (segments[-1][0] if segments else 0) == start:
+            self.save(segments + [[end, digest]])
+
+    def compact(self) -> None:
+        hasher = hashlib.sha256()
+        with self.path.open("rb") as fh:
+            for block in iter(lambda: fh.read(1 << 20), b""):
+                hasher.update(block)
+            self.save([[fh.tell(), hasher.hexdigest()]])
+
+    def matches(self, data: bytes) -> bool:
+        """True if the sidecar covers exactly ``data``."""
+
+        view = memoryview(data)
+        start = 0
+        for end, digest in self.segments():
+            if end > len(data) or hashlib.sha256(view[start:end]).hexdigest() != digest:
+                return False
+            start = end
+        return start == len(data) > 0
+
+
+class _JsonlScan:
+    """One pass over a JSONL log, yielding ``(line, verified)`` for each non-blank line.
+
+    With a ``checksum``, the leading sidecar segments whose digests still match are found
+    in a hashing pass first; their lines come back ``verified``. Iterating writes nothing:
+    once the caller has run every unverified line through ``validate``, ``commit`` cuts
+    the sidecar back to the matching segments and extends it over the rest. A load that
+    raises never gets there, so a bad line is never covered; nor is the rest extended if
+    validation changed any line (say, filled in a legacy record's missing hash), since a
+    trusted load would build the stored bytes, not what validation made of them.
+    """
+
+    def __init__(self, path: Path, checksum: FileChecksum | None = None) -> None:
+        self.path = path
+        self.checksum = checksum
+        self.faithful = True
+        self._result: tuple[List[List], int, int, int, str] | None = None
+
+    def __iter__(self) -> Iterator[tuple[bytes, bool]]:
+        if not self.path.exists():
+            return
+        segments = self.checksum.segments() if self.checksum else []
+        covered = kept = 0
+        with self.path.open("rb") as fh:
+            for end, digest in segments:
+                hasher = hashlib.sha256()
+                remaining = end - covered
+                while remaining > 0:
+                    block = fh.read(min(remaining, 1 << 20))
+                    if not block:
+                        break
+                    hasher.update(block)
+                    remaining -= len(block)
+                if remaining or hasher.hexdigest() != digest:
+                    break
+                covered, kept = end, kept + 1
+            fh.seek(0)
+            offset = 0
+            tail = hashlib.sha256()
+            for line in fh:
+                verified = offset < covered
+                offset += len(line)
+                if not verified:
+                    tail.update(line)
+                if line.strip():
+                    yield line, verified
+        self._result = (segments, kept, covered, offset, tail.hexdigest())
+
+    def validate(self, model: Type[M], line: bytes) -> M:
+        """Validate an unverified line, noting whether it loads back exactly as stored."""
+
+        item = model.model_validate_json(line)
+        if self.faithful and self.checksum is not None:
+            self.faithful = item.model_dump(mode="json") == from_json(line)
+        return item
+
+    def commit(self) -> None:
+        """Bring the sidecar up to date after a complete pass; a no-op otherwise."""
+
+        if self.checksum is None or self._result is None:
+            return
+        segments, kept, covered, offset, tail = self._result
+        count("storage.trusted_loads" if covered == offset else "storage.validated_loads")
+        extend = covered < offset and self.faithful
+        if (extend and kept >= _MAX_SEGMENTS) or (covered == offset and kept > _MAX_SEGMENTS):
+            self.checksum.compact()  # the whole file is covered either way
+        elif extend or kept < len(segments):
+            self.checksum.save(segments[:kept] + ([[offset, tail]] if extend else []))
+
+
+def _batches(lines: Iterator[tuple[bytes, bool]]) -> Iterator[List[tuple[bytes, bool]]]:
+    """Group lines into batches, each read under a ``storage.read`` span.
+
+    Loaders parse a batch under ``storage.validate``, so the two spans' self time splits
+    a load between file I/O (plus checksum hashing) and pydantic parsing.
+    """
+
+    while True:
+        with span("storage.read"):
+            batch = list(islice(lines, _BATCH_LINES))
+        if not batch:
+            return
+        yield batch
+
+
+def _read_jsonl(path: Path, model: Type[M], checksum: FileChecksum | None = None) -> List[M]:
+    """Load a JSONL log; checksummed lines are built with ``model_construct``, the rest validated."""
+
+    construct = trusted_constructor(model)
+    items: List[M] = []
+    scan = _JsonlScan(path, checksum)
+    for batch in _batches(iter(scan)):
+        with span("storage.validate"):
+            items.extend(
+                construct(from_json(line)) if verified else scan.validate(model, line) for line, verified in batch
+            )
+    scan.commit()
+    return items
+
+
+def _append_jsonl(path: Path, models: Iterable[BaseModel], checksum: FileChecksum | None = None) -> None:
+    hasher = hashlib.sha256()
+    with path.open("ab") as fh:
+        start = fh.tell()
+        for item in models:
+            line = item.model_dump_json().encode("utf-8") + b"\n"
+            hasher.update(line)
+            fh.write(line)
+        end = fh.tell()
+    if checksum and end > start:
+        checksum.extend(start, end, hasher.hexdigest())
+
+
+def _read_document(path: Path, adapter: TypeAdapter, construct: Callable, checksum: FileChecksum | None = None):
+    """Load a JSON document: ``construct`` it if its checksum matches, else validate it from bytes.
+
+    A document that had to be validated is then checksummed, so the next load is trusted,
+    but only if validation left it unchanged; otherwise it stays unchecksummed (and is
+    validated on every load) until the store next writes it.
+    """
+
+    with span("storage.read"):
+        data = path.read_bytes()
+        trusted = bool(checksum and checksum.matches(data))
+    if trusted:
+        count("storage.trusted_loads")
+        with span("storage.validate"):
+            return construct(from_json(data))
+    if checksum:
+        count("storage.validated_loads")
+    with span("storage.validate"):
+        value = adapter.validate_json(data)
+    if checksum and adapter.dump_python(value, mode="json") == from_json(data):
+        checksum.record(data)
+    return value
+
+
+def _replace_file(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write ``chunks`` to a sibling file, then rename it over ``path``."""
+
+    staging = path.with_name(f"{path.name}.tmp")
+    with staging.open("wb") as fh:
+        for chunk in chunks:
+            fh.write(chunk)
+    os.replace(staging, path)
+
+
+def _write_document(path: Path, data: bytes, checksum: FileChecksum) -> None:
+    path.write_bytes(data)
+    checksum.record(data)
+
+
+def _byte_ranges(path: Path, chunk_bytes: int) -> List[tuple[int, int]]:
+    if not path.exists():
+        return []
+    size = path.stat().st_size
+    ranges: List[tuple[int, int]] = []
+    with path.open("rb") as fh:
+        start = 0
+        while start < size:
+            fh.seek(min(start + chunk_bytes, size))
+            fh.readline()
+            end = min(fh.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _read_range(path: Path | str, start: int, end: int) -> List[bytes]:
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        return fh.read(end - start).splitlines()
+
+
+_INDICATORS = TypeAdapter(List[IndicatorRecord])
+_FORECASTS = TypeAdapter(List[ForecastEvent])
+_ACH_TABLES = TypeAdapter(List[ACHTable])
+_ACH_DOCUMENT = TypeAdapter(Union[List[ACHTable], ACHTable])  # one table is stored as a bare object
+
+
+def _construct_list(model: Type[M]) -> Callable[[list], List[M]]:
+    construct = trusted_constructor(model)
+    return lambda items: [construct(item) for item in items]
+
+
+def _construct_ach_document(payload: list | dict) -> List[ACHTable] | ACHTable:
+    construct = trusted_constructor(ACHTable)
+    return [construct(item) for item in payload] if isinstance(payload, list) else construct(payload)
 
 
 class EvidenceStore:
-    def __init__(self, path: Path | str = Path("data/evidence_log.jsonl")) -> None:
+    def __init__(self, path: Path | str = Path("data/evidence_log.jsonl"), *, trusted: bool = True) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.checksum = FileChecksum(self.path)
+        self.trusted = trusted
 
     def append(self, record: EvidenceRecord) -> None:
-        with self.path.open("a", encoding="utf-8") as fh:
-            fh.write(record.model_dump_json())
-            fh.write("\n")
+        self.append_many([record])
+
+    @profiled("storage.evidence.append_many")
+    def append_many(self, records: Iterable[EvidenceRecord]) -> None:
+        _append_jsonl(self.path, records, self.checksum)
 
+    @profiled("storage.evidence.load")
     def load(self) -> List[EvidenceRecord]:
-        if not self.path.exists():
-            return []
-        with self.path.open("r", encoding="utf-8") as fh:
-            return [EvidenceRecord.model_validate_json(line) for line in fh]
+        return _read_jsonl(self.path, EvidenceRecord, self.checksum if self.trusted else None)
+
+    @profiled("storage.evidence.load_table")
+    def load_table(self) -> EvidenceTable:
+        """Load the log as a compact ``EvidenceTable`` without keeping a model per line.
+
+        Checksummed lines are decoded as plain JSON; anything else is fully validated
+        first, so the table never holds data the models would reject.
+        """
+
+        scan = _JsonlScan(self.path, self.checksum if self.trusted else None)
+
+        def rows() -> Iterator[dict]:
+            for batch in _batches(iter(scan)):
+                with span("storage.validate"):
+                    parsed = [
+                        from_json(line) if verified else scan.validate(EvidenceRecord, line).model_dump()
+                        for line, verified in batch
+                    ]
+                yield from parsed
+
+        table = EvidenceTable.from_rows(rows())
+        scan.commit()
+        return table
+
+    def byte_ranges(self, chunk_bytes: int = 8 << 20) -> List[tuple[int, int]]:
+        return _byte_ranges(self.path, chunk_bytes)
+
+    @staticmethod
+    def read_range(path: Path | str, start: int, end: int) -> List[bytes]:
+        return _read_range(path, start, end)
+
+    @profiled("storage.evidence.rewrite")
+    def rewrite(self, chunks: Iterable[bytes]) -> None:
+        """Replace the log with ``chunks`` of JSONL bytes (written to a sibling, then renamed).
+
+        The bytes did not come from the models, so the sidecar is dropped and the next
+        load validates every line before trusting the file again.
+        """
+
+        _replace_file(self.path, chunks)
+        self.checksum.clear()
 
 
 class PanelStore:
-    def __init__(self, path: Path | str = Path("data/indicator_panel.json")) -> None:
+    def __init__(self, path: Path | str = Path("data/indicator_panel.json"), *, trusted: bool = True) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.checksum = FileChecksum(self.path)
+        self.trusted = trusted
 
+    @profiled("storage.panel.save")
     def save(self, records: Iterable[IndicatorRecord]) -> None:
-        payload = [record.model_dump() for record in records]
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_document(self.path, _INDICATORS.dump_json(list(records), indent=2), self.checksum)
 
+    @profiled("storage.panel.load")
     def load(self) -> List[IndicatorRecord]:
         if not self.path.exists():
             return []
-        return [IndicatorRecord.model_validate(obj) for obj in json.loads(self.path.read_text(encoding="utf-8"))]
+        return _read_document(self.path, _INDICATORS, _construct_list(IndicatorRecord), self.checksum if self.trusted else None)
+
+
+class PanelHistoryStore:
+    """Append-only JSONL of every panel update, oldest first."""
+
+    def __init__(self, path: Path | str = Path("data/indicator_history.jsonl"), *, trusted: bool = True) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.checksum = FileChecksum(self.path)
+        self.trusted = trusted
+
+    @profiled("storage.panel_history.append_many")
+    def append_many(self, entries: Iterable[IndicatorHistoryEntry]) -> None:
+        _append_jsonl(self.path, entries, self.checksum)
+
+    def append(self, entry: IndicatorHistoryEntry) -> None:
+        self.append_many([entry])
+
+    @profiled("storage.panel_history.load")
+    def load(self) -> List[IndicatorHistoryEntry]:
+        return _read_jsonl(self.path, IndicatorHistoryEntry, self.checksum if self.trusted else None)
 
 
 class ForecastStore:
-    def __init__(self, path: Path | str = Path("data/forecast_ledger.json")) -> None:
+    def __init__(self, path: Path | str = Path("data/forecast_ledger.json"), *, trusted: bool = True) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.checksum = FileChecksum(self.path)
+        self.trusted = trusted
+        self.scores_path = self.path.with_name(f"{self.path.stem}_scores.json")
 
+    @profiled("storage.forecast.save")
     def save(self, events: Iterable[ForecastEvent]) -> None:
-        payload = [event.model_dump() for event in events]
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_document(self.path, _FORECASTS.dump_json(list(events), indent=2), self.checksum)
 
+    @profiled("storage.forecast.load")
     def load(self) -> List[ForecastEvent]:
         if not self.path.exists():
             return []
-        return [ForecastEvent.model_validate(obj) for obj in json.loads(self.path.read_text(encoding="utf-8"))]
+        return _read_document(self.path, _FORECASTS, _construct_list(ForecastEvent), self.checksum if self.trusted else None)
+
+    def ledger_stamp(self) -> List[int] | None:
+        """``[mtime_ns, size]`` of the ledger file, or None if it does not exist."""
+
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @profiled("storage.forecast.save_scores")
+    def save_scores(self, payload: dict) -> None:
+        """Write ``payload`` with the current ledger stamp, so a later ledger write marks it stale."""
+
+        payload = {**payload, "ledger": self.ledger_stamp()}
+        self.scores_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @profiled("storage.forecast.load_scores")
+    def load_scores(self) -> dict | None:
+        """Running Brier aggregates written next to the ledger, readable without loading it."""
+
+        if not self.scores_path.exists():
+            return None
+        return json.loads(self.scores_path.read_text(encoding="utf-8"))
 
 
 class ACHStore:
-    def __init__(self, path: Path | str = Path("data/ach_table.json")) -> None:
+    def __init__(self, path: Path | str = Path("data/ach_table.json"), *, trusted: bool = True) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.checksum = FileChecksum(self.path)
+        self.trusted = trusted
 
+    @profiled("storage.ach.save")
     def save(self, table: ACHTable) -> None:
-        self.path.write_text(table.model_dump_json(indent=2, ensure_ascii=False), encoding="utf-8")
+        _write_document(self.path, table.model_dump_json(indent=2).encode("utf-8"), self.checksum)
 
+    @profiled("storage.ach.load")
     def load(self) -> ACHTable:
         if not self.path.exists():
             return ACHTable.bootstrap()
-        return ACHTable.model_validate_json(self.path.read_text(encoding="utf-8"))
+        return next(iter(self.load_all().values()))
+
+    @profiled("storage.ach.save_all")
+    def save_all(self, tables: Iterable[ACHTable]) -> None:
+        """Persist several ACH questions; a single table keeps the original one-object layout."""
+
+        tables = list(tables)
+        if len(tables) == 1:
+            self.save(tables[0])
+            return
+        _write_document(self.path, _ACH_TABLES.dump_json(tables, indent=2), self.checksum)
+
+    @profiled("storage.ach.load_all")
+    def load_all(self) -> Dict[str, ACHTable]:
+        if not self.path.exists():
+            table = ACHTable.bootstrap()
+            return {table.question: table}
+        payload = _read_document(self.path, _ACH_DOCUMENT, _construct_ach_document, self.checksum if self.trusted else None)
+        tables = payload if isinstance(payload, list) else [payload]
+        return {table.question: table for table in tables}
+
+
+class ACHLogStore:
+    """Append-only JSONL log of ACH observations, the source for full posterior rebuilds."""
+
+    def __init__(self, path: Path | str = Path("data/ach_evidence_log.jsonl"), *, trusted: bool = True) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.checksum = FileChecksum(self.path)
+        self.trusted = trusted
+
+    def append(self, observation: ACHObservation) -> None:
+        self.append_many([observation])
+
+    @profiled("storage.ach_log.append_many")
+    def append_many(self, observations: Iterable[ACHObservation]) -> None:
+        _append_jsonl(self.path, observations, self.checksum)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def iter_chunks(self, chunk_size: int = 50_000) -> Iterator[List[str]]:
+        """Yield raw JSON lines in chunks so callers can parse them out of process."""
+
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as fh:
+            chunk: List[str] = []
+            for line in fh:
+                if line.strip():
+                    chunk.append(line)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+    def byte_ranges(self, chunk_bytes: int = 8 << 20) -> List[tuple[int, int]]:
+        """Split the log into newline-aligned ``(start, end)`` byte ranges of ~``chunk_bytes``.
+
+        Workers can then open the file and read their own range, so the parent process
+        never has to read or pickle the log contents.
+        """
+
+        return _byte_ranges(self.path, chunk_bytes)
+
+    @staticmethod
+    def read_range(path: Path | str, start: int, end: int) -> List[bytes]:
+        return _read_range(path, start, end)
+
+    @profiled("storage.ach_log.rewrite")
+    def rewrite(self, chunks: Iterable[bytes]) -> None:
+        """Replace the log with ``chunks`` of JSONL bytes; the next load validates every line."""
+
+        _replace_file(self.path, chunks)
+        self.checksum.clear()
+
+    @profiled("storage.ach_log.load")
+    def load(self) -> List[ACHObservation]:
+        return _read_jsonl(self.path, ACHObservation, self.checksum if self.trusted else None)
+
+
+class AlertStore:
+    """Event-sourced alert state: an append-only JSONL log plus a periodic snapshot.
+
+    The snapshot records the statuses together with the byte offset of the log it
+    covers, so loading replays only the events appended after it.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = Path("data/alert_events.jsonl"),
+        snapshot_path: Path | str | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.path.with_name("alert_snapshot.json")
+
+    @profiled("storage.alert.append")
+    def append(self, event: AlertEvent) -> int:
+        """Append one event and return the log size in bytes afterwards."""
+
+        with self.path.open("ab") as fh:
+            fh.write(event.model_dump_json().encode("utf-8"))
+            fh.write(b"\n")
+            return fh.tell()
+
+    @profiled("storage.alert.rewrite")
+    def rewrite(self, chunks: Iterable[bytes]) -> None:
+        """Replace the event log with ``chunks`` of JSONL bytes (written to a sibling, then renamed)."""
+
+        _replace_file(self.path, chunks)
+
+    def iter_events(self, start: int = 0) -> Iterator[tuple[int, AlertEvent]]:
+        """Yield ``(end_offset, event)`` for events stored at or after byte ``start``."""
+
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as fh:
+            fh.seek(start)
+            for line in fh:
+                if line.strip():
+                    yield fh.tell(), AlertEvent.model_validate_json(line)
+
+    @profiled("storage.alert.save_snapshot")
+    def save_snapshot(self, statuses: Iterable[EntrapmentSignalStatus], offset: int, events: int) -> None:
+        payload = {
+            "offset": offset,
+            "events": events,
+            "statuses": [status.model_dump(mode="json") for status in statuses],
+        }
+        self.snapshot_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @profiled("storage.alert.load_snapshot")
+    def load_snapshot(self) -> tuple[List[EntrapmentSignalStatus], int, int]:
+        """Return ``(statuses, log offset, event count)``; empty if no snapshot exists."""
+
+        if not self.snapshot_path.exists():
+            return [], 0, 0
+        with span("storage.read"):
+            payload = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        with span("storage.validate"):
+            statuses = [EntrapmentSignalStatus.model_validate(item) for item in payload["statuses"]]
+        return statuses, int(payload["offset"]), int(payload["events"])
+
+
+class BriefStore:
+    """Append-only JSONL record of rendered flash-brief prompt bundles."""
+
+    def __init__(self, path: Path | str = Path("data/flash_briefs.jsonl")) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @profiled("storage.brief.append")
+    def append(self, bundle: dict) -> None:
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(bundle, ensure_ascii=False, default=str))
+            fh.write("\n")
+
+    @profiled("storage.brief.load")
+    def load(self) -> List[dict]:
+        if not self.path.exists():
+            return []
+        with self.path.open("r", encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+
+
+class LatencyStore:
+    """Per-stage evidence-to-alert latency histograms, kept as one JSON document."""
+
+    def __init__(self, path: Path | str = Path("data/alert_latency.json")) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @profiled("storage.latency.save")
+    def save(self, payload: dict) -> None:
+        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @profiled("storage.latency.load")
+    def load(self) -> dict | None:
+        if not self.path.exists():
+            return None
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+
+class RunStore:
+    """One JSON checkpoint per OODA run under ``data/ooda_runs/``, replaced atomically."""
+
+    def __init__(self, root: Path | str = Path("data/ooda_runs")) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, run_id: str) -> Path:
+        return self.root / f"{run_id}.json"
+
+    @profiled("storage.run.save")
+    def save(self, run_id: str, payload: dict) -> None:
+        target = self.path_for(run_id)
+        scratch = target.with_suffix(".json.tmp")
+        scratch.write_text(json.dumps(payload, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+        scratch.replace(target)
+
+    @profiled("storage.run.load")
+    def load(self, run_id: str) -> dict | None:
+        target = self.path_for(run_id)
+        if not target.exists():
+            return None
+        return json.loads(target.read_text(encoding="utf-8"))
+
+    def run_ids(self) -> List[str]:
+        return sorted(path.stem for path in self.root.glob("*.json"))
+
+
+class PoolStore:
+    """Forecaster × question probability matrix behind the brier_pool workflow."""
+
+    def __init__(self, path: Path | str = Path("data/forecast_pool.json")) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @profiled("storage.pool.save")
+    def save(self, payload: dict) -> None:
+        self.path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+    @profiled("storage.pool.load")
+    def load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text(encoding="utf-8"))
 
 
-__all__ = ["EvidenceStore", "PanelStore", "ForecastStore", "ACHStore"]
+__all__ = [
+    "FileChecksum",
+    "EvidenceStore",
+    "PanelStore",
+    "PanelHistoryStore",
+    "ForecastStore",
+    "ACHStore",
+    "ACHLogStore",
+    "AlertStore",
+    "BriefStore",
+    "LatencyStore",
+    "RunStore",
+    "PoolStore",
+]
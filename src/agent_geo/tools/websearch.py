@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable, List, Optional
 
+from agent_geo import profiling
 from agent_geo.models.evidence import EvidenceRecord
 
 try:  # pragma: no cover - optional dependency import guard
@@ -24,6 +25,7 @@ class WebSearchResult:
 
 
 class WebSearchTool:
+    @profiling.profiled("websearch.init")
     def __init__(
         self,
         *,
@@ -36,13 +38,19 @@ class WebSearchTool:
         self.max_results = max_results
         self._client = DDGS()
 
+    @profiling.profiled("websearch.search")
     def search(self, query: str) -> List[WebSearchResult]:
-        raw_results = self._client.text(
-            query,
-            region=self.region,
-            safesearch=self.safesearch,
-            max_results=self.max_results,
-        )
+        with profiling.span("websearch.ddgs.text"):
+            raw_results = list(
+                self._client.text(
+                    query,
+                    region=self.region,
+                    safesearch=self.safesearch,
+                    max_results=self.max_results,
+                )
+                or []
+            )
+        profiling.count("websearch.results", len(raw_results))
         results: List[WebSearchResult] = []
         for item in raw_results:
             published = None
@@ -78,6 +86,7 @@ class WebSearchTool:
             quality=quality,
         )
 
+    @profiling.profiled("websearch.search_as_evidence")
     def search_as_evidence(self, query: str, *, quality: str = "M") -> List[EvidenceRecord]:
         return [self.to_evidence(result, quality=quality) for result in self.search(query) if result.url]
 
@@ -0,0 +1,134 @@
+"""Canonical URLs, so one article reached through different links has one identity.
+
+``canonical_url`` lower-cases the scheme and host, drops default ports, ``www.``,
+mobile and AMP host prefixes, fragments and tracking query parameters, unwraps Google
+AMP cache / viewer links and strips AMP path and query markers, and sorts what is left
+of the query string. It is a normalisation for identity (hashing, deduplication), not a
+URL to display: the stored ``EvidenceRecord.url`` keeps the link as collected.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "gbraid",
+        "wbraid",
+        "msclkid",
+        "yclid",
+        "twclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "mkt_tok",
+        "cmpid",
+        "ncid",
+        "ocid",
+        "spm",
+        "ref_src",
+        "ref_url",
+        "smid",
+        "amp",
+        "amp_js_v",
+        "usqp",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "at_")
+# Leading host labels that serve the same article on another rendering.
+_VARIANT_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.", "sp.")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_PATH_SAFE = "/:@!$&'()*+,;=-._~%"
+_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+_AMP_CACHE = re.compile(r"^[a-z0-9-]+\.cdn\.ampproject\.org$")
+_AMP_PATH = re.compile(r"^/amp(?=/.)|(?:/amp|\.amp)(?=(?:\.html?)?/?$)")
+
+
+def _normalise_escape(match: re.Match) -> str:
+    """Decode escaped unreserved characters; upper-case every other escape."""
+
+    char = chr(int(match.group(1), 16))
+    return char if char in _UNRESERVED else match.group(0).upper()
+
+
+def _tracking(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+def _unwrap_amp(host: str, path: str) -> str | None:
+    """Origin URL behind a Google AMP cache or viewer link, if ``host``/``path`` is one."""
+
+    if _AMP_CACHE.match(host):
+        # /c/s/example.org/path (https) or /c/example.org/path (http); /v/ and /i/ too.
+        parts = path.lstrip("/").split("/")
+        if len(parts) >= 2 and parts[0] in {"c", "v", "i"}:
+            secure = parts[1] == "s"
+            rest = parts[2:] if secure else parts[1:]
+            if rest:
+                return f"{'https' if secure else 'http'}://{'/'.join(rest)}"
+    if host in {"google.com", "www.google.com"} and path.startswith("/amp/"):
+        rest = path[len("/amp/") :]
+        if rest.startswith("s/"):
+            return f"https://{rest[2:]}"
+        return f"http://{rest}"
+    return None
+
+
+@lru_cache(maxsize=65_536)
+def canonical_url(url: str) -> str:
+    """Identity-normalised form of ``url``; unparsable input comes back stripped."""
+
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if not scheme or not host:
+        return url
+    origin = _unwrap_amp(host, parts.path)
+    if origin is not None and origin != url:
+        return canonical_url(origin + (f"?{parts.query}" if parts.query else ""))
+
+    for prefix in _VARIANT_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") >= 2:
+            host = host[len(prefix) :]
+            break
+    if scheme == "http":
+        scheme = "https"  # same article either way; identity should not depend on it
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal; ``hostname`` strips the brackets
+    netloc = host if port in (None, _DEFAULT_PORTS.get(parts.scheme.lower())) else f"{host}:{port}"
+
+    path = parts.path if parts.path.isascii() and " " not in parts.path else quote(parts.path, safe=_PATH_SAFE)
+    if "%" in path:
+        path = _ESCAPE.sub(_normalise_escape, path)
+    path = _AMP_PATH.sub("", path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = parts.query and urlencode(
+        sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if not _tracking(key))
+    )
+    return urlunsplit((scheme, netloc, path or "/", query, ""))
+
+
+def host_of(url: str) -> str:
+    """Bare canonical host of ``url`` (``""`` when it has none)."""
+
+    return urlsplit(canonical_url(url)).hostname or ""
+
+
+__all__ = ["canonical_url", "host_of", "TRACKING_PARAMS", "TRACKING_PREFIXES"]